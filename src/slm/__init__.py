@@ -1,13 +1,32 @@
-"""slm — IEC 61672-1 Sound Level Meter library."""
-from slm.engine import Engine
-from slm.assembly import MetricSpec, parse_metric, build_chain
-from slm.app.cli import calibrate_from_file, calibrate_from_device
-
-__all__ = [
-    "Engine",
-    "MetricSpec",
-    "parse_metric",
-    "build_chain",
-    "calibrate_from_file",
-    "calibrate_from_device",
-]
\ No newline at end of file
+"""slm — IEC 61672-1 Sound Level Meter library.
+
+Public names are resolved lazily on first access, so entry points such as
+``python -m slm --help`` do not pay for scipy, numba or pyoctaveband.
+"""
+from importlib import import_module
+
+_LAZY = {
+    "Engine": "slm.engine",
+    "MetricSpec": "slm.assembly",
+    "parse_metric": "slm.assembly",
+    "build_chain": "slm.assembly",
+    "MeterSnapshots": "slm.snapshot",
+    "calibrate_from_file": "slm.app.cli",
+    "calibrate_from_device": "slm.app.cli",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -18,6 +18,14 @@ One-shot measurement::
 
     python -m slm --file PATH --measure METRIC [METRIC ...] [--fs-db DB] [...]
     python -m slm --file PATH --config FILE.toml [--fs-db DB] [...]
+
+Raw PCM from stdin, a FIFO or a socket (headless pipeline stage)::
+
+    arecord -f S16_LE -r 48000 -t raw | python -m slm --stream - --measure LAeq [...]
+
+Exact Leq / LE of an interval of a finished (or running) measurement::
+
+    python -m slm query OUTPUT METRIC FROM TO [--clock]
 """
 from __future__ import annotations
 
@@ -33,18 +41,35 @@ def _build_parser() -> argparse.ArgumentParser:
 
     # Input source: --file and --device are mutually exclusive
     source_group = parser.add_mutually_exclusive_group()
-    source_group.add_argument("--file", metavar="PATH", help="Input WAV file")
+    source_group.add_argument(
+        "--file", metavar="PATH",
+        help="Input WAV file, or a quoted glob of segment files measured as one recording",
+    )
     source_group.add_argument(
         "--device", metavar="INDEX_OR_NAME",
         help="Real-time audio input device index or name substring (use --list-devices to see options)",
     )
+    source_group.add_argument(
+        "--stream", metavar="SOURCE",
+        help="Raw interleaved PCM input: '-' (stdin), a FIFO path, unix://PATH, tcp://HOST:PORT, "
+             "or tcp-listen://HOST:PORT",
+    )
+    parser.add_argument(
+        "--format", default="S16_LE", metavar="FMT",
+        help="Sample format of --stream input: U8, S16_LE, S24_3LE, S32_LE, FLOAT_LE, FLOAT64_LE "
+             "(default: S16_LE)",
+    )
+    parser.add_argument(
+        "--channels", type=int, default=1, metavar="N",
+        help="Channel count of --stream input (default: 1)",
+    )
     parser.add_argument(
         "--list-devices", action="store_true",
         help="List available audio input devices and exit",
     )
     parser.add_argument(
         "--samplerate", type=int, default=48_000, metavar="HZ",
-        help="Sample rate for real-time input (default: 48000)",
+        help="Sample rate for real-time or --stream input (default: 48000)",
     )
     parser.add_argument(
         "--interactive", "-i", action="store_true",
@@ -78,7 +103,60 @@ def _build_parser() -> argparse.ArgumentParser:
         "--dt", type=float, default=None, metavar="SECONDS",
         help="Logging interval in seconds (default: 1.0)",
     )
+    parser.add_argument(
+        "--correction", default=None, metavar="FILE",
+        help="Microphone/windscreen correction table (two columns: frequency Hz, gain dB)",
+    )
+    parser.add_argument(
+        "--rotate", choices=["hour", "day"], default=None,
+        help="Start new log files every hour or day (logs are written while measuring)",
+    )
+    parser.add_argument(
+        "--rollup", nargs="+", default=None, metavar="RES",
+        help="Also aggregate the _dt metrics to these resolutions, e.g. 15m 1h 1d "
+             "(written to OUTPUT_<RES>_log.csv etc.)",
+    )
+    parser.add_argument(
+        "--event", nargs="+", default=None, metavar="METRIC>LIMIT",
+        help="Detect events while any METRIC exceeds its LIMIT, e.g. 'LAF>85' 'LAeq_1m>70' "
+             "(written to OUTPUT_events.csv with an audio snippet each)",
+    )
+    parser.add_argument(
+        "--event-pre", type=float, default=None, metavar="SECONDS",
+        help="Audio kept from before each event trigger (default: 5)",
+    )
+    parser.add_argument(
+        "--event-hold", type=float, default=None, metavar="SECONDS",
+        help="Seconds below every limit before an event ends (default: 2)",
+    )
 
+    parser.add_argument(
+        "--binary-log", choices=["float32", "int16"], default=None,
+        help="--file only: also write the log to OUTPUT_log.slmb, as float32 or int16 "
+             "(0.01 dB steps)",
+    )
+    parser.add_argument(
+        "--capture", default=None, metavar="PATH",
+        help="Live input only: also record the raw audio to this .wav/.flac file",
+    )
+    parser.add_argument(
+        "--capture-rotate", type=float, default=None, metavar="SECONDS",
+        help="Start a new capture file every SECONDS of audio",
+    )
+    parser.add_argument(
+        "--capture-max-mb", type=float, default=None, metavar="MB",
+        help="Start a new capture file once the current one reaches MB megabytes",
+    )
+    parser.add_argument(
+        "--serve", nargs="?", const="127.0.0.1:8765", default=None, metavar="ADDRESS",
+        help="Serve the live levels as JSON and Prometheus metrics at HOST:PORT or unix:PATH "
+             "(default: 127.0.0.1:8765)",
+    )
+    parser.add_argument(
+        "--no-decimate", action="store_true",
+        help="Process at the input samplerate instead of decimating high-rate input "
+             "to the lowest rate the metrics allow",
+    )
     parser.add_argument(
         "--realtime", "-r", action="store_true",
         help="Simulate real-time playback: pace processing so each dt interval takes dt real seconds",
@@ -121,7 +199,44 @@ def _require_sounddevice(parser: argparse.ArgumentParser) -> None:
         parser.error(str(exc))
 
 
+def _build_query_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="slm query",
+        description="Exact Leq and LE of an interval of a measurement, from its energy index.",
+    )
+    parser.add_argument(
+        "output", metavar="OUTPUT",
+        help="Output base path of the measurement (reads OUTPUT_energy.slmi), or a .slmi file",
+    )
+    parser.add_argument("metric", metavar="METRIC", help="Indexed Leq or LE metric, e.g. LAeq")
+    parser.add_argument(
+        "start", metavar="FROM",
+        help="Start as an offset HH:MM[:SS] (or seconds) from the measurement start, "
+             "or an ISO date and time",
+    )
+    parser.add_argument("end", metavar="TO", help="End, in the same formats as FROM")
+    parser.add_argument(
+        "--clock", action="store_true",
+        help="Read HH:MM[:SS] as wall-clock times of day instead of offsets",
+    )
+    return parser
+
+
+def _query_main(argv: list[str]) -> None:
+    parser = _build_query_parser()
+    args = parser.parse_args(argv)
+    from slm.app.cli import query_energy
+    try:
+        print(query_energy(args.output, args.metric, args.start, args.end, clock=args.clock))
+    except (OSError, ValueError) as exc:
+        parser.error(str(exc))
+
+
 def main() -> None:
+    if sys.argv[1:2] == ["query"]:
+        _query_main(sys.argv[2:])
+        return
+
     parser = _build_parser()
     args = parser.parse_args()
 
@@ -145,8 +260,10 @@ def main() -> None:
     # --realtime requires --file
     if args.realtime and not args.file:
         parser.error("--realtime requires --file")
+    if args.stream and (args.interactive or args.calibrate):
+        parser.error("--stream is only supported for one-shot measurement")
 
-    no_action = (not args.file and args.device is None
+    no_action = (not args.file and args.device is None and not args.stream
                  and not args.calibrate and not args.measure and not args.config)
     if no_action:
         # Bare invocation — open an empty shell
@@ -167,11 +284,29 @@ def main() -> None:
                 config.output = args.output
             if args.dt is not None:
                 config.dt = args.dt
+            if args.correction is not None:
+                config.correction = args.correction
+            if args.rotate is not None:
+                config.rotate = args.rotate
+            if args.rollup is not None:
+                config.rollups = list(args.rollup)
+            if args.event is not None:
+                config.events = list(args.event)
+            if args.event_pre is not None:
+                config.event_pre = args.event_pre
+            if args.event_hold is not None:
+                config.event_hold = args.event_hold
         else:
             config = SLMConfig.from_args(
                 metrics=list(args.measure) if args.measure else [],
                 dt=args.dt if args.dt is not None else 1.0,
                 output=args.output if args.output is not None else "output/measurement",
+                correction=args.correction,
+                rotate=args.rotate,
+                rollups=args.rollup,
+                events=args.event,
+                event_pre=args.event_pre if args.event_pre is not None else 5.0,
+                event_hold=args.event_hold if args.event_hold is not None else 2.0,
             )
 
         # Parse device: try int, fall back to string
@@ -228,6 +363,18 @@ def main() -> None:
             config.output = args.output
         if args.dt is not None:
             config.dt = args.dt
+        if args.correction is not None:
+            config.correction = args.correction
+        if args.rotate is not None:
+            config.rotate = args.rotate
+        if args.rollup is not None:
+            config.rollups = list(args.rollup)
+        if args.event is not None:
+            config.events = list(args.event)
+        if args.event_pre is not None:
+            config.event_pre = args.event_pre
+        if args.event_hold is not None:
+            config.event_hold = args.event_hold
     else:
         if not args.measure:
             parser.error(
@@ -238,10 +385,22 @@ def main() -> None:
             metrics=list(args.measure),
             dt=args.dt if args.dt is not None else 1.0,
             output=args.output if args.output is not None else "output/measurement",
+            correction=args.correction,
+            rotate=args.rotate,
+            rollups=args.rollup,
+            events=args.event,
+            event_pre=args.event_pre if args.event_pre is not None else 5.0,
+            event_hold=args.event_hold if args.event_hold is not None else 2.0,
         )
 
-    if not args.file and args.device is None:
-        parser.error("--file or --device is required for one-shot measurement")
+    if not args.file and args.device is None and not args.stream:
+        parser.error("--file, --device or --stream is required for one-shot measurement")
+    if args.binary_log and not args.file:
+        parser.error("--binary-log is only available for --file measurements")
+    if args.binary_log and config.rotate:
+        parser.error("--binary-log cannot be combined with log rotation")
+    if args.capture and (args.file or args.stream):
+        parser.error("--capture records live input and cannot be combined with --file or --stream")
 
     sens = _resolve_sensitivity(args)
     if sens is None:
@@ -251,7 +410,19 @@ def main() -> None:
         )
 
     if args.file:
-        run_measurement(args.file, sens, config, print_to_console=True, realtime=args.realtime)
+        run_measurement(args.file, sens, config, print_to_console=True, realtime=args.realtime,
+                        decimate=not args.no_decimate, binary_log=args.binary_log, serve=args.serve)
+    elif args.stream:
+        from slm.app.cli import run_stream_measurement
+        run_stream_measurement(
+            args.stream, sens, config,
+            samplerate=args.samplerate,
+            channels=args.channels,
+            sample_format=args.format,
+            print_to_console=True,
+            decimate=not args.no_decimate,
+            serve=args.serve,
+        )
     else:
         from slm.app.cli import run_realtime_measurement
         run_realtime_measurement(
@@ -259,6 +430,12 @@ def main() -> None:
             device=args.device,
             samplerate=args.samplerate,
             print_to_console=True,
+            decimate=not args.no_decimate,
+            capture=args.capture,
+            capture_rotate_seconds=args.capture_rotate,
+            capture_max_bytes=(round(args.capture_max_mb * 1e6)
+                               if args.capture_max_mb is not None else None),
+            serve=args.serve,
         )
 
 
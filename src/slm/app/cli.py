@@ -62,6 +62,162 @@ def _fmt_sensitivity(sens_v: float) -> str:
     return f"{mv:.4g} mV  |  {dbv:.2f} dBV"
 
 
+def _correction_taps(config: "SLMConfig", samplerate: int):
+    """Design the FIR for *config.correction* at *samplerate*, or return None."""
+    if not config.correction:
+        return None
+    from slm.correction import load_response, design_correction_fir
+    freqs, gains_db = load_response(config.correction)
+    return design_correction_fir(freqs, gains_db, samplerate)
+
+
+def _file_controller(wav_path: str | Path, blocksize: int, realtime: bool, prefetch: float):
+    """Open *wav_path* memory-mapped if it is uncompressed WAV/RF64/W64, else decode it.
+
+    Real-time playback needs :class:`~slm.io.file_controller.FileController`'s pacing.
+    """
+    if not realtime:
+        from slm.io.wav_memmap_controller import WavMemmapController
+        try:
+            return WavMemmapController(wav_path, blocksize=blocksize)
+        except ValueError:
+            pass
+    from slm.io.file_controller import FileController
+    return FileController(str(wav_path), blocksize=blocksize, realtime=realtime,
+                          prefetch=prefetch)
+
+
+def _assemble(specs: list, engine, config: "SLMConfig", decimate: bool) -> None:
+    """Choose the engine's working rate, then build the chain for *specs* at that rate.
+
+    With *decimate*, the input is decimated by the largest factor that keeps
+    every metric's band (:func:`~slm.assembly.required_bandwidth`) alias-free
+    and its weighting curve unchanged (:func:`~slm.assembly.weighting_bandwidths`);
+    the chosen working rate is printed when it differs from the input rate.
+    """
+    from slm.assembly import build_chain, required_bandwidth, weighting_bandwidths
+    from slm.decimation import choose_decimation
+
+    if decimate:
+        bandwidth = required_bandwidth(specs)
+        factor = choose_decimation(engine.input_samplerate, engine.blocksize, bandwidth,
+                                   weighting_bandwidths(specs))
+        if factor > 1:
+            engine.set_decimation(factor, bandwidth)
+            print(f"Working rate: {engine.samplerate} Hz "
+                  f"({engine.input_samplerate} Hz input decimated by {factor})")
+    build_chain(specs, engine, correction=_correction_taps(config, engine.samplerate))
+
+
+def _add_rollups(reporter, config: "SLMConfig", start=None, retain_rows: int | None = None) -> list:
+    """Add a :class:`~slm.io.rollup.Rollup` to *reporter* for each of *config.rollups*."""
+    from slm.io.rollup import parse_resolution
+
+    return [reporter.add_rollup(parse_resolution(r), start=start, retain_rows=retain_rows)
+            for r in config.rollups or []]
+
+
+def _energy_index(reporter, config: "SLMConfig", start=None) -> list:
+    """Index the Leq/LE columns to ``<output>_energy.slmi``; returns the writer, if any, in a list."""
+    if not reporter.energy_labels:
+        return []
+    return [reporter.add_energy_index(config.output, start=start)]
+
+
+def _stream_log(reporter, config: "SLMConfig") -> list:
+    """Append the log to *config.output* while measuring, rotated per *config.rotate*.
+
+    Each of *config.rollups* streams to ``<output>_<resolution>_log.csv`` etc.,
+    with periods aligned to the wall clock, and the energy index is written
+    alongside.  Returns the writers; pass them to :func:`_finish_logs`.
+    """
+    from datetime import datetime
+    from slm.io.log_writer import LogWriter
+
+    start = datetime.now()
+    logs = [LogWriter(config.output, rotate=config.rotate, start=start)]
+    reporter.add_sink(logs[0])
+    for rollup in _add_rollups(reporter, config, start=start, retain_rows=1):
+        logs.append(LogWriter(f"{config.output}_{rollup.name}", start=start))
+        rollup.add_sink(logs[-1])
+    return logs + _energy_index(reporter, config, start=start)
+
+
+def _event_exposure(names: list[str], trigger: str) -> str:
+    """The Leq/LE metric among *names* for the SEL of *trigger* events, or the LE metric to add.
+
+    It must be broadband and cumulative, on *trigger*'s weighting and channel.
+    """
+    from slm.assembly import parse_metric
+
+    want = parse_metric(trigger)
+    for name in names:
+        spec = parse_metric(name)
+        if (spec.measure in ("eq", "E") and spec.bands is None and not spec.window_is_dt
+                and spec.window_seconds is None
+                and (spec.weighting, spec.channel) == (want.weighting, want.channel)):
+            return name
+    prefix = f"ch{want.channel}/" if want.channel else ""
+    return f"{prefix}L{want.weighting}E"
+
+
+def _metric_names(config: "SLMConfig") -> list[str]:
+    """Metrics to build: *config*'s, plus the trigger metrics and the SEL exposure of each trigger."""
+    names = config.resolved_metrics()
+    if config.events:
+        from slm.io.events import parse_trigger
+
+        triggers = [parse_trigger(t)[0] for t in config.events]
+        names += [t for t in dict.fromkeys(triggers) if t not in names]
+        for trigger in triggers:
+            exposure = _event_exposure(names, trigger)
+            if exposure not in names:
+                names.append(exposure)
+    return names
+
+
+def _event_detector(engine, config: "SLMConfig", start=None) -> list:
+    """Attach an :class:`~slm.io.events.EventDetector` for *config.events*; returns it, if any, in a list."""
+    if not config.events:
+        return []
+    from slm.io.events import EventDetector, parse_trigger
+
+    triggers = [parse_trigger(t) for t in config.events]
+    labels = engine.reporter.energy_labels
+    exposure = {label: _event_exposure(labels, label) for label, _ in triggers}
+    return [EventDetector(engine, triggers, config.output, pre_seconds=config.event_pre,
+                          hold_seconds=config.event_hold, exposure=exposure, start=start)]
+
+
+def _live_server(engine, serve: str | None) -> list:
+    """Serve the live levels at address *serve*; returns the :class:`~slm.io.live_server.LiveServer`, if any, in a list."""
+    if serve is None:
+        return []
+    from slm.io.live_server import LiveServer
+
+    server = LiveServer(engine, serve)
+    engine.reporter.add_sink(server)
+    print(f"Serving live levels at {server.url} (/levels, /metrics, /health, /stream)")
+    return [server]
+
+
+def _finish_logs(reporter, logs: list) -> None:
+    """Emit the rollups' final periods, then close every log file, event detector, server and display.
+
+    Everything is closed even if an earlier step fails; the first error is
+    re-raised at the end.
+    """
+    error = None
+    for close in [reporter.finish, *(log.close for log in logs)]:
+        try:
+            close()
+        except Exception as exc:
+            if error is None:
+                error = exc
+    if error is not None:
+        raise error
+
+
 # ---------------------------------------------------------------------------
 # Calibration
 # ---------------------------------------------------------------------------
@@ -135,40 +291,89 @@ def calibrate_from_device(
 # ---------------------------------------------------------------------------
 
 def run_measurement(
-    wav_path: str | Path,
+    wav_path: str | Path | list[str | Path],
     sensitivity_v: float,
     config: "SLMConfig",
     print_to_console: bool = False,
     blocksize: int = 1024,
     display_mode: str = "plain",
     realtime: bool = False,
+    prefetch: float = 2.0,
+    decimate: bool = True,
+    binary_log: str | None = None,
+    serve: str | None = None,
 ) -> None:
-    """Parse *config.metrics*, build the plugin chain, run the engine, write results."""
+    """Parse *config.metrics*, build the plugin chain, run the engine, write results.
+
+    Uncompressed WAV/RF64/W64 files are memory-mapped (see
+    :class:`~slm.io.wav_memmap_controller.WavMemmapController`); other formats
+    are decoded *prefetch* seconds at a time on a background thread (``0``
+    reads synchronously on the engine thread).  A list of files or a
+    glob pattern is measured as one continuous segmented recording.  With
+    *config.rotate*, the log is written while measuring, in rotated files.
+    Each of *config.rollups* is written to ``<output>_<resolution>_log.csv``
+    etc. as well, and Leq/LE metrics are indexed to ``<output>_energy.slmi``
+    for :func:`query_energy`.
+
+    *binary_log* (``'float32'`` or ``'int16'``) also writes the whole log to
+    ``<output>_log.slmb`` (see :mod:`slm.io.binary_log`); it needs the full
+    log in memory, so it cannot be combined with *config.rotate*.
+
+    With *decimate*, high-rate input is decimated to the lowest working rate
+    the metrics allow (see :func:`_assemble`); this applies to all runners.
+    With *serve* (``'HOST:PORT'`` or ``'unix:PATH'``), all runners also serve
+    the live levels over HTTP (see :mod:`slm.io.live_server`).
+    """
     if sensitivity_v <= 0:
         raise ValueError(f"sensitivity_v must be positive, got {sensitivity_v}")
-    from slm.assembly import parse_metric, build_chain
-    from slm.io.file_controller import FileController
+    if binary_log is not None and config.rotate is not None:
+        raise ValueError("A binary log cannot be combined with log rotation")
+    from slm.assembly import parse_metric
+    from slm.io.segmented_controller import SegmentedFileController, is_segment_pattern
     from slm.engine import Engine
     from slm.io.reporter import Reporter
     from slm.io.display import make_display_fn
 
-    specs = [parse_metric(m) for m in config.metrics]
+    specs = [parse_metric(m) for m in _metric_names(config)]
 
-    controller = FileController(str(wav_path), blocksize=blocksize, realtime=realtime)
+    if isinstance(wav_path, (list, tuple)) or is_segment_pattern(wav_path):
+        if realtime:
+            raise ValueError("Real-time playback is not supported for segmented recordings")
+        controller = SegmentedFileController(wav_path, blocksize=blocksize)
+    else:
+        controller = _file_controller(wav_path, blocksize, realtime, prefetch)
     controller.set_sensitivity(sensitivity_v, unit="V")
 
     display_fn = make_display_fn(display_mode, precision=2) if print_to_console else None
-    reporter = Reporter(precision=2, print_to_console=print_to_console, display_fn=display_fn)
+    streaming = config.rotate is not None
+    reporter = Reporter(precision=2, print_to_console=print_to_console, display_fn=display_fn,
+                        retain_rows=1 if streaming else None)
     engine = Engine(controller, dt=config.dt, reporter=reporter)
 
-    build_chain(specs, engine)
+    _assemble(specs, engine, config, decimate)
+    if streaming:
+        logs = _stream_log(reporter, config)
+    else:
+        _add_rollups(reporter, config)
+        logs = _energy_index(reporter, config)
+    logs += _event_detector(engine, config)
+    logs += _live_server(engine, serve)
+    if display_fn is not None:
+        logs.append(display_fn)
 
     try:
         engine.run()
     except KeyboardInterrupt:
         print("Measurement interrupted.")
     finally:
-        reporter.write(config.output)
+        controller.stop()
+        try:
+            _finish_logs(reporter, logs)
+        finally:
+            if not streaming:
+                reporter.write(config.output)
+                if binary_log is not None:
+                    reporter.write_binary(config.output, dtype=binary_log)
 
 
 # ---------------------------------------------------------------------------
@@ -183,43 +388,220 @@ def run_realtime_measurement(
     blocksize: int = 1_024,
     print_to_console: bool = False,
     display_mode: str = "plain",
+    decimate: bool = True,
+    capture: str | None = None,
+    capture_rotate_seconds: float | None = None,
+    capture_max_bytes: int | None = None,
+    serve: str | None = None,
 ) -> None:
     """Start a live measurement from a real-time audio input device.
 
     The engine runs until ``KeyboardInterrupt`` (Ctrl+C), at which point the
-    stream is stopped and results are written to *config.output*.
+    stream is stopped.  The log is written to *config.output* while measuring
+    (see :class:`~slm.io.log_writer.LogWriter`), so memory stays flat.  Channel-
+    qualified metrics (``ch2/LAeq``) all read from the one input stream.
+
+    With *capture*, the raw input is also recorded to that WAV/FLAC file by a
+    background writer (see :class:`~slm.io.capture.CaptureWriter`), rotated
+    every *capture_rotate_seconds* and/or *capture_max_bytes*.
     """
     if sensitivity_v <= 0:
         raise ValueError(f"sensitivity_v must be positive, got {sensitivity_v}")
-    from slm.assembly import parse_metric, build_chain
+    from datetime import datetime
+    from slm.assembly import parse_metric
     from slm.io.sounddevice_controller import SounddeviceController
     from slm.engine import Engine
     from slm.io.reporter import Reporter
     from slm.io.display import make_display_fn
 
-    specs = [parse_metric(m) for m in config.metrics]
+    specs = [parse_metric(m) for m in _metric_names(config)]
 
-    controller = SounddeviceController(
-        device=device, samplerate=samplerate, blocksize=blocksize
-    )
+    # Open as many channels as the highest chN/ metric needs, so one stream feeds them all
+    channels = max((spec.channel_index + 1 for spec in specs), default=1)
+
+    display_fn = make_display_fn(display_mode, precision=2) if print_to_console else None
+    reporter = Reporter(precision=2, print_to_console=print_to_console, display_fn=display_fn,
+                        retain_rows=1)
+    writer = controller = None
+    logs: list = []
+    try:
+        if capture:
+            from slm.io.capture import CaptureWriter
+            writer = CaptureWriter(capture, samplerate=samplerate, channels=channels,
+                                   rotate_seconds=capture_rotate_seconds,
+                                   rotate_bytes=capture_max_bytes)
+        controller = SounddeviceController(
+            device=device, samplerate=samplerate, blocksize=blocksize, channels=channels,
+            capture=writer,
+        )
+        controller.set_sensitivity(sensitivity_v, unit="V")
+        engine = Engine(controller, dt=config.dt, reporter=reporter)
+
+        _assemble(specs, engine, config, decimate)
+        logs += _stream_log(reporter, config)
+        logs += _event_detector(engine, config, start=datetime.now())
+        logs += _live_server(engine, serve)
+
+        # Start the stream only once everything that reads it is in place
+        controller.start()
+        engine.run()
+    except KeyboardInterrupt:
+        print("\nMeasurement interrupted.")
+    finally:
+        if controller is not None:
+            controller.stop()
+            if controller.overruns:
+                print(f"Warning: {controller.overruns} block(s) dropped (engine too slow).")
+        if writer is not None:
+            _close_capture(writer, samplerate)
+        if display_fn is not None:
+            logs.append(display_fn)
+        _finish_logs(reporter, logs)
+
+
+def _close_capture(writer, samplerate: int) -> None:
+    """Close the capture *writer* and report on it; a capture error (e.g. a full disk) is only reported."""
+    try:
+        writer.close()
+    except Exception as exc:
+        print(f"Error: audio capture stopped early: {exc}")
+    print(f"Captured {writer.written_frames / samplerate:.1f} s to "
+          f"{len(writer.files)} file(s), starting with {writer.files[0] if writer.files else '-'}")
+    if writer.dropped_frames:
+        print(f"Warning: {writer.dropped_frames} sample(s) missing from the capture "
+              f"(disk too slow), written as silence.")
+
+
+# ---------------------------------------------------------------------------
+# Raw PCM stream measurement
+# ---------------------------------------------------------------------------
+
+def run_stream_measurement(
+    source,
+    sensitivity_v: float,
+    config: "SLMConfig",
+    samplerate: int = 48_000,
+    channels: int = 1,
+    sample_format: str = "S16_LE",
+    blocksize: int = 1_024,
+    print_to_console: bool = False,
+    display_mode: str = "plain",
+    decimate: bool = True,
+    serve: str | None = None,
+) -> None:
+    """Measure raw PCM read from stdin, a FIFO or a socket until the stream ends.
+
+    See :class:`~slm.io.stream_controller.StreamController` for *source* syntax.
+    As for live input, the log is written to *config.output* while measuring.
+    """
+    if sensitivity_v <= 0:
+        raise ValueError(f"sensitivity_v must be positive, got {sensitivity_v}")
+    from datetime import datetime
+    from slm.assembly import parse_metric
+    from slm.io.stream_controller import StreamController
+    from slm.engine import Engine
+    from slm.io.reporter import Reporter
+    from slm.io.display import make_display_fn
+
+    specs = [parse_metric(m) for m in _metric_names(config)]
+
+    controller = StreamController(source, samplerate=samplerate, channels=channels,
+                                  sample_format=sample_format, blocksize=blocksize)
     controller.set_sensitivity(sensitivity_v, unit="V")
-    controller.start()
 
     display_fn = make_display_fn(display_mode, precision=2) if print_to_console else None
-    reporter = Reporter(precision=2, print_to_console=print_to_console, display_fn=display_fn)
+    reporter = Reporter(precision=2, print_to_console=print_to_console, display_fn=display_fn,
+                        retain_rows=1)
     engine = Engine(controller, dt=config.dt, reporter=reporter)
 
-    build_chain(specs, engine)
+    _assemble(specs, engine, config, decimate)
+    logs = _stream_log(reporter, config)
+    logs += _event_detector(engine, config, start=datetime.now())
+    logs += _live_server(engine, serve)
+    if display_fn is not None:
+        logs.append(display_fn)
 
     try:
         engine.run()
     except KeyboardInterrupt:
         print("\nMeasurement interrupted.")
-        controller.stop()
     finally:
-        if controller.overruns:
-            print(f"Warning: {controller.overruns} block(s) dropped (engine too slow).")
-        reporter.write(config.output)
+        controller.stop()
+        _finish_logs(reporter, logs)
+
+
+# ---------------------------------------------------------------------------
+# Interval queries
+# ---------------------------------------------------------------------------
+
+def _query_seconds(text: str, start, clock: bool, not_before: float) -> float:
+    """Seconds from the measurement *start* for a query time *text*.
+
+    ``HH:MM[:SS[.fff]]`` (or plain seconds) is an offset from the start, as
+    in the log's timestamp column.  With *clock* it is a time of day instead,
+    the first at or after *not_before*; an ISO date and time
+    (``2026-10-19T14:03``) is always wall-clock.
+    """
+    from datetime import datetime, timedelta
+
+    is_iso = "T" in text or "-" in text[1:]
+    if (clock or is_iso) and start is None:
+        raise ValueError("The energy index has no start time; give times as offsets (HH:MM:SS)")
+    if is_iso:
+        return (datetime.fromisoformat(text) - start).total_seconds()
+    parts = text.split(":")
+    try:
+        if len(parts) > 3:
+            raise ValueError
+        seconds = float(parts[-1]) if len(parts) == 1 else (
+            float(parts[0]) * 3600 + float(parts[1]) * 60 + (float(parts[2]) if len(parts) == 3 else 0.0))
+    except ValueError:
+        raise ValueError(f"Invalid time {text!r}. Expected HH:MM[:SS], seconds or an ISO date and time.") from None
+    if not clock:
+        return seconds
+    midnight = start.replace(hour=0, minute=0, second=0, microsecond=0)
+    offset = (midnight + timedelta(seconds=seconds) - start.replace(microsecond=0)).total_seconds()
+    while offset < not_before:
+        offset += 86400.0
+    return offset
+
+
+def query_energy(path: str | Path, metric: str, start: str, end: str, clock: bool = False) -> str:
+    """Exact Leq and LE of *metric* between *start* and *end*, as printable text.
+
+    *path* is the measurement's output base path (its ``_energy.slmi`` index
+    is read) or the index file itself.  See :func:`_query_seconds` for the
+    time formats; both are snapped to the nearest logged row.
+    """
+    from datetime import timedelta
+    from slm.io.energy_index import EnergyIndex
+    from slm.io.reporter import _fmt_timestamp
+
+    path = Path(path)
+    if path.suffix != ".slmi":
+        path = path.parent / f"{path.name}_energy.slmi"
+    index = EnergyIndex(path)
+    if metric not in index.labels:
+        raise ValueError(f"{metric!r} is not in the energy index. Indexed: {', '.join(index.labels)}")
+
+    t0 = _query_seconds(start, index.start, clock, not_before=0.0)
+    t1 = _query_seconds(end, index.start, clock, not_before=t0)
+    first, last = index.interval(t0, t1)
+    leq, le = index.leq(metric, t0, t1), index.le(metric, t0, t1)
+
+    def fmt(seconds: float) -> str:
+        if index.start is None:
+            return _fmt_timestamp(timedelta(seconds=seconds))
+        return (index.start + timedelta(seconds=seconds)).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+
+    lines = [f"{metric}  {fmt(first)} - {fmt(last)}  ({last - first:.3f} s)"]
+    bands = index.bands(metric)
+    if bands is None:
+        lines += [f"  Leq  {leq:.2f} dB", f"  LE   {le:.2f} dB"]
+    else:
+        lines.append(f"  {'band':>8}  {'Leq':>7}  {'LE':>7}")
+        lines += [f"  {band:>8}  {l:7.2f}  {e:7.2f}" for band, l, e in zip(bands, leq, le)]
+    return "\n".join(lines)
 
 
 # ---------------------------------------------------------------------------
@@ -547,14 +929,14 @@ When disabled (default), the file is processed as fast as possible.
 
     def do_tree(self, _: str) -> None:
         """tree — print the planned plugin chain for the current metrics."""
-        from slm.assembly import parse_metric
+        from slm.assembly import bus_name, parse_metric
 
         if not self._config.metrics:
             print("No metrics added.  Use: add METRIC")
             return
 
         specs = []
-        for name in self._config.metrics:
+        for name in self._config.resolved_metrics():
             try:
                 specs.append(parse_metric(name))
             except ValueError as exc:
@@ -578,10 +960,10 @@ When disabled (default), the file is processed as fast as possible.
         _mov_cls = {"eq": "LeqMovingMeter", "max": "MaxMovingMeter", "min": "MinMovingMeter",
                     "E": "LEMovingMeter"}
 
-        # Group by weighting
-        by_weight: dict[str, list] = {}
+        # Group by bus: (channel, weighting)
+        by_weight: dict[tuple, list] = {}
         for spec in specs:
-            by_weight.setdefault(spec.weighting, []).append(spec)
+            by_weight.setdefault((spec.channel, spec.weighting), []).append(spec)
 
         def _print_meter(spec, prefix):
             is_moving = spec.window_is_dt or spec.window_seconds is not None
@@ -597,13 +979,13 @@ When disabled (default), the file is processed as fast as possible.
             print(f"{prefix} {spec.name:<32} {cls_name}{detail}")
 
         weight_keys = list(by_weight.keys())
-        for wi, w in enumerate(weight_keys):
+        for wi, (ch, w) in enumerate(weight_keys):
             is_last_bus = wi == len(weight_keys) - 1
             bus_pfx = "└──" if is_last_bus else "├──"
             child_pfx = "    " if is_last_bus else "│   "
-            print(f"{bus_pfx} Bus [{w}]  {_w_plugin[w]}")
+            print(f"{bus_pfx} Bus [{bus_name(w, ch)}]  {_w_plugin[w]}")
 
-            w_specs = by_weight[w]
+            w_specs = by_weight[(ch, w)]
 
             # Split specs into groups by upstream plugin type
             freq_specs = [s for s in w_specs
@@ -628,7 +1010,7 @@ When disabled (default), the file is processed as fast as possible.
             if sq_specs:
                 groups.append(("PluginSquare", sq_specs))
             for tw_letter, tw_list in tw_groups.items():
-                groups.append((_tw_plugin[tw_letter], tw_list))
+                groups.append((f"{_tw_plugin[tw_letter]}  (on shared PluginSquare)", tw_list))
 
             n_band_keys = len(band_groups)
             n_non_band = len(groups)
@@ -660,7 +1042,7 @@ When disabled (default), the file is processed as fast as possible.
                         # band + time-weighting: extra level
                         tw_pfx = band_pfx + ("└──" if is_last_tw else "├──")
                         met_pfx2 = band_pfx + ("    " if is_last_tw else "│   ")
-                        print(f"{tw_pfx} {_tw_plugin[tw_key]}")
+                        print(f"{tw_pfx} {_tw_plugin[tw_key]}  (on shared PluginSquare)")
                         for si, spec in enumerate(tw_specs):
                             is_last = si == len(tw_specs) - 1
                             m_pfx = met_pfx2 + ("└──" if is_last else "├──")
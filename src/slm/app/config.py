@@ -1,11 +1,19 @@
 """SLM measurement configuration: dataclass + TOML round-trip."""
 from __future__ import annotations
 
+import re
 import tomllib
 from dataclasses import dataclass, field
 from pathlib import Path
 
 
+# Rollup resolution: a number and a unit, e.g. "15m" (see slm.io.rollup.parse_resolution)
+_RESOLUTION = re.compile(r"\d+(\.\d+)?[smhd]")
+
+# Event trigger: a metric and a limit, e.g. "LAF>85" (see slm.io.events.parse_trigger)
+_TRIGGER = re.compile(r"\s*\S+?\s*>\s*-?\d+(\.\d+)?\s*")
+
+
 @dataclass
 class SLMConfig:
     """Measurement configuration."""
@@ -13,6 +21,31 @@ class SLMConfig:
     metrics: list[str] = field(default_factory=list)
     dt: float = 1.0
     output: str = "output/measurement"
+    correction: str | None = None
+    channels: list[int] | None = None
+    """1-based input channels each unprefixed metric is measured on (``None``: first channel only)."""
+    rotate: str | None = None
+    """Start new log files every ``'hour'`` or ``'day'`` (``None``: one set of files)."""
+    rollups: list[str] | None = None
+    """Resolutions the ``_dt`` metrics are also aggregated to, e.g. ``['15m', '1h', '1d']``."""
+    events: list[str] | None = None
+    """Event triggers, e.g. ``['LAF>85', 'LAeq_1m>70']`` (``None``: no event detection)."""
+    event_pre: float = 5.0
+    """Seconds of audio kept from before each event trigger."""
+    event_hold: float = 2.0
+    """Seconds every trigger must stay below its limit before an event ends."""
+
+    def resolved_metrics(self) -> list[str]:
+        """Metric names to build, with unprefixed metrics repeated as ``chN/…`` for each of *channels*."""
+        if not self.channels:
+            return list(self.metrics)
+        resolved: list[str] = []
+        for metric in self.metrics:
+            if metric.startswith("ch") and "/" in metric:
+                resolved.append(metric)
+            else:
+                resolved.extend(f"ch{ch}/{metric}" for ch in self.channels)
+        return resolved
 
     # ------------------------------------------------------------------
     # TOML I/O
@@ -27,12 +60,12 @@ class SLMConfig:
         with open(path, "rb") as f:
             data = tomllib.load(f)
 
-        unknown_sections = set(data.keys()) - {"measurement", "metrics"}
+        unknown_sections = set(data.keys()) - {"measurement", "metrics", "events"}
         if unknown_sections:
             raise ValueError(f"Unknown TOML sections: {unknown_sections}")
 
         meas = data.get("measurement", {})
-        unknown_meas = set(meas.keys()) - {"dt", "output"}
+        unknown_meas = set(meas.keys()) - {"dt", "output", "correction", "channels", "rotate", "rollups"}
         if unknown_meas:
             raise ValueError(f"Unknown keys in [measurement]: {unknown_meas}")
 
@@ -51,10 +84,58 @@ class SLMConfig:
         if dt <= 0:
             raise ValueError(f"[measurement] dt must be positive, got {dt}")
 
+        channels = meas.get("channels")
+        if channels is not None and (
+            not isinstance(channels, list)
+            or not all(isinstance(c, int) and not isinstance(c, bool) and c >= 1 for c in channels)
+        ):
+            raise ValueError(
+                f"[measurement] channels must be a list of channel numbers >= 1, got {channels!r}"
+            )
+
+        rotate = meas.get("rotate")
+        if rotate is not None and rotate not in ("hour", "day"):
+            raise ValueError(f"[measurement] rotate must be 'hour' or 'day', got {rotate!r}")
+
+        rollups = meas.get("rollups")
+        if rollups is not None and (
+            not isinstance(rollups, list)
+            or not all(isinstance(r, str) and _RESOLUTION.fullmatch(r) for r in rollups)
+        ):
+            raise ValueError(
+                f"[measurement] rollups must be a list of resolutions like \"15m\", \"1h\" or \"1d\", "
+                f"got {rollups!r}"
+            )
+
+        events_sec = data.get("events", {})
+        unknown_events = set(events_sec.keys()) - {"triggers", "pre", "hold"}
+        if unknown_events:
+            raise ValueError(f"Unknown keys in [events]: {unknown_events}")
+        triggers = events_sec.get("triggers")
+        if triggers is not None and (
+            not isinstance(triggers, list)
+            or not all(isinstance(t, str) and _TRIGGER.fullmatch(t) for t in triggers)
+        ):
+            raise ValueError(
+                f"[events] triggers must be a list of triggers like \"LAF>85\", got {triggers!r}"
+            )
+        event_pre = float(events_sec.get("pre", 5.0))
+        event_hold = float(events_sec.get("hold", 2.0))
+        if event_pre < 0 or event_hold < 0:
+            raise ValueError("[events] pre and hold must not be negative")
+
+        correction = meas.get("correction")
         return cls(
             metrics=list(require),
             dt=dt,
             output=str(meas.get("output", "output/measurement")),
+            correction=str(correction) if correction is not None else None,
+            channels=list(channels) if channels is not None else None,
+            rotate=rotate,
+            rollups=list(rollups) if rollups is not None else None,
+            events=list(triggers) if triggers is not None else None,
+            event_pre=event_pre,
+            event_hold=event_hold,
         )
 
     def to_toml(self, path: str | Path) -> None:
@@ -68,13 +149,29 @@ class SLMConfig:
         else:
             metrics_value = "[]"
 
+        correction_line = f'correction = "{self.correction}"\n' if self.correction else ""
+        channels_line = f"channels = {list(self.channels)}\n" if self.channels else ""
+        rotate_line = f'rotate = "{self.rotate}"\n' if self.rotate else ""
+        rollups_line = ("rollups = [" + ", ".join(f'"{r}"' for r in self.rollups) + "]\n"
+                        if self.rollups else "")
+        events_section = (
+            "\n[events]\n"
+            "triggers = [" + ", ".join(f'"{t}"' for t in self.events) + "]\n"
+            f"pre      = {self.event_pre}\n"
+            f"hold     = {self.event_hold}\n"
+        ) if self.events else ""
         content = (
             "[measurement]\n"
             f"dt     = {self.dt}\n"
             f'output = "{self.output}"\n'
+            f"{correction_line}"
+            f"{channels_line}"
+            f"{rotate_line}"
+            f"{rollups_line}"
             "\n"
             "[metrics]\n"
             f"require = {metrics_value}\n"
+            f"{events_section}"
         )
         path.write_text(content, encoding="utf-8")
 
@@ -83,6 +180,17 @@ class SLMConfig:
     # ------------------------------------------------------------------
 
     @classmethod
-    def from_args(cls, metrics: list[str], dt: float, output: str) -> "SLMConfig":
+    def from_args(cls, metrics: list[str], dt: float, output: str,
+                  correction: str | None = None,
+                  channels: list[int] | None = None,
+                  rotate: str | None = None,
+                  rollups: list[str] | None = None,
+                  events: list[str] | None = None,
+                  event_pre: float = 5.0,
+                  event_hold: float = 2.0) -> "SLMConfig":
         """Construct from parsed command-line arguments."""
-        return cls(metrics=list(metrics), dt=dt, output=output)
+        return cls(metrics=list(metrics), dt=dt, output=output, correction=correction,
+                   channels=list(channels) if channels else None, rotate=rotate,
+                   rollups=list(rollups) if rollups else None,
+                   events=list(events) if events else None,
+                   event_pre=event_pre, event_hold=event_hold)
@@ -6,6 +6,9 @@ Usage::
 
     specs  = [parse_metric(name) for name in ["LAeq", "LAFmax", "LZeq:bands:63-8000"]]
     build_chain(specs, engine)
+
+Prefix a metric with ``chN/`` (1-based) to measure input channel *N*, e.g.
+``ch2/LAeq``; unprefixed metrics read the first channel.
 """
 from __future__ import annotations
 
@@ -14,6 +17,8 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    import numpy as np
+
     from slm.bus import Bus
     from slm.engine import Engine
     from slm.plugin_meter import PluginMeter
@@ -25,6 +30,9 @@ if TYPE_CHECKING:
 
 _WINDOW_UNIT_SECONDS: dict[str, float] = {"s": 1.0, "m": 60.0, "h": 3600.0}
 
+# Reporter aggregate of each measure, for rollups of _dt metrics
+_ROLLUP_AGGREGATES: dict[str, str] = {"eq": "energy", "E": "exposure", "max": "max", "min": "min"}
+
 # L  weighting  [time-weighting]  [measure]  [_window]  [:bands:[N/M:]fmin-fmax]
 _PATTERN = re.compile(
     r"^L([ACZ])([FSI]?)(eq|max|min|E)?"
@@ -32,6 +40,12 @@ _PATTERN = re.compile(
     r"(?::bands:(?:(\d+/\d+):)?(\d+(?:\.\d+)?)-(\d+(?:\.\d+)?))?$"
 )
 
+# Optional input-channel prefix: chN/<metric>
+_CHANNEL_PREFIX = re.compile(r"^ch(\d+)/(.+)$")
+
+# Upper end of the IEC 61672-1 frequency-weighting tables (Hz)
+_WEIGHTING_BANDWIDTH = 20_000.0
+
 
 # ---------------------------------------------------------------------------
 # MetricSpec
@@ -73,6 +87,19 @@ class MetricSpec:
     this equals ``M/N`` — e.g. ``1.0`` for 1/1-octave, ``3.0`` for 1/3-octave,
     ``6.0`` for 1/6-octave."""
 
+    channel: int | None = None
+    """1-based input channel from a ``chN/`` prefix, or ``None`` (first channel)."""
+
+    @property
+    def channel_index(self) -> int:
+        """0-based input channel this metric reads."""
+        return (self.channel or 1) - 1
+
+
+def bus_name(weighting: str, channel: int | None = None) -> str:
+    """Name of the bus for *weighting* on *channel*: ``'A'``, or ``'ch2/A'`` when qualified."""
+    return weighting if channel is None else f"ch{channel}/{weighting}"
+
 
 # ---------------------------------------------------------------------------
 # parse_metric
@@ -83,7 +110,7 @@ def parse_metric(name: str) -> MetricSpec:
 
     Supported syntax::
 
-        L[ACZ][FSI?](eq|max|min|E)[_(dt|Ns|Nm|Nh)][:bands:[N/M:]fmin-fmax]
+        [chN/]L[ACZ][FSI?](eq|max|min|E)[_(dt|Ns|Nm|Nh)][:bands:[N/M:]fmin-fmax]
 
     Examples::
 
@@ -94,10 +121,20 @@ def parse_metric(name: str) -> MetricSpec:
         parse_metric("LAeq:bands:1/3:31-16000") # A-weighted 1/3-oct Leq, 31–16000 Hz
         parse_metric("LAeq:bands:1/6:63-8000") # A-weighted 1/6-oct Leq, 63–8000 Hz
         parse_metric("LAF")                    # bare metric: most-recent A-fast sample
+        parse_metric("ch2/LAeq")               # A-weighted Leq of input channel 2
 
     Raises :exc:`ValueError` for any invalid or inconsistent name.
     """
-    m = _PATTERN.match(name)
+    channel: int | None = None
+    metric = name
+    prefix = _CHANNEL_PREFIX.match(name)
+    if prefix:
+        channel = int(prefix.group(1))
+        metric = prefix.group(2)
+        if channel < 1:
+            raise ValueError(f"Channel numbers start at 1 (got {name!r})")
+
+    m = _PATTERN.match(metric)
     if not m:
         raise ValueError(f"Invalid metric name: {name!r}")
 
@@ -167,9 +204,42 @@ def parse_metric(name: str) -> MetricSpec:
         window_seconds=window_seconds,
         bands=bands,
         bands_per_oct=bands_per_oct,
+        channel=channel,
     )
 
 
+def _spec_bandwidth(spec: MetricSpec) -> float:
+    if spec.bands is None:
+        return _WEIGHTING_BANDWIDTH
+    return spec.bands[1] * 2 ** (1 / (2 * spec.bands_per_oct))
+
+
+def required_bandwidth(specs: list[MetricSpec]) -> float:
+    """Highest frequency (Hz) the metrics in *specs* need to see unaliased.
+
+    Broadband metrics need the full 20 kHz range of the frequency-weighting
+    curves; band metrics only need the upper edge of their highest band.
+    Used to choose an input decimation factor (see :mod:`slm.decimation`).
+    """
+    return max((_spec_bandwidth(spec) for spec in specs), default=_WEIGHTING_BANDWIDTH)
+
+
+def weighting_bandwidths(specs: list[MetricSpec]) -> dict[str, float]:
+    """Highest frequency (Hz) up to which each A/C weighting filter in *specs* must be exact.
+
+    Maps the curve letter to the largest :func:`required_bandwidth` of the
+    metrics using it; Z-weighting has no filter and is left out.  Passed to
+    :func:`~slm.decimation.choose_decimation`, so the working rate never
+    bends a weighting curve inside the band a metric reads.
+    """
+    bandwidths: dict[str, float] = {}
+    for spec in specs:
+        if spec.weighting != "Z":
+            bandwidths[spec.weighting] = max(bandwidths.get(spec.weighting, 0.0),
+                                             _spec_bandwidth(spec))
+    return bandwidths
+
+
 # ---------------------------------------------------------------------------
 # build_chain
 # ---------------------------------------------------------------------------
@@ -177,6 +247,7 @@ def parse_metric(name: str) -> MetricSpec:
 def build_chain(
     specs: list[MetricSpec],
     engine: Engine,
+    correction: np.ndarray | None = None,
 ) -> None:
     """Wire buses, plugins, and meters for *specs*; register each with *engine.reporter*.
 
@@ -187,16 +258,26 @@ def build_chain(
 
     The signal chain for a broadband metric is::
 
-        Bus(freq-weighting) → [time-weighting | PluginSquare] → Meter
+        Bus(freq-weighting) → [PluginSquare → [time-weighting]] → Meter
 
     For a band metric::
 
-        Bus(freq-weighting) → PluginOctaveBand → [time-weighting | PluginSquare] → Meter
+        Bus(freq-weighting) → PluginOctaveBand → [PluginSquare → [time-weighting]] → Meter
+
+    All time weightings on the same bus (or band bank) consume one shared
+    :class:`~slm.time_weighting.PluginSquare`, so F, S and I — and bare metrics —
+    square the signal once per block between them.
+
+    Metrics with a ``chN/`` prefix get their own buses reading channel *N* of
+    the shared input block (a view, not a copy), and their own reporter
+    outputs (see :meth:`~slm.io.reporter.Reporter.write`).
 
     Args:
         specs:  List of parsed metric descriptors, typically from :func:`parse_metric`.
         engine: The :class:`~slm.engine.Engine` instance to attach buses to.
                 Meters are registered with ``engine.reporter``.
+        correction: Optional FIR taps (see :func:`slm.correction.design_correction_fir`)
+                applied ahead of the frequency weighting on every bus.
     """
     from slm.frequency_weighting import (
         PluginAWeighting, PluginCWeighting, PluginZWeighting,
@@ -205,7 +286,6 @@ def build_chain(
         PluginFastTimeWeighting, PluginSlowTimeWeighting, PluginImpulseTimeWeighting,
         PluginSquare,
     )
-    from slm.octave_band import PluginOctaveBand
     from slm.meter import (
         LeqAccumulator, MaxAccumulator, MinAccumulator, LastAccumulatingMeter,
         LeqMovingMeter, MaxMovingMeter, MinMovingMeter,
@@ -242,35 +322,46 @@ def build_chain(
     }
 
     # Lazy-creation caches keyed by the parameters that uniquely identify each node.
-    buses: dict[str, Bus] = {}
-    tw_plugins: dict[tuple[str, str], PluginMeter] = {}
-    sq_plugins: dict[str, PluginMeter] = {}
-    band_plugins: dict[tuple[str, tuple[float, float], float], PluginMeter] = {}
-    band_tw_plugins: dict[tuple[str, tuple[float, float], float, str], PluginMeter] = {}
-    band_sq_plugins: dict[tuple[str, tuple[float, float], float], PluginMeter] = {}
-
-    def get_bus(w: str) -> Bus:
-        """Return the frequency-weighted bus for weighting letter *w*, creating it if needed."""
-        if w not in buses:
-            buses[w] = engine.add_bus(w, _w_cls[w])
-        return buses[w]
-
-    def get_tw_plugin(w: str, tw_letter: str) -> PluginMeter:
+    # Every key starts with the channel (``None`` or the 1-based ``chN`` number).
+    buses: dict[tuple[int | None, str], Bus] = {}
+    tw_plugins: dict[tuple[int | None, str, str], PluginMeter] = {}
+    sq_plugins: dict[tuple[int | None, str], PluginMeter] = {}
+    band_plugins: dict[tuple[int | None, str, tuple[float, float], float], PluginMeter] = {}
+    band_tw_plugins: dict[tuple[int | None, str, tuple[float, float], float, str], PluginMeter] = {}
+    band_sq_plugins: dict[tuple[int | None, str, tuple[float, float], float], PluginMeter] = {}
+
+    n_channels = engine.channels
+
+    def get_bus(ch: int | None, w: str) -> Bus:
+        """Return the bus for weighting letter *w* on channel *ch*, creating it if needed."""
+        key = (ch, w)
+        if key not in buses:
+            index = (ch or 1) - 1
+            if n_channels is not None and index >= n_channels:
+                raise ValueError(
+                    f"Metric on channel {ch} requested, but the input has {n_channels} channel(s)"
+                )
+            buses[key] = engine.add_bus(bus_name(w, ch), _w_cls[w], correction=correction,
+                                        channel=index)
+        return buses[key]
+
+    def get_tw_plugin(ch: int | None, w: str, tw_letter: str) -> PluginMeter:
         """Return the broadband time-weighting plugin for (*w*, *tw_letter*), creating if needed."""
-        key = (w, tw_letter)
+        key = (ch, w, tw_letter)
         if key not in tw_plugins:
-            bus = get_bus(w)
-            freq_w = bus.frequency_weighting
-            plugin = _tw_cls[tw_letter](input=freq_w, zero_zi=True)
+            bus = get_bus(ch, w)
+            plugin = _tw_cls[tw_letter](input=get_sq_plugin(ch, w), zero_zi=True, squared_input=True)
             bus.add_plugin(plugin)
             tw_plugins[key] = plugin
         return tw_plugins[key]
 
-    def get_band_plugin(w: str, bands: tuple[float, float], bpo: float) -> PluginMeter:
+    def get_band_plugin(ch: int | None, w: str, bands: tuple[float, float], bpo: float) -> PluginMeter:
         """Return the octave-band filter bank for (*w*, *bands*, *bpo*), creating if needed."""
-        key = (w, bands, bpo)
+        key = (ch, w, bands, bpo)
         if key not in band_plugins:
-            bus = get_bus(w)
+            # Imported here so broadband-only chains never load pyoctaveband
+            from slm.octave_band import PluginOctaveBand
+            bus = get_bus(ch, w)
             freq_w = bus.frequency_weighting
             plugin = PluginOctaveBand(
                 input=freq_w, limits=bands, bands_per_oct=bpo, zero_zi=True,
@@ -279,66 +370,73 @@ def build_chain(
             band_plugins[key] = plugin
         return band_plugins[key]
 
-    def get_sq_plugin(w: str) -> PluginMeter:
+    def get_sq_plugin(ch: int | None, w: str) -> PluginMeter:
         """Return the broadband squaring plugin for *w*, creating if needed.
 
-        Used for bare metrics (no time-weighting) so the meter receives Pa² input.
+        Used for bare metrics (no time-weighting) so the meter receives Pa² input,
+        and as the shared input of every broadband time-weighting plugin on *w*.
         """
-        if w not in sq_plugins:
-            bus = get_bus(w)
+        key = (ch, w)
+        if key not in sq_plugins:
+            bus = get_bus(ch, w)
             plugin = PluginSquare(input=bus.frequency_weighting)
             bus.add_plugin(plugin)
-            sq_plugins[w] = plugin
-        return sq_plugins[w]
+            sq_plugins[key] = plugin
+        return sq_plugins[key]
 
-    def get_band_sq_plugin(w: str, bands: tuple[float, float], bpo: float) -> PluginMeter:
+    def get_band_sq_plugin(
+        ch: int | None, w: str, bands: tuple[float, float], bpo: float
+    ) -> PluginMeter:
         """Return the per-band squaring plugin for (*w*, *bands*, *bpo*), creating if needed.
 
-        Used for bare per-band metrics so each band output is in Pa².
+        Used for bare per-band metrics so each band output is in Pa², and as the
+        shared input of every time-weighting plugin on this band bank.
         """
-        key = (w, bands, bpo)
+        key = (ch, w, bands, bpo)
         if key not in band_sq_plugins:
-            band_plugin = get_band_plugin(w, bands, bpo)
+            band_plugin = get_band_plugin(ch, w, bands, bpo)
             plugin = PluginSquare(input=band_plugin, width=band_plugin.width)
-            get_bus(w).add_plugin(plugin)
+            get_bus(ch, w).add_plugin(plugin)
             band_sq_plugins[key] = plugin
         return band_sq_plugins[key]
 
     def get_band_tw_plugin(
-        w: str, bands: tuple[float, float], bpo: float, tw_letter: str
+        ch: int | None, w: str, bands: tuple[float, float], bpo: float, tw_letter: str
     ) -> PluginMeter:
         """Return the per-band time-weighting plugin for (*w*, *bands*, *bpo*, *tw_letter*).
 
-        The plugin is inserted after the octave-band filter bank so each band
-        is time-weighted independently.
+        The plugin is inserted after the octave-band filter bank (and its shared
+        squaring stage) so each band is time-weighted independently.
         """
-        key = (w, bands, bpo, tw_letter)
+        key = (ch, w, bands, bpo, tw_letter)
         if key not in band_tw_plugins:
-            band_plugin = get_band_plugin(w, bands, bpo)
-            plugin = _tw_cls[tw_letter](input=band_plugin, zero_zi=True, width=band_plugin.width)
-            get_bus(w).add_plugin(plugin)
+            sq_plugin = get_band_sq_plugin(ch, w, bands, bpo)
+            plugin = _tw_cls[tw_letter](input=sq_plugin, zero_zi=True, width=sq_plugin.width,
+                                        squared_input=True)
+            get_bus(ch, w).add_plugin(plugin)
             band_tw_plugins[key] = plugin
         return band_tw_plugins[key]
 
     for spec in specs:
+        ch = spec.channel
         # Resolve the upstream plugin this metric reads from
         if spec.bands is not None:
             if spec.time_weighting is not None:
                 plugin = get_band_tw_plugin(
-                    spec.weighting, spec.bands, spec.bands_per_oct, spec.time_weighting
+                    ch, spec.weighting, spec.bands, spec.bands_per_oct, spec.time_weighting
                 )
             elif spec.measure == "last":
                 # no TW, bare metric per band: square first so output is Pa²
-                plugin = get_band_sq_plugin(spec.weighting, spec.bands, spec.bands_per_oct)
+                plugin = get_band_sq_plugin(ch, spec.weighting, spec.bands, spec.bands_per_oct)
             else:
-                plugin = get_band_plugin(spec.weighting, spec.bands, spec.bands_per_oct)
+                plugin = get_band_plugin(ch, spec.weighting, spec.bands, spec.bands_per_oct)
         elif spec.time_weighting is not None:
-            plugin = get_tw_plugin(spec.weighting, spec.time_weighting)
+            plugin = get_tw_plugin(ch, spec.weighting, spec.time_weighting)
         elif spec.measure == "last":
             # no TW, broadband bare metric: square first so output is Pa²
-            plugin = get_sq_plugin(spec.weighting)
+            plugin = get_sq_plugin(ch, spec.weighting)
         else:
-            bus = get_bus(spec.weighting)
+            bus = get_bus(ch, spec.weighting)
             plugin = bus.frequency_weighting
 
         # Select meter class and build kwargs
@@ -355,8 +453,11 @@ def build_chain(
 
         # Register with reporter; band metrics also pass centre frequencies for column labels
         if spec.bands is not None:
-            band_plugin = get_band_plugin(spec.weighting, spec.bands, spec.bands_per_oct)
+            band_plugin = get_band_plugin(ch, spec.weighting, spec.bands, spec.bands_per_oct)
             center_freqs = band_plugin.center_frequencies
         else:
             center_freqs = None
-        engine.reporter.add_column(spec.name, plugin, spec.name, center_frequencies=center_freqs)
+        # Per-interval (_dt) values can be rolled up to coarser resolutions
+        aggregate = _ROLLUP_AGGREGATES.get(spec.measure) if spec.window_is_dt else None
+        engine.reporter.add_column(spec.name, plugin, spec.name, center_frequencies=center_freqs,
+                                   channel=ch, aggregate=aggregate)
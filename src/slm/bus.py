@@ -5,6 +5,7 @@ import numpy as np
 
 from slm.processing_element import ProcessingElement
 from slm.frequency_weighting import PluginFrequencyWeighting, PluginZWeighting
+from slm.correction import PluginCorrection
 
 if TYPE_CHECKING:
     from slm.plugin import Plugin, TPlugin
@@ -16,6 +17,7 @@ if TYPE_CHECKING:
 class Bus(ProcessingElement):
     name: str
     frequency_weighting: PluginFrequencyWeighting
+    correction: PluginCorrection | None
     plugins: list[Plugin]
     # meters: list[Meter] # meters are handled by plugins
     block: np.ndarray
@@ -26,19 +28,31 @@ class Bus(ProcessingElement):
     blocksize: int = property(lambda self: self.engine.blocksize)
     sensitivity: float = property(lambda self: self.engine.sensitivity)
 
-    def __init__(self, engine: "Engine", name: str, frequency_weighting: type[PluginFrequencyWeighting] | None = None, **kwargs):
+    def __init__(self, engine: "Engine", name: str, frequency_weighting: type[PluginFrequencyWeighting] | None = None,
+                 correction: np.ndarray | None = None, channel: int = 0, **kwargs):
         super().__init__(**kwargs)
         self.engine = engine
         self.name = name
+        self.channel = channel  # 0-based input channel this bus measures
         self.plugins = []
         self.block = np.zeros((1, self.blocksize))
 
         if frequency_weighting is None:
             frequency_weighting = PluginZWeighting
 
+        # Optional FIR correction (microphone / windscreen response) ahead of the weighting
+        self.correction = None
+        if correction is not None:
+            self.correction = self.add_plugin(PluginCorrection(taps=correction, width=1, input=self))
+
         self.frequency_weighting = self.add_plugin(frequency_weighting(width=1, input=self, bus=self, zero_zi=True))
 
     def process(self, block: np.ndarray):
+        # Channel selection is a view into the shared (channels, blocksize) input
+        block = block[self.channel:self.channel + 1]
+        if self.correction is not None:
+            self.correction.process(block)
+            block = self.correction.output
         self.frequency_weighting.process(block)
 
     def get(self) -> np.ndarray:
@@ -66,6 +80,8 @@ class Bus(ProcessingElement):
         return [self]
 
     def to_str(self):
+        if self.channel:
+            return f"Bus(name={self.name}, channel={self.channel})"
         return f"Bus(name={self.name})"
 
     def __str__(self):
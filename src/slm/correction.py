@@ -0,0 +1,135 @@
+"""Microphone / windscreen frequency-response correction.
+
+A measured correction curve (frequency in Hz vs. gain in dB) is turned into a
+linear-phase FIR filter and applied with uniformly partitioned overlap-save
+FFT convolution, so a long filter costs one forward and one inverse FFT per
+block plus one complex multiply-add per partition, with one block of latency.
+"""
+from __future__ import annotations
+
+from math import ceil
+from pathlib import Path
+
+import numpy as np
+
+from slm.plugin_meter import PluginMeter
+
+
+def load_response(path: str | Path) -> tuple[np.ndarray, np.ndarray]:
+    """Read a two-column frequency/dB response table.
+
+    Columns may be separated by whitespace, commas, semicolons or tabs.
+    Lines starting with ``#`` and lines that do not parse as two numbers
+    (e.g. a header row) are skipped.  Returns ``(freqs_hz, gains_db)`` sorted
+    by frequency.
+    """
+    freqs: list[float] = []
+    gains: list[float] = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.split("#", 1)[0].replace(",", " ").replace(";", " ").strip()
+            if not line:
+                continue
+            parts = line.split()
+            try:
+                freq, gain = float(parts[0]), float(parts[1])
+            except (ValueError, IndexError):
+                continue
+            freqs.append(freq)
+            gains.append(gain)
+
+    if len(freqs) < 2:
+        raise ValueError(f"Response file {str(path)!r} must contain at least two frequency/dB rows")
+
+    order = np.argsort(freqs)
+    return np.asarray(freqs)[order], np.asarray(gains)[order]
+
+
+def design_correction_fir(freqs: np.ndarray, gains_db: np.ndarray, samplerate: int,
+                          n_taps: int = 4096, invert: bool = False) -> np.ndarray:
+    """Design a linear-phase FIR that follows *gains_db* at *freqs*.
+
+    The table is interpolated on a log-frequency axis and held constant
+    beyond its first and last entries.  With ``invert=True`` the table is
+    treated as a measured response and its inverse is designed instead.
+    """
+    from scipy.signal import firwin2
+
+    freqs = np.asarray(freqs, dtype=float)
+    gains_db = np.asarray(gains_db, dtype=float)
+    if invert:
+        gains_db = -gains_db
+
+    # firwin2 forces zero gain at Nyquist for even lengths (type II FIR), so an
+    # even request is designed one tap shorter and padded with a trailing zero.
+    n_design = n_taps - 1 if n_taps % 2 == 0 else n_taps
+
+    grid = np.linspace(0.0, samplerate / 2, max(n_design, 513))
+    positive = freqs > 0
+    log_grid = np.log10(np.maximum(grid, freqs[positive][0]))
+    grid_db = np.interp(log_grid, np.log10(freqs[positive]), gains_db[positive])
+
+    taps = firwin2(n_design, grid, 10 ** (grid_db / 20), fs=samplerate)
+    if n_design != n_taps:
+        taps = np.append(taps, 0.0)
+    return taps
+
+
+class PluginCorrection(PluginMeter):
+    """Long FIR correction filter using uniformly partitioned overlap-save convolution.
+
+    The impulse response is split into partitions of one block each.  Every
+    block, the last two input blocks are transformed once and pushed into a
+    frequency-domain delay line; the output spectrum is the sum of the delay
+    line multiplied by the partition spectra.  Latency is one block regardless
+    of filter length.
+
+    Attach it ahead of the frequency weighting via ``engine.add_bus(..., correction=taps)``.
+    """
+
+    def __init__(self, *, taps: np.ndarray, **kwargs):
+        super().__init__(**kwargs)
+        self.taps = np.asarray(taps, dtype=float)
+        self.output = np.zeros((self.width, self.blocksize))
+        self._compute_filter()
+
+    @classmethod
+    def from_response_file(cls, path: str | Path, *, input, n_taps: int = 4096,
+                           invert: bool = False, **kwargs) -> "PluginCorrection":
+        """Build a correction plugin from a frequency/dB table on disk."""
+        freqs, gains_db = load_response(path)
+        taps = design_correction_fir(freqs, gains_db, input.samplerate, n_taps=n_taps, invert=invert)
+        return cls(taps=taps, input=input, **kwargs)
+
+    def reset(self):
+        super().reset()
+        self._compute_filter()
+
+    def _compute_filter(self):
+        n = self.blocksize
+        n_parts = max(1, ceil(len(self.taps) / n))
+        padded = np.zeros((n_parts, 2 * n))
+        padded[:, :n] = np.pad(self.taps, (0, n_parts * n - len(self.taps))).reshape(n_parts, n)
+        spectra = np.fft.rfft(padded, axis=-1)
+        # Stored twice so the ring-buffer rotation is a plain slice, not a copy.
+        self._spectra = np.concatenate((spectra, spectra))
+        self._n_parts = n_parts
+        self._fdl = np.zeros((n_parts, self.width, n + 1), dtype=complex)
+        self._head = 0
+        self._buffer = np.zeros((self.width, 2 * n))
+
+    def func(self, block: np.ndarray):
+        n = self.blocksize
+        p = self._n_parts
+        self._buffer[:, :n] = self._buffer[:, n:]
+        self._buffer[:, n:] = block
+
+        # Newest spectrum goes to _head; delay-line slot q then holds the input
+        # that must meet partition (q - _head) % p.
+        self._head = (self._head - 1) % p
+        self._fdl[self._head] = np.fft.rfft(self._buffer, axis=-1)
+        acc = np.einsum("pwk,pk->wk", self._fdl, self._spectra[p - self._head:2 * p - self._head])
+        self.output[:, :] = np.fft.irfft(acc, n=2 * n, axis=-1)[:, n:]
+
+    def to_str(self):
+        return f"PluginCorrection(taps={len(self.taps)})"
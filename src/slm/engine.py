@@ -1,41 +1,103 @@
 from __future__ import annotations
+import asyncio
+import time
 import warnings
 from datetime import timedelta
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 
 from slm.bus import Bus
 from slm.io.reporter import Reporter
 
 if TYPE_CHECKING:
+    import numpy as np
+
+    from slm.decimation import Decimator
     from slm.frequency_weighting import PluginFrequencyWeighting
     from slm.io.controller import Controller
 
 
 class Engine:
-    samplerate: int = property(lambda self: self._controller.samplerate)
-    blocksize: int = property(lambda self: self._controller.blocksize)
+    samplerate: int = property(lambda self: self._controller.samplerate // self._decimation)
+    blocksize: int = property(lambda self: self._controller.blocksize // self._decimation)
+    input_samplerate: int = property(lambda self: self._controller.samplerate)
+    decimation: int = property(lambda self: self._decimation)
     sensitivity: float = property(lambda self: self._controller.sensitivity)
     dt: float = property(lambda self: self._dt)
+    processed_seconds: float = property(lambda self: self._processed_frames / self.input_samplerate)
+    """Duration of the input processed so far."""
+    processing_seconds: float = property(lambda self: self._processing_time)
+    """Wall-clock time spent processing it (excluding waiting for input)."""
+    overruns: int = property(lambda self: getattr(self._controller, "overruns", 0))
+    """Input blocks the controller dropped because the engine fell behind."""
 
     def __init__(self, controller, dt: float = 0.1,
                  reporter: Reporter | None = None):
         self._controller: Controller = controller
         self._busses: dict[str, Bus] = dict()
         self._dt = dt
+        self._decimation = 1
+        self._decimator: Decimator | None = None
+        self._listeners: list[Callable[[np.ndarray], None]] = []
+        self._processed_frames = 0
+        self._processing_time = 0.0
         self.reporter: Reporter = reporter or Reporter()
 
-    def add_bus(self, name: str, frequency_weighting: type[PluginFrequencyWeighting] | None = None) -> Bus:
-        bus = Bus(engine=self, name=name, frequency_weighting=frequency_weighting)
+    def set_decimation(self, factor: int, bandwidth: float | None = None) -> None:
+        """Process at ``input_samplerate / factor`` after an anti-alias decimator.
+
+        :attr:`samplerate` and :attr:`blocksize` then report the working rate,
+        so it must be set before any bus is added.  *bandwidth* (Hz) is the
+        band the anti-alias filter keeps flat; by default 0.8 × the working
+        Nyquist frequency.
+        """
+        if self._busses:
+            raise RuntimeError("set_decimation() must be called before any bus is added")
+        if factor == 1:
+            self._decimation, self._decimator = 1, None
+            return
+        from slm import filter_cache
+        from slm.decimation import Decimator
+        rate = self.input_samplerate
+        if rate % factor or self._controller.blocksize % factor:
+            raise ValueError(
+                f"Decimation factor {factor} must divide the samplerate ({rate}) "
+                f"and the blocksize ({self._controller.blocksize})"
+            )
+        if bandwidth is None:
+            bandwidth = 0.4 * rate / factor
+        taps = filter_cache.decimation_design(rate, factor, bandwidth)
+        self._decimator = Decimator(factor, taps, channels=self.channels or 1,
+                                    blocksize=self._controller.blocksize)
+        self._decimation = factor
+
+    @property
+    def channels(self) -> int | None:
+        """Input channel count, or ``None`` if the controller does not report one."""
+        channels = getattr(self._controller, "channels", None)
+        return channels if isinstance(channels, int) else None
+
+    def add_bus(self, name: str, frequency_weighting: type[PluginFrequencyWeighting] | None = None,
+                correction: np.ndarray | None = None, channel: int = 0) -> Bus:
+        bus = Bus(engine=self, name=name, frequency_weighting=frequency_weighting, correction=correction,
+                  channel=channel)
         self._busses[name] = bus
         return bus
 
+    def add_listener(self, listener: Callable[[np.ndarray], None]) -> None:
+        """Call *listener* with every raw ``(frames, channels)`` input block.
+
+        It runs on the engine thread once all buses have processed the
+        block, so meters already include it; keep it cheap.
+        """
+        self._listeners.append(listener)
+
     def get_bus(self, name: str) -> Bus:
         try:
             return self._busses[name]
         except KeyError:
             raise KeyError(f"No bus named '{name}'")
 
-    def run(self):
+    def _check_dt(self) -> None:
         block_duration = self.blocksize / self.samplerate
         if self._dt < block_duration:
             warnings.warn(
@@ -43,8 +105,14 @@ class Engine:
                 f"blocksize={self.blocksize}, fs={self.samplerate}Hz). "
                 f"Logging resolution is limited to one entry per block.",
                 UserWarning,
-                stacklevel=2,
+                stacklevel=3,
             )
+
+    def run(self):
+        from slm.io.aio import is_async_controller, is_async_reporter
+        if is_async_controller(self._controller) or is_async_reporter(self.reporter):
+            raise TypeError("Async controllers and reporters require Engine.run_async()")
+        self._check_dt()
         self._last_timestamp: timedelta | None = None
         while True:
             try:
@@ -56,16 +124,75 @@ class Engine:
         if self._last_timestamp is not None:
             self.reporter.record(self._last_timestamp, 0)
 
+    async def run_async(self) -> None:
+        """Run the engine as a coroutine on the current event loop.
+
+        Synchronous controllers are wrapped in
+        :class:`~slm.io.aio.AsyncControllerAdapter`, so blocking reads happen
+        on a worker thread; the bus processing itself runs on the loop, one
+        block at a time, yielding between blocks.  The reporter may be the
+        usual :class:`~slm.io.reporter.Reporter` or any
+        :class:`~slm.io.aio.AsyncReporter`, whose ``record`` is awaited.
+
+        Cancelling the task stops the controller; the final snapshot is
+        recorded either way, so the report reflects everything processed.
+        """
+        from slm.io.aio import AsyncControllerAdapter, is_async_controller, is_async_reporter
+        controller = self._controller
+        adapter = None
+        if not is_async_controller(controller):
+            controller = adapter = AsyncControllerAdapter(controller)
+        record_is_async = is_async_reporter(self.reporter)
+
+        self._check_dt()
+        self._last_timestamp: timedelta | None = None
+        try:
+            while True:
+                try:
+                    block, block_index = await controller.read_block()
+                except StopAsyncIteration:
+                    break
+                timestamp = self._dispatch(block, block_index)
+                if record_is_async:
+                    await self.reporter.record(timestamp, self._dt)
+                else:
+                    self.reporter.record(timestamp, self._dt)
+                await asyncio.sleep(0)   # let other pipelines run between blocks
+        except asyncio.CancelledError:
+            await controller.stop()
+            raise
+        finally:
+            if adapter is not None:
+                adapter.close()
+            if self._last_timestamp is not None:
+                if record_is_async:
+                    await self.reporter.record(self._last_timestamp, 0)
+                else:
+                    self.reporter.record(self._last_timestamp, 0)
+
     def _process_block(self) -> None:
         block, block_index = self._controller.read_block()
+        timestamp = self._dispatch(block, block_index)
+        self.reporter.record(timestamp, self._dt)
+
+    def _dispatch(self, block: np.ndarray, block_index: int) -> timedelta:
+        """Feed one ``(N, ch)`` block to every bus and return its timestamp."""
+        t0 = time.perf_counter()
+        raw = block
         block = block.transpose()
+        if self._decimator is not None:
+            block = self._decimator.process(block)
 
         for bus in self._busses.values():
             bus.process(block)
+        for listener in self._listeners:
+            listener(raw)
+        self._processed_frames += len(raw)
+        self._processing_time += time.perf_counter() - t0
 
         timestamp = timedelta(seconds=block_index * self.blocksize / self.samplerate)
         self._last_timestamp = timestamp
-        self.reporter.record(timestamp, self._dt)
+        return timestamp
 
     def stop(self):
         self._controller.stop()
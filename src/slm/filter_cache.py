@@ -0,0 +1,201 @@
+"""Process-wide cache of designed filter coefficients.
+
+Building a chain (and every ``reset()``) would otherwise redesign identical
+weighting, Butterworth and octave-band filters from scratch.  Designs are
+keyed by the parameters that determine them (samplerate, curve, fc, order,
+limits, fraction, filter type, …) and kept for the lifetime of the process.
+
+Cached SOS arrays are shared and must not be modified (scipy's ``sosfilt``
+needs them writable, so this is by convention).  ``zi`` templates are
+read-only; callers copy them before using them as filter state.  Octave
+filter banks are stateful, so :func:`octave_filter_bank` returns an
+independent copy of a pristine template each time.
+
+Optional on-disk persistence: call :func:`enable_persistence` (or set the
+``SLM_FILTER_CACHE_DIR`` environment variable) to also store designs as
+pickle files in a directory, so later processes skip the design step too.
+Only point it at a directory you trust — entries are loaded with ``pickle``.
+"""
+from __future__ import annotations
+
+import copy
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+
+_CACHE_VERSION = 1
+
+_lock = threading.Lock()
+_memory: dict[tuple, Any] = {}
+_disk_dir: Path | None = None
+_hits = 0
+_disk_hits = 0
+_misses = 0
+
+
+# ---------------------------------------------------------------------------
+# Cache management
+# ---------------------------------------------------------------------------
+
+def enable_persistence(directory: str | Path) -> None:
+    """Also persist designs as files in *directory* (created if missing)."""
+    global _disk_dir
+    _disk_dir = Path(directory)
+    _disk_dir.mkdir(parents=True, exist_ok=True)
+
+
+def disable_persistence() -> None:
+    """Stop reading and writing the on-disk cache (the memory cache is kept)."""
+    global _disk_dir
+    _disk_dir = None
+
+
+def clear() -> None:
+    """Drop all in-memory designs and reset the hit/miss counters."""
+    global _hits, _disk_hits, _misses
+    with _lock:
+        _memory.clear()
+        _hits = 0
+        _disk_hits = 0
+        _misses = 0
+
+
+def cache_info() -> dict:
+    """Return ``{'hits', 'disk_hits', 'misses', 'size', 'directory'}`` for diagnostics."""
+    return {
+        "hits": _hits,
+        "disk_hits": _disk_hits,
+        "misses": _misses,
+        "size": len(_memory),
+        "directory": str(_disk_dir) if _disk_dir is not None else None,
+    }
+
+
+def _disk_path(key: tuple) -> Path:
+    digest = hashlib.sha1(repr((_CACHE_VERSION, key)).encode()).hexdigest()
+    return _disk_dir / f"{key[0]}-{digest}.pkl"
+
+
+def _get(key: tuple, design: Callable[[], Any]) -> Any:
+    """Return the design stored under *key*, computing it with *design* on a miss."""
+    global _hits, _disk_hits, _misses
+    with _lock:
+        if key in _memory:
+            _hits += 1
+            return _memory[key]
+
+    value = None
+    path = _disk_path(key) if _disk_dir is not None else None
+    if path is not None and path.exists():
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            value = None
+
+    from_disk = value is not None
+    if value is None:
+        value = design()
+        if path is not None:
+            _store(path, value)
+
+    with _lock:
+        if from_disk:
+            _disk_hits += 1
+        else:
+            _misses += 1
+        return _memory.setdefault(key, value)
+
+
+def _store(path: Path, value: Any) -> None:
+    """Write *value* to *path* atomically; failures only cost the disk entry."""
+    tmp = None
+    try:
+        with tempfile.NamedTemporaryFile(dir=path.parent, prefix=path.stem, suffix=".tmp",
+                                         delete=False) as f:
+            tmp = f.name
+            pickle.dump(value, f)
+        os.replace(tmp, path)
+    except OSError:
+        if tmp is not None:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
+
+def _sos_with_zi(sos: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Pair *sos* with its steady-state ``zi`` shaped ``(n_sections, 1, 2)``."""
+    from scipy.signal import sosfilt_zi
+
+    zi = sosfilt_zi(sos)[:, np.newaxis, :]
+    zi.setflags(write=False)
+    return np.asarray(sos, dtype=float), zi
+
+
+# ---------------------------------------------------------------------------
+# Designs
+# ---------------------------------------------------------------------------
+
+def weighting_design(samplerate: int, curve: str) -> tuple[np.ndarray, np.ndarray]:
+    """Return ``(sos, zi)`` for the IEC 61672-1 *curve* (``'A'`` or ``'C'``) at *samplerate*."""
+    def design():
+        from pyoctaveband import WeightingFilter
+        return _sos_with_zi(WeightingFilter(fs=samplerate, curve=curve).sos)
+
+    return _get(("weighting", int(samplerate), curve.upper()), design)
+
+
+def butter_design(order: int, wn: float | tuple[float, float], btype: str,
+                  samplerate: int) -> tuple[np.ndarray, np.ndarray]:
+    """Return ``(sos, zi)`` for ``butter(order, wn, btype, fs=samplerate)``."""
+    wn_key = tuple(float(w) for w in wn) if np.ndim(wn) else float(wn)
+
+    def design():
+        from scipy.signal import butter
+        return _sos_with_zi(butter(order, wn, btype=btype, fs=samplerate, output="sos"))
+
+    return _get(("butter", int(samplerate), int(order), wn_key, btype), design)
+
+
+def octave_filter_bank(samplerate: int, fraction: float, limits: tuple[float, float],
+                       order: int = 6, filter_type: str = "butter", ripple: float = 0.1,
+                       attenuation: float = 60, steady_ic: bool = False):
+    """Return a fresh stateful, non-resampling ``OctaveFilterBank``.
+
+    The design is made once per parameter set; each call returns an
+    independent copy so filter state is never shared between plugins.
+    """
+    limits = (float(limits[0]), float(limits[1]))
+
+    def design():
+        from pyoctaveband import OctaveFilterBank
+        return OctaveFilterBank(fs=samplerate, fraction=fraction, limits=list(limits),
+                                show=False, order=order, filter_type=filter_type,
+                                ripple=ripple, attenuation=attenuation,
+                                stateful=True, steady_ic=steady_ic, resample=False)
+
+    key = ("octave", int(samplerate), float(fraction), limits, int(order), filter_type,
+           float(ripple), float(attenuation), bool(steady_ic))
+    return copy.deepcopy(_get(key, design))
+
+
+def decimation_design(samplerate: int, factor: int, bandwidth: float) -> np.ndarray:
+    """Return the anti-alias FIR taps for decimating *samplerate* by *factor*."""
+    def design():
+        from slm.decimation import design_antialias
+        taps = design_antialias(samplerate, factor, bandwidth)
+        taps.setflags(write=False)
+        return taps
+
+    return _get(("decimation", int(samplerate), int(factor), float(bandwidth)), design)
+
+
+if os.environ.get("SLM_FILTER_CACHE_DIR"):
+    enable_persistence(os.environ["SLM_FILTER_CACHE_DIR"])
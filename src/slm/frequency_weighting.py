@@ -1,8 +1,8 @@
 import numpy as np
 
-from pyoctaveband import WeightingFilter
-from scipy.signal import butter, sosfilt, sosfilt_zi
+from scipy.signal import sosfilt
 
+from slm import filter_cache
 from slm.plugin_meter import PluginMeter
 
 
@@ -21,13 +21,9 @@ class PluginFrequencyWeighting(PluginMeter):
         self._compute_filter()
 
     def _compute_filter(self):
-        wf = WeightingFilter(fs=self.samplerate, curve=self.curve)
-        self._wf = wf.sos
-        self._zi = sosfilt_zi(self._wf)  # avoids ringing of filter at the start.
-        shape = self._zi.shape
-        self._zi = np.reshape(self._zi, (shape[0], 1, shape[1]))
-        if self._zero_zi:
-            self._zi = np.zeros_like(self._zi)
+        self._wf, zi = filter_cache.weighting_design(self.samplerate, self.curve)
+        # steady-state zi avoids ringing of filter at the start.
+        self._zi = np.zeros_like(zi) if self._zero_zi else zi.copy()
 
     def func(self, block: np.ndarray):
         self.output[0,:], self._zi[:,:] = sosfilt(self._wf, block, zi=self._zi)
@@ -94,12 +90,8 @@ class PluginHPF(PluginMeter):
         self._compute_filter()
 
     def _compute_filter(self):
-        self._sos = butter(self.order, self.fc, btype='high', fs=self.samplerate, output='sos')
-        self._zi = sosfilt_zi(self._sos)
-        shape = self._zi.shape
-        self._zi = np.reshape(self._zi, (shape[0], 1, shape[1]))
-        if self._zero_zi:
-            self._zi = np.zeros_like(self._zi)
+        self._sos, zi = filter_cache.butter_design(self.order, self.fc, 'high', self.samplerate)
+        self._zi = np.zeros_like(zi) if self._zero_zi else zi.copy()
 
     def func(self, block: np.ndarray):
         self.output[0, :], self._zi[:, :] = sosfilt(self._sos, block, zi=self._zi)
@@ -125,13 +117,9 @@ class PluginBandpass(PluginMeter):
 
     def _compute_filter(self):
         factor = 2 ** (1 / 6)
-        sos = butter(self.order, [self.fc / factor, self.fc * factor],
-                     btype='bandpass', fs=self.samplerate, output='sos')
-        self._sos = sos
-        zi = sosfilt_zi(sos)
-        self._zi = np.reshape(zi, (zi.shape[0], 1, zi.shape[1]))
-        if self._zero_zi:
-            self._zi = np.zeros_like(self._zi)
+        self._sos, zi = filter_cache.butter_design(self.order, (self.fc / factor, self.fc * factor),
+                                                   'bandpass', self.samplerate)
+        self._zi = np.zeros_like(zi) if self._zero_zi else zi.copy()
 
     def func(self, block: np.ndarray):
         self.output[0, :], self._zi[:, :] = sosfilt(self._sos, block, zi=self._zi)
@@ -1,21 +1,70 @@
-"""Public API for slm.io — I/O controllers, reporter, and display helpers."""
-from slm.io.controller import Controller
-from slm.io.file_controller import FileController
-from slm.io.realtime_controller import RealtimeController
-from slm.io.reporter import Reporter
-from slm.io.display import make_display_fn
+"""Public API for slm.io — I/O controllers, reporter, and display helpers.
+
+Names are imported lazily on first access; in particular sounddevice (and
+PortAudio) is only loaded when :class:`SounddeviceController` is used.
+"""
+from importlib import import_module
+from importlib.util import find_spec
+
+_LAZY = {
+    "Controller": "slm.io.controller",
+    "FileController": "slm.io.file_controller",
+    "WavMemmapController": "slm.io.wav_memmap_controller",
+    "SegmentedFileController": "slm.io.segmented_controller",
+    "StreamController": "slm.io.stream_controller",
+    "SyntheticController": "slm.io.synthetic_controller",
+    "RealtimeController": "slm.io.realtime_controller",
+    "AsyncController": "slm.io.aio",
+    "AsyncControllerAdapter": "slm.io.aio",
+    "AsyncReporter": "slm.io.aio",
+    "Reporter": "slm.io.reporter",
+    "Rollup": "slm.io.rollup",
+    "LogWriter": "slm.io.log_writer",
+    "BinaryLog": "slm.io.binary_log",
+    "EnergyIndex": "slm.io.energy_index",
+    "EventDetector": "slm.io.events",
+    "LiveServer": "slm.io.live_server",
+    "make_display_fn": "slm.io.display",
+    "SounddeviceController": "slm.io.sounddevice_controller",
+}
 
 try:
-    from slm.io.sounddevice_controller import SounddeviceController
+    _has_sounddevice = find_spec("sounddevice") is not None
+except ValueError:  # already in sys.modules without a spec, e.g. a test stand-in
     _has_sounddevice = True
-except ImportError:
-    _has_sounddevice = False
 
 __all__ = [
     "Controller",
     "FileController",
+    "WavMemmapController",
+    "SegmentedFileController",
+    "StreamController",
+    "SyntheticController",
     "RealtimeController",
+    "AsyncController",
+    "AsyncControllerAdapter",
+    "AsyncReporter",
     "Reporter",
+    "Rollup",
+    "LogWriter",
+    "BinaryLog",
+    "EnergyIndex",
+    "EventDetector",
+    "LiveServer",
     "make_display_fn",
     *( ["SounddeviceController"] if _has_sounddevice else [] ),
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str):
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
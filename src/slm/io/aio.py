@@ -0,0 +1,117 @@
+"""Asyncio protocols for controllers and reporters, and an adapter for sync controllers.
+
+Used by :meth:`slm.engine.Engine.run_async` so several measurement pipelines,
+servers and writers can share one event loop::
+
+    engine = Engine(AsyncControllerAdapter(FileController("a.wav")), dt=1.0)
+    await asyncio.gather(engine.run_async(), other_engine.run_async())
+
+Any :class:`~slm.io.controller.Controller` passed to ``run_async`` is wrapped
+in :class:`AsyncControllerAdapter` automatically.
+"""
+from __future__ import annotations
+
+import asyncio
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import TYPE_CHECKING, Protocol, runtime_checkable
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from slm.io.controller import Controller
+
+
+@runtime_checkable
+class AsyncController(Protocol):
+    """A controller whose :meth:`read_block` is a coroutine.
+
+    ``read_block`` returns ``(block (N, ch), block_index)`` like
+    :meth:`Controller.read_block <slm.io.controller.Controller.read_block>`
+    and raises :exc:`StopAsyncIteration` at the end of the input.
+    """
+
+    samplerate: int
+    blocksize: int
+    sensitivity: float
+
+    async def read_block(self) -> tuple[np.ndarray, int]: ...
+
+    async def stop(self) -> None: ...
+
+
+@runtime_checkable
+class AsyncReporter(Protocol):
+    """A reporter whose :meth:`record` is a coroutine; awaited once per block."""
+
+    async def record(self, timestamp: timedelta, dt: float) -> None: ...
+
+
+def is_async_controller(controller) -> bool:
+    """``True`` if *controller* has a coroutine ``read_block``."""
+    return inspect.iscoroutinefunction(getattr(controller, "read_block", None))
+
+
+def is_async_reporter(reporter) -> bool:
+    """``True`` if *reporter* has a coroutine ``record``."""
+    return inspect.iscoroutinefunction(getattr(reporter, "record", None))
+
+
+_END = object()
+
+
+def _read_or_end(controller: Controller):
+    # StopIteration cannot be set on a Future, so translate it in the worker thread
+    try:
+        return controller.read_block()
+    except StopIteration:
+        return _END
+
+
+class AsyncControllerAdapter:
+    """Runs a synchronous controller's blocking reads on a worker thread.
+
+    Each adapter owns a single-thread executor, so reads stay in order, a
+    controller that blocks (a sound card waiting for audio, a socket) never
+    holds up the event loop, and several adapters never compete for the
+    loop's default pool.  All other attributes are forwarded to the wrapped
+    controller.
+
+    As with the synchronous controllers, the returned block may be a reused
+    buffer that is only valid until the next :meth:`read_block`.
+    """
+
+    def __init__(self, controller: Controller):
+        self._controller = controller
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="slm-read")
+
+    @property
+    def controller(self) -> Controller:
+        """The wrapped synchronous controller."""
+        return self._controller
+
+    def __getattr__(self, name: str):
+        return getattr(self._controller, name)
+
+    async def read_block(self) -> tuple[np.ndarray, int]:
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(self._executor, _read_or_end, self._controller)
+        if result is _END:
+            raise StopAsyncIteration
+        return result
+
+    async def stop(self) -> None:
+        """Stop the wrapped controller and release the worker thread.
+
+        ``stop()`` is queued on the worker thread, behind any read still in
+        flight (e.g. after a cancelled :meth:`read_block`), so the controller
+        is never closed in the middle of a read.
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, self._controller.stop)
+        self.close()
+
+    def close(self) -> None:
+        """Release the worker thread without stopping the controller."""
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,214 @@
+"""Tee audio blocks to WAV/FLAC files without blocking the caller.
+
+:class:`CaptureWriter` hands blocks to a dedicated writer thread through a
+fixed pool of preallocated buffers.  :meth:`CaptureWriter.write` only copies
+into a free buffer and never waits on the disk: if the writer falls behind by
+more than the pool holds, the excess frames are dropped, counted, and written
+as silence once the disk catches up, so the recording keeps its timeline.
+
+Files can be rotated by duration and/or size; rotated files are named
+``<stem>_0001<suffix>``, ``<stem>_0002<suffix>`` … and can be measured again
+as one recording with :class:`~slm.io.segmented_controller.SegmentedFileController`.
+"""
+from __future__ import annotations
+
+import os
+import queue
+from math import ceil
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+
+from slm.io.writer_thread import WriterThread
+
+# FLAC cannot store floating point; everything else keeps the float32 samples bit-exact.
+_DEFAULT_SUBTYPE = {"FLAC": "PCM_24", "OGG": "VORBIS"}
+
+
+class CaptureWriter:
+    """Writes ``(frames, channels)`` blocks to disk on a background thread.
+
+    Parameters
+    ----------
+    path:
+        Output file; the format follows the suffix (``.wav``, ``.flac``,
+        ``.w64``, ``.rf64`` …).  With rotation, a counter is appended to the stem.
+    samplerate, channels:
+        Format of the blocks passed to :meth:`write`.
+    subtype:
+        libsndfile subtype (default ``'FLOAT'``, or ``'PCM_24'`` for FLAC).
+    rotate_seconds:
+        Start a new file every this many seconds of audio (exact to the sample).
+    rotate_bytes:
+        Start a new file once the current one reaches this size.
+    buffer_seconds:
+        Audio the pool holds while the disk is slow (default 10 s).
+    chunk_frames:
+        Frames per pool buffer.
+    """
+
+    written_frames: int = property(lambda self: self._written_frames)
+    dropped_frames: int = property(lambda self: self._dropped_frames)
+    drop_events: int = property(lambda self: self._drop_events)
+    files: list[Path] = property(lambda self: list(self._files))
+    closed: bool = property(lambda self: self._closed)
+
+    def __init__(self, path: str | Path, samplerate: int, channels: int = 1,
+                 subtype: str | None = None, rotate_seconds: float | None = None,
+                 rotate_bytes: int | None = None, buffer_seconds: float = 10.0,
+                 chunk_frames: int = 4096):
+        self._path = Path(path)
+        self._samplerate = samplerate
+        self._channels = channels
+        self._format = (self._path.suffix.lstrip(".") or "wav").upper()
+        if self._format not in sf.available_formats():
+            raise ValueError(f"Unsupported capture file type {self._path.suffix!r}")
+        self._subtype = subtype or _DEFAULT_SUBTYPE.get(self._format, "FLOAT")
+        if not sf.check_format(self._format, self._subtype):
+            raise ValueError(f"Subtype {self._subtype!r} is not valid for {self._format} files")
+        self._rotate = rotate_seconds is not None or rotate_bytes is not None
+        self._rotate_frames = round(rotate_seconds * samplerate) if rotate_seconds else None
+        self._rotate_bytes = rotate_bytes
+
+        n_buffers = max(2, ceil(buffer_seconds * samplerate / chunk_frames))
+        self._pool = np.zeros((n_buffers, chunk_frames, channels), dtype=np.float32)
+        self._free: queue.SimpleQueue[int] = queue.SimpleQueue()
+        for i in range(n_buffers):
+            self._free.put(i)
+
+        self._current: int | None = None   # pool buffer being filled by write()
+        self._current_gap = 0
+        self._fill = 0
+        self._pending_gap = 0
+        self._dropped_frames = 0
+        self._drop_events = 0
+        self._written_frames = 0
+        self._files: list[Path] = []
+        self._file: sf.SoundFile | None = None
+        self._file_frames = 0
+        self._closed = False
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        # after_error: buffers must still go back to the pool once writing has failed
+        self._writer = WriterThread("slm-capture", self._write_buffer, finish=self._finish,
+                                    after_error=True)
+
+    # ------------------------------------------------------------------
+    # Producer side
+    # ------------------------------------------------------------------
+
+    def write(self, block: np.ndarray) -> int:
+        """Queue ``(frames, channels)`` *block*; return the number of frames accepted.
+
+        Never blocks.  Blocks are packed into pool buffers, which go to the
+        writer thread as they fill up.  Frames that do not fit in the pool
+        are dropped and later written as silence.  After :meth:`close` this
+        is a no-op.
+        """
+        if self._closed:
+            return 0
+        n = len(block)
+        chunk = self._pool.shape[1]
+        pos = 0
+        while pos < n:
+            if self._current is None:
+                try:
+                    self._current = self._free.get_nowait()
+                except queue.Empty:
+                    lost = n - pos
+                    self._pending_gap += lost
+                    self._dropped_frames += lost
+                    self._drop_events += 1
+                    return pos
+                # Any gap so far precedes the first frame of this buffer
+                self._current_gap, self._pending_gap = self._pending_gap, 0
+                self._fill = 0
+            k = min(chunk - self._fill, n - pos)
+            self._pool[self._current, self._fill:self._fill + k] = block[pos:pos + k]
+            self._fill += k
+            pos += k
+            if self._fill == chunk:
+                self.flush()
+        return n
+
+    def flush(self) -> None:
+        """Hand the partly filled buffer to the writer thread now."""
+        if self._current is not None:
+            self._writer.put((self._current, self._fill, self._current_gap))
+            self._current = None
+
+    def close(self) -> None:
+        """Flush queued audio, finalise the file and stop the writer thread.
+
+        Re-raises any error the writer thread hit.
+        """
+        if not self._closed:
+            self.flush()
+            self._closed = True
+        self._writer.close()
+
+    def __enter__(self) -> "CaptureWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Writer thread
+    # ------------------------------------------------------------------
+
+    def _write_buffer(self, item: tuple[int, int, int]) -> None:
+        index, frames, gap = item
+        try:
+            if self._writer.error is None:
+                if gap:
+                    self._write_silence(gap)
+                self._write(self._pool[index, :frames])
+        finally:
+            self._free.put(index)
+
+    def _finish(self) -> None:
+        try:
+            if self._pending_gap and self._writer.error is None:
+                self._write_silence(self._pending_gap)
+        finally:
+            self._close_file()
+
+    def _write_silence(self, frames: int) -> None:
+        silence = np.zeros((min(frames, self._pool.shape[1]), self._channels), dtype=np.float32)
+        while frames > 0:
+            k = min(frames, len(silence))
+            self._write(silence[:k])
+            frames -= k
+
+    def _write(self, data: np.ndarray) -> None:
+        pos = 0
+        while pos < len(data):
+            if self._file is None:
+                self._open_next()
+            n = len(data) - pos
+            if self._rotate_frames is not None:
+                n = min(n, self._rotate_frames - self._file_frames)
+            self._file.write(data[pos:pos + n])
+            self._file_frames += n
+            self._written_frames += n
+            pos += n
+            if ((self._rotate_frames is not None and self._file_frames >= self._rotate_frames)
+                    or (self._rotate_bytes is not None
+                        and os.path.getsize(self._files[-1]) >= self._rotate_bytes)):
+                self._close_file()
+
+    def _open_next(self) -> None:
+        path = self._path
+        if self._rotate:
+            path = path.with_name(f"{path.stem}_{len(self._files) + 1:04d}{path.suffix}")
+        self._file = sf.SoundFile(str(path), "w", samplerate=self._samplerate,
+                                  channels=self._channels, format=self._format,
+                                  subtype=self._subtype)
+        self._files.append(path)
+        self._file_frames = 0
+
+    def _close_file(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
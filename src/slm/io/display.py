@@ -1,26 +1,162 @@
-"""Console display functions for Reporter callbacks."""
+"""Console display functions for Reporter callbacks.
+
+The bar display renders on its own thread: the callback
+:func:`make_display_fn` returns only stores the latest row and returns, and
+the display thread draws it at most *max_fps* times a second.  Rows that
+arrive faster are dropped, so a slow terminal never holds up the engine.
+
+The plain display prints every row, in order, from a background queue, so
+a slow pipe or journal reader never holds up the engine either.
+"""
 from __future__ import annotations
 
 import shutil
 import sys
+import threading
+import time
 from datetime import timedelta
 from typing import Callable
 
+import numpy as np
+
 from slm.io.reporter import _fmt_timestamp
+from slm.io.writer_thread import WriterThread
 
 
 def make_display_fn(mode: str, db_min: float = 40.0, db_max: float = 120.0,
-                    precision: int = 1) -> Callable:
+                    precision: int = 1, max_fps: float | None = 10.0) -> Callable:
     """Return a display callback for Reporter.
 
     The callback signature is ``fn(timestamp, broadband_row, band_row)`` where:
     - *timestamp* is a :class:`datetime.timedelta`
     - *broadband_row* is ``{label: float}`` (timestamp key excluded)
     - *band_row* is ``{label: np.ndarray}`` (timestamp key excluded)
+
+    The bar display is redrawn at most *max_fps* times a second (``None``:
+    after every row), independently of the logging interval.  The plain
+    display prints every row.  Call the callback's ``close()`` once the
+    measurement has ended to draw the last row and stop the display thread.
     """
     if mode == "bars" and sys.stdout.isatty():
-        return _BarDisplay(db_min, db_max, precision)
-    return _PlainDisplay(precision)
+        return _DisplayThread(_BarDisplay(db_min, db_max, precision), max_fps)
+    return _QueuedDisplay(_PlainDisplay(precision))
+
+
+def _copy_frame(timestamp: timedelta, broadband_row: dict, band_row: dict) -> tuple:
+    # Band rows may be views into the reporter's columns, which are reused
+    return timestamp, dict(broadband_row), {label: np.array(arr) for label, arr in band_row.items()}
+
+
+class _DisplayThread:
+    """Draws the most recent row with *render* on a background thread.
+
+    Calling the instance copies the row into a one-frame mailbox and wakes the
+    thread; a row still waiting there is replaced (and counted in
+    :attr:`dropped`), so the caller never waits for the terminal.
+    """
+
+    frames: int = property(lambda self: self._frames)
+    dropped: int = property(lambda self: self._dropped)
+    closed: bool = property(lambda self: self._closed)
+
+    def __init__(self, render: Callable, max_fps: float | None = 10.0) -> None:
+        if max_fps is not None and max_fps <= 0:
+            raise ValueError(f"max_fps must be positive, got {max_fps}")
+        self._render = render
+        self._interval = 1.0 / max_fps if max_fps else 0.0
+        self._lock = threading.Lock()
+        self._pending: tuple | None = None
+        self._wake = threading.Event()
+        self._closing = threading.Event()
+        self._frames = 0
+        self._dropped = 0
+        self._closed = False
+        self._error: BaseException | None = None
+        self._thread = threading.Thread(target=self._run, name="slm-display", daemon=True)
+        self._thread.start()
+
+    def __call__(self, timestamp: timedelta, broadband_row: dict, band_row: dict) -> None:
+        frame = _copy_frame(timestamp, broadband_row, band_row)
+        with self._lock:
+            if self._pending is not None:
+                self._dropped += 1
+            self._pending = frame
+        self._wake.set()
+
+    def _run(self) -> None:
+        next_frame = 0.0
+        while True:
+            if not self._closing.is_set():
+                self._wake.wait()
+            delay = next_frame - time.monotonic()
+            if delay > 0:
+                self._closing.wait(delay)      # close() cuts the wait short
+            with self._lock:
+                frame, self._pending = self._pending, None
+                self._wake.clear()
+            if frame is None:
+                if self._closing.is_set():
+                    return
+                continue
+            try:
+                self._render(*frame)
+            except BaseException as exc:       # reported from close(); rendering stops
+                self._error = exc
+                return
+            self._frames += 1
+            next_frame = time.monotonic() + self._interval
+
+    def close(self) -> None:
+        """Draw the last row, if not drawn yet, and stop the display thread.
+
+        Re-raises any error rendering hit.
+        """
+        if not self._closed:
+            self._closed = True
+            self._closing.set()
+            self._wake.set()
+            self._thread.join()
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def __enter__(self) -> "_DisplayThread":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class _QueuedDisplay:
+    """Draws every row with *render*, in order, on a background thread.
+
+    Unlike :class:`_DisplayThread` nothing is dropped: the caller only queues
+    a copy of the row.
+    """
+
+    closed: bool = property(lambda self: self._closed)
+
+    def __init__(self, render: Callable) -> None:
+        self._writer = WriterThread("slm-display", lambda frame: render(*frame))
+        self._closed = False
+
+    def __call__(self, timestamp: timedelta, broadband_row: dict, band_row: dict) -> None:
+        if not self._closed:
+            self._writer.put(_copy_frame(timestamp, broadband_row, band_row))
+
+    def close(self) -> None:
+        """Draw the queued rows and stop the display thread.
+
+        Re-raises any error rendering hit.
+        """
+        self._closed = True
+        self._writer.close()
+
+    def __enter__(self) -> "_QueuedDisplay":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
 
 
 class _PlainDisplay:
@@ -44,7 +180,11 @@ class _PlainDisplay:
 
 
 class _BarDisplay:
-    """Live-updating bar-graph console display."""
+    """Live-updating bar-graph console display.
+
+    Each line is kept as a list of ``(style, character)`` cells; a redraw
+    only rewrites the span of each line that differs from the screen.
+    """
 
     _GREEN  = "\x1b[32m"
     _YELLOW = "\x1b[33m"
@@ -59,7 +199,7 @@ class _BarDisplay:
         self._precision = precision
         self._threshold_lo = threshold_lo
         self._threshold_hi = threshold_hi
-        self._lines_printed = 0
+        self._screen: list[list[tuple[str, str]]] = []
 
     def __call__(self, timestamp: timedelta, broadband_row: dict,
                  band_row: dict) -> None:
@@ -71,7 +211,7 @@ class _BarDisplay:
         db_label_w = self._precision + 8   # e.g. "120.0 dB"
         bar_w = max(cols - label_w - db_label_w - 5, 10)
 
-        lines: list[str] = [ts_str]
+        lines: list[list[tuple[str, str]]] = [_cells(ts_str)]
         for label, val in broadband_row.items():
             clamped = max(self._db_min, min(self._db_max, val))
             fraction = (clamped - self._db_min) / (self._db_max - self._db_min)
@@ -84,16 +224,58 @@ class _BarDisplay:
             else:
                 color = self._RED
             db_str = fmt.format(val) + " dB"
-            lines.append(f"{label:<{label_w}} [{color}{bar}{self._RESET}]  {db_str}")
+            lines.append(_cells(f"{label:<{label_w}} [") + _cells(bar, color)
+                         + _cells(f"]  {db_str}"))
 
         # Band rows printed in plain style below the bars (too wide for bars)
         for label, arr in band_row.items():
             arr_str = "[" + ", ".join(fmt.format(v) for v in arr) + "]"
-            lines.append(f"{ts_str}  {label}: {arr_str}")
+            lines.append(_cells(f"{ts_str}  {label}: {arr_str}"))
+
+        out = self._redraw(lines) if len(lines) == len(self._screen) else self._draw(lines)
+        if out:
+            sys.stdout.write(out)
+            sys.stdout.flush()
+        self._screen = lines
+
+    def _draw(self, lines: list[list[tuple[str, str]]]) -> str:
+        """Clear the previous frame and write all of *lines*."""
+        out = f"\x1b[{len(self._screen)}A\r\x1b[J" if self._screen else ""
+        return out + "".join(self._span(line) + "\n" for line in lines)
+
+    def _redraw(self, lines: list[list[tuple[str, str]]]) -> str:
+        """Rewrite only the cells that differ from the frame on screen."""
+        parts: list[str] = []
+        row = len(lines)                   # the cursor rests on the line below the frame
+        for k, (old, new) in enumerate(zip(self._screen, lines)):
+            if old == new:
+                continue
+            first = next((i for i, (a, b) in enumerate(zip(old, new)) if a != b), min(len(old), len(new)))
+            if len(old) == len(new):
+                last = len(new) - next(i for i, (a, b) in enumerate(zip(old[::-1], new[::-1])) if a != b)
+                tail = ""
+            else:
+                last, tail = len(new), "\x1b[K"
+            parts.append(f"\x1b[{row - k}A" if row > k else f"\x1b[{k - row}B" if k > row else "")
+            parts.append(f"\x1b[{first + 1}G" + self._span(new[first:last]) + tail)
+            row = k
+        if not parts:
+            return ""
+        if row < len(lines):
+            parts.append(f"\x1b[{len(lines) - row}B")
+        return "".join(parts) + "\r"
+
+    def _span(self, cells: list[tuple[str, str]]) -> str:
+        out, style = [], ""
+        for cell_style, char in cells:
+            if cell_style != style:
+                out.append(cell_style or self._RESET)
+                style = cell_style
+            out.append(char)
+        if style:
+            out.append(self._RESET)
+        return "".join(out)
 
-        if self._lines_printed > 0:
-            sys.stdout.write(f"\x1b[{self._lines_printed}A")
 
-        sys.stdout.write("\n".join(lines) + "\n")
-        sys.stdout.flush()
-        self._lines_printed = len(lines)
+def _cells(text: str, style: str = "") -> list[tuple[str, str]]:
+    return [(style, char) for char in text]
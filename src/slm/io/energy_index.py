@@ -0,0 +1,237 @@
+"""Cumulative energy index for exact Leq / LE over any logged interval.
+
+While measuring, :class:`EnergyIndexWriter` appends one record per logged row
+with the running totals of every Leq / LE accumulator column: the sound
+exposure so far (``Σp² / fs / p₀²``, i.e. Pa²·s relative to p₀²) and the
+exact duration (samples / fs).  These are prefix sums, so the level of any
+interval between two logged rows follows from just those two records::
+
+    Leq = 10 log10((E[j] - E[i]) / (T[j] - T[i]))
+    LE  = 10 log10(E[j] - E[i])
+
+with no dB round-trip through the CSV log, however long the recording.
+
+A ``.slmi`` file is:
+
+* 8-byte magic ``b"\\x93SLMIDX\\x01"`` (last byte: format version);
+* ``uint32`` little-endian length of the metadata that follows;
+* UTF-8 JSON metadata, space-padded so the records start on a 64-byte
+  boundary: ``start`` (ISO wall-clock time of the first sample, or ``null``),
+  ``record`` (values per record) and one entry per column with its ``label``,
+  ``channel``, ``bands`` and ``offset`` into the record;
+* ``<f8`` records ``[T, E(col 1) …, E(col 2) …]``, starting with an all-zero
+  record for the start of the measurement.
+
+Records are only ever appended, so the row count follows from the file size
+and a file cut short by a crash is still readable.  They are written by a
+background thread, so the engine thread never waits on the disk.
+"""
+from __future__ import annotations
+
+import json
+import os
+import struct
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+from slm.io.writer_thread import WriterThread
+
+MAGIC = b"\x93SLMIDX\x01"
+
+_ALIGN = 64
+
+
+class IndexColumn(NamedTuple):
+    """One indexed column: label, 1-based channel, band centres (``None``: broadband), width."""
+    label: str
+    channel: int | None
+    bands: list | None
+    width: int
+
+
+class EnergyIndexWriter:
+    """Appends cumulative-energy records to a ``.slmi`` file.
+
+    Created by :meth:`Reporter.add_energy_index
+    <slm.io.reporter.Reporter.add_energy_index>`, which opens it with the
+    indexed columns and appends a record for every logged row.
+
+    Parameters
+    ----------
+    path:
+        Output file.
+    start:
+        Wall-clock time of the first sample, stored so intervals can be
+        queried by time of day.
+    flush_interval:
+        Seconds between flushes of the written records to the file.
+    """
+
+    path: Path = property(lambda self: self._path)
+    rows_written: int = property(lambda self: self._rows_written)
+    closed: bool = property(lambda self: self._closed)
+
+    def __init__(self, path: str | Path, start: datetime | None = None, flush_interval: float = 1.0):
+        self._path = Path(path)
+        self._start = start
+        self._flush_interval = flush_interval
+        self._file = None
+        self._writer: WriterThread | None = None
+        self._rows_written = 0
+        self._closed = False
+
+    def open(self, columns: list[IndexColumn]) -> None:
+        """Write the header and the zero record for *columns*."""
+        if self._file is not None:
+            raise RuntimeError("EnergyIndexWriter is already open")
+        entries, offset = [], 1
+        for column in columns:
+            entries.append({"label": column.label, "channel": column.channel,
+                            "bands": None if column.bands is None else [str(b) for b in column.bands],
+                            "offset": offset, "width": column.width})
+            offset += column.width
+        meta = json.dumps({"start": self._start.isoformat() if self._start else None,
+                           "record": offset, "columns": entries}).encode()
+        meta += b" " * (-(len(MAGIC) + 4 + len(meta)) % _ALIGN)
+
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self._path, "wb")
+        self._file.write(MAGIC)
+        self._file.write(struct.pack("<I", len(meta)))
+        self._file.write(meta)
+        self._file.write(np.zeros(offset, dtype="<f8").tobytes())
+        self._writer = WriterThread("slm-energy-index", self._write_record, flush=self._file.flush,
+                                    finish=self._file.close, flush_interval=self._flush_interval)
+
+    def append(self, seconds: float, exposure: np.ndarray) -> None:
+        """Queue the record for a row ending *seconds* into the measurement; never waits for the disk."""
+        if not self._closed:
+            self._writer.put(np.concatenate(([seconds], exposure)).astype("<f8").tobytes())
+
+    def flush(self) -> None:
+        """Write all queued records to the file now, and wait until done."""
+        if self._writer is not None and not self._closed:
+            self._writer.flush()
+
+    def close(self) -> None:
+        """Write the remaining records, close the file and stop the thread.
+
+        Re-raises any error the writer thread hit.
+        """
+        self._closed = True
+        if self._writer is not None:
+            self._writer.close()
+        elif self._file is not None:
+            self._file.close()
+
+    def __enter__(self) -> "EnergyIndexWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _write_record(self, record: bytes) -> None:
+        self._file.write(record)
+        self._rows_written += 1
+
+
+class EnergyIndex:
+    """Memory-mapped reader for ``.slmi`` files.
+
+    Interval boundaries are snapped to the nearest logged row (see
+    :meth:`interval`), and a query reads two records, so it costs the same
+    for a minute-long file as for a year-long one::
+
+        index = EnergyIndex("output/site_energy.slmi")
+        index.leq("LAeq", 3780, 9420)                  # seconds from the start
+        index.le("LZeq:bands:1/3", timedelta(hours=1), timedelta(hours=2))
+    """
+
+    rows: int = property(lambda self: len(self._records))
+    labels: list[str] = property(lambda self: list(self._columns))
+    start: datetime | None = property(lambda self: self._start)
+
+    def __init__(self, path: str | Path):
+        self._path = Path(path)
+        with open(self._path, "rb") as f:
+            magic = f.read(len(MAGIC))
+            if magic[:-1] != MAGIC[:-1]:
+                raise ValueError(f"{self._path} is not an SLM energy index")
+            if magic[-1] != MAGIC[-1]:
+                raise ValueError(f"{self._path}: unsupported energy index version {magic[-1]}")
+            (length,) = struct.unpack("<I", f.read(4))
+            meta = json.loads(f.read(length))
+        data_start = len(MAGIC) + 4 + length
+        record = meta["record"]
+        rows = (os.path.getsize(self._path) - data_start) // (record * 8)   # drops a partial record
+        self._start = datetime.fromisoformat(meta["start"]) if meta["start"] else None
+        self._columns = {c["label"]: c for c in meta["columns"]}
+        self._records = np.memmap(self._path, dtype="<f8", mode="r", offset=data_start,
+                                  shape=(rows, record))
+
+    def seconds(self) -> np.ndarray:
+        """Time of each row boundary, in seconds from the start (first is ``0``)."""
+        return self._records[:, 0]
+
+    def exposure(self, label: str) -> np.ndarray:
+        """Cumulative exposure of column *label* at each boundary (Pa²·s / p₀²)."""
+        column = self._columns[label]
+        values = self._records[:, column["offset"]:column["offset"] + column["width"]]
+        return values if column["bands"] is not None else values[:, 0]
+
+    def bands(self, label: str) -> list[str] | None:
+        """Centre frequencies of band column *label* (``None`` for broadband)."""
+        return self._columns[label]["bands"]
+
+    def channel(self, label: str) -> int | None:
+        """1-based input channel of column *label*, or ``None``."""
+        return self._columns[label]["channel"]
+
+    def interval(self, start: float | timedelta, end: float | timedelta) -> tuple[float, float]:
+        """The logged interval queries for *start* – *end* actually cover, in seconds."""
+        i, j = self._rows(start, end)
+        seconds = self.seconds()
+        return float(seconds[i]), float(seconds[j])
+
+    def leq(self, label: str, start: float | timedelta, end: float | timedelta) -> float | np.ndarray:
+        """Equivalent level of column *label* over *start* – *end* (dB)."""
+        i, j = self._rows(start, end)
+        seconds = self.seconds()
+        return self._db(self._energy(label, i, j) / (seconds[j] - seconds[i]))
+
+    def le(self, label: str, start: float | timedelta, end: float | timedelta) -> float | np.ndarray:
+        """Sound exposure level of column *label* over *start* – *end* (dB re 1 s)."""
+        i, j = self._rows(start, end)
+        return self._db(self._energy(label, i, j))
+
+    def _energy(self, label: str, i: int, j: int) -> np.ndarray:
+        exposure = self.exposure(label)
+        return np.asarray(exposure[j], dtype=float) - exposure[i]
+
+    @staticmethod
+    def _db(value: np.ndarray) -> float | np.ndarray:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            level = 10.0 * np.log10(value)
+        return float(level) if np.ndim(level) == 0 else level
+
+    def _rows(self, start: float | timedelta, end: float | timedelta) -> tuple[int, int]:
+        i, j = self._nearest(start), self._nearest(end)
+        if j <= i:
+            raise ValueError(
+                f"Interval {start} – {end} covers no logged interval "
+                f"(the index has {self.rows - 1} rows over {self.seconds()[-1]:.3f} s)"
+            )
+        return i, j
+
+    def _nearest(self, t: float | timedelta) -> int:
+        """Row of the boundary closest to *t* (binary search over the mapped times)."""
+        if isinstance(t, timedelta):
+            t = t.total_seconds()
+        seconds = self.seconds()
+        k = int(np.searchsorted(seconds, t))
+        if k == len(seconds) or (k > 0 and t - seconds[k - 1] <= seconds[k] - t):
+            k -= 1
+        return k
@@ -0,0 +1,310 @@
+"""Threshold-triggered noise events with pre-trigger audio.
+
+An :class:`EventDetector` watches broadband reporter columns (``LAF``,
+``LAeq_1m`` …) after every block and opens an event while any of them is
+above its limit.  Each event records its start and stop, the peak of every
+watched column, the SEL over the exceedance and an audio snippet of the raw
+input, including *pre_seconds* from before the trigger::
+
+    detector = EventDetector(engine, [("LAF", 85.0), ("LAeq_1m", 70.0)],
+                             "output/site", pre_seconds=5.0)
+    engine.run()
+    detector.close()
+
+The last *pre_seconds* of input are always held in a preallocated circular
+buffer; while no event is active, a block costs one copy into that buffer
+and one comparison per trigger.  Snippets and the ``_events.csv`` rows are
+written by a background thread, so the engine thread never waits on the
+disk.
+"""
+from __future__ import annotations
+
+import csv
+import re
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+import soundfile as sf
+
+from slm.io.capture import _DEFAULT_SUBTYPE
+from slm.io.reporter import _fmt_timestamp
+from slm.io.writer_thread import WriterThread
+
+if TYPE_CHECKING:
+    from slm.engine import Engine
+
+_TRIGGER = re.compile(r"^\s*(\S+?)\s*>\s*(-?\d+(\.\d+)?)\s*$")
+
+
+def parse_trigger(text: str) -> tuple[str, float]:
+    """Parse ``'LAF>85'`` into ``('LAF', 85.0)``."""
+    match = _TRIGGER.match(text)
+    if match is None:
+        raise ValueError(f"Invalid event trigger {text!r}. Expected METRIC>LIMIT, e.g. 'LAF>85'.")
+    return match.group(1), float(match.group(2))
+
+
+class Event(NamedTuple):
+    """One exceedance.  Times are seconds from the start of the measurement."""
+    number: int
+    start: float
+    stop: float
+    trigger: str
+    """Label of the column that opened the event."""
+    peaks: dict[str, float]
+    """Highest value of each watched column during the event."""
+    sel: float
+    """Sound exposure level over ``start`` – ``stop`` (NaN without an exposure column)."""
+    audio: Path | None
+
+
+class EventDetector:
+    """Opens an event while any watched column is above its limit.
+
+    Parameters
+    ----------
+    engine:
+        The engine to attach to; the trigger columns must already be in
+        ``engine.reporter`` (build the chain first).
+    triggers:
+        ``(label, limit)`` pairs, e.g. from :func:`parse_trigger`.
+    path:
+        Output base path: events go to ``<path>_events.csv`` and snippets
+        to ``<path>_event_0001.flac`` …
+    pre_seconds:
+        Audio kept from before the trigger.
+    hold_seconds:
+        An event ends once every column has stayed at or below its limit
+        this long; the snippet includes this tail.
+    exposure:
+        Broadband Leq / LE column the SEL is derived from, or a
+        ``{trigger: column}`` mapping, so that each event's SEL comes from the
+        column matching the trigger that opened it (triggers left out get no
+        SEL).  Default: the first broadband column in
+        :attr:`Reporter.energy_labels <slm.io.reporter.Reporter.energy_labels>`.
+    audio:
+        Snippet file type (``'flac'``, ``'wav'`` …), or ``None`` for no audio.
+    start:
+        Wall-clock time of the first sample; ``_events.csv`` then gives
+        wall-clock times instead of offsets.
+
+    :attr:`events` lists the events that have ended so far; their snippets
+    may still be being written until :meth:`close`.
+    """
+
+    events: list[Event] = property(lambda self: list(self._events))
+    active: bool = property(lambda self: self._active)
+    closed: bool = property(lambda self: self._closed)
+
+    def __init__(self, engine: Engine, triggers: list[tuple[str, float]], path: str | Path,
+                 pre_seconds: float = 5.0, hold_seconds: float = 2.0,
+                 exposure: str | dict[str, str] | None = None, audio: str | None = "flac",
+                 start: datetime | None = None):
+        if not triggers:
+            raise ValueError("At least one trigger is required")
+        reporter = engine.reporter
+        columns = {label: (plugin, meter) for label, plugin, meter in reporter._broadband_columns}
+        self._triggers = []
+        for label, limit in triggers:
+            if label not in columns:
+                raise ValueError(f"Event trigger {label!r} is not a broadband metric of the measurement")
+            self._triggers.append((label, columns[label][0], columns[label][1], limit))
+        self._labels = [label for label, _ in triggers]
+
+        energy = {label: meter for label, _, meter, freqs in reporter._energy_columns if freqs is None}
+        if not isinstance(exposure, dict):
+            if exposure is None:
+                exposure = next(iter(energy), None)
+            exposure = {} if exposure is None else dict.fromkeys(self._labels, exposure)
+        self._meters = []              # distinct exposure meters, read after every block
+        self._exposure_of: dict[str, int] = {}
+        for label, column in exposure.items():
+            if label not in self._labels:
+                raise ValueError(f"Exposure given for {label!r}, which is not an event trigger")
+            if column not in energy:
+                raise ValueError(f"Exposure column {column!r} is not a broadband Leq or LE metric")
+            meter = energy[column]
+            if not any(m is meter for m in self._meters):
+                self._meters.append(meter)
+            self._exposure_of[label] = next(k for k, m in enumerate(self._meters) if m is meter)
+
+        self._path = Path(path)
+        self._start = start
+        self._samplerate = engine.input_samplerate
+        channels = engine.channels or 1
+        self._format = audio.upper() if audio else None
+        self._pre_frames = round(pre_seconds * self._samplerate)
+        self._hold_frames = round(hold_seconds * self._samplerate)
+        self._history = np.zeros((max(1, self._pre_frames), channels), dtype=np.float32)
+        self._history_pos = 0          # total frames written to the history
+
+        self._frames = 0               # input frames seen
+        self._active = False
+        self._number = 0
+        self._event_start = 0
+        self._last_exceed = 0
+        self._event_trigger = ""
+        self._audio_path: Path | None = None
+        self._peaks: dict[str, float] = {}
+        self._energy_before = np.zeros(len(self._meters))   # running exposures after the previous block
+        self._sel_meter: int | None = None                   # exposure meter of the active event
+        self._energy_start = 0.0
+        self._energy_stop = 0.0
+        self._events: list[Event] = []
+        self._closed = False
+
+        self._snippet: sf.SoundFile | None = None
+        self._log = None
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._writer = WriterThread("slm-events", self._write_item, finish=self._close_files)
+        engine.add_listener(self.process)
+
+    # ------------------------------------------------------------------
+    # Engine thread
+    # ------------------------------------------------------------------
+
+    def process(self, block: np.ndarray) -> None:
+        """Feed one raw ``(frames, channels)`` input block, after the meters have processed it."""
+        if self._closed:
+            return
+        n = len(block)
+        block_start, self._frames = self._frames, self._frames + n
+        exceeding = None
+        for label, plugin, meter, limit in self._triggers:
+            level = float(plugin.read_db(meter)[0])
+            if level > limit:
+                exceeding = exceeding or label
+            if self._active and level > self._peaks[label]:
+                self._peaks[label] = level
+        energy = self._read_energy()
+
+        if not self._active and exceeding is not None:
+            self._open(exceeding, block_start)
+        if self._active:
+            if self._format is not None:
+                self._writer.put(("audio", np.array(block, dtype=np.float32)))
+            if exceeding is not None:
+                self._last_exceed = self._frames
+                if self._sel_meter is not None:
+                    self._energy_stop = energy[self._sel_meter]
+            elif self._frames - self._last_exceed >= self._hold_frames:
+                self._close_event()
+        self._remember(block)
+        self._energy_before = energy
+
+    def _read_energy(self) -> np.ndarray:
+        return np.array([meter.sum_sq[0] for meter in self._meters], dtype=float)
+
+    def _remember(self, block: np.ndarray) -> None:
+        """Copy the tail of *block* into the circular pre-trigger history."""
+        size = len(self._history)
+        block = block[-size:]
+        start = self._history_pos % size
+        first = min(len(block), size - start)
+        self._history[start:start + first] = block[:first]
+        self._history[:len(block) - first] = block[first:]
+        self._history_pos += len(block)
+
+    def _open(self, trigger: str, block_start: int) -> None:
+        self._active = True
+        self._number += 1
+        self._event_start = block_start
+        self._event_trigger = trigger
+        self._peaks = {label: float(plugin.read_db(meter)[0])
+                       for label, plugin, meter, _ in self._triggers}
+        self._sel_meter = self._exposure_of.get(trigger)
+        if self._sel_meter is not None:
+            self._energy_start = self._energy_stop = self._energy_before[self._sel_meter]
+        if self._format is not None:
+            pre = min(self._pre_frames, self._history_pos)
+            order = np.arange(self._history_pos - pre, self._history_pos) % len(self._history)
+            self._audio_path = (self._path.parent
+                                / f"{self._path.name}_event_{self._number:04d}.{self._format.lower()}")
+            self._writer.put(("open", self._audio_path, self._history[order]))
+
+    def _close_event(self) -> None:
+        from slm.constants import REFERENCE_PRESSURE
+
+        self._active = False
+        sel = float("nan")
+        if self._sel_meter is not None:
+            meter = self._meters[self._sel_meter]
+            energy = (self._energy_stop - self._energy_start) / (
+                meter.samplerate * (REFERENCE_PRESSURE * meter.parent.sensitivity) ** 2)
+            sel = float(10.0 * np.log10(energy)) if energy > 0 else float("-inf")
+        fs = self._samplerate
+        event = Event(self._number, self._event_start / fs, self._last_exceed / fs,
+                      self._event_trigger, dict(self._peaks), sel, self._audio_path)
+        self._events.append(event)
+        self._writer.put(("close", event))
+
+    # ------------------------------------------------------------------
+    # Control
+    # ------------------------------------------------------------------
+
+    def close(self) -> None:
+        """End an active event, write everything queued and stop the writer thread.
+
+        Re-raises any error the writer thread hit.
+        """
+        if not self._closed:
+            if self._active:
+                self._close_event()
+            self._closed = True
+        self._writer.close()
+
+    def __enter__(self) -> "EventDetector":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Writer thread
+    # ------------------------------------------------------------------
+
+    def _write_item(self, item: tuple) -> None:
+        kind = item[0]
+        if kind == "open":
+            _, path, pre = item
+            self._snippet = sf.SoundFile(str(path), "w", samplerate=self._samplerate,
+                                         channels=pre.shape[1], format=self._format,
+                                         subtype=_DEFAULT_SUBTYPE.get(self._format, "FLOAT"))
+            self._snippet.write(pre)
+        elif kind == "audio":
+            self._snippet.write(item[1])
+        else:
+            if self._snippet is not None:
+                self._snippet.close()
+                self._snippet = None
+            if self._log is None:
+                self._log = self._open_log()
+            self._write_event(self._log, item[1])
+
+    def _close_files(self) -> None:
+        if self._snippet is not None:
+            self._snippet.close()
+        if self._log is not None:
+            self._log.close()
+
+    def _open_log(self):
+        f = open(self._path.parent / f"{self._path.name}_events.csv", "w", newline="")
+        csv.writer(f).writerow(["event", "start", "stop", "duration", "trigger"]
+                               + [f"{label}_max" for label in self._labels] + ["SEL", "audio"])
+        return f
+
+    def _write_event(self, f, event: Event) -> None:
+        csv.writer(f).writerow(
+            [event.number, self._fmt_time(event.start), self._fmt_time(event.stop),
+             f"{event.stop - event.start:.3f}", event.trigger]
+            + [f"{event.peaks[label]:.1f}" for label in self._labels]
+            + [f"{event.sel:.1f}", event.audio.name if event.audio else ""]
+        )
+        f.flush()
+
+    def _fmt_time(self, seconds: float) -> str:
+        if self._start is None:
+            return _fmt_timestamp(timedelta(seconds=seconds))
+        return (self._start + timedelta(seconds=seconds)).isoformat(sep=" ", timespec="milliseconds")
@@ -1,4 +1,7 @@
+import queue
+import threading
 import time
+from math import ceil
 from pathlib import Path
 from typing import Generator
 
@@ -9,8 +12,18 @@ from slm.io.controller import Controller
 
 
 class FileController(Controller):
+    """Reads blocks from any file libsndfile can decode.
+
+    With ``prefetch`` > 0, a background thread reads chunks of roughly
+    *prefetch* seconds into a pool of ``prefetch_depth`` reusable buffers,
+    and :meth:`read_block` hands out block views into them.  Decoding then
+    overlaps with processing.  Blocks are only valid until the next
+    :meth:`read_block` call in this mode.
+    """
+
     blocksize: int = property(lambda self: self._blocksize)
     samplerate: int = property(lambda self: self._sf.samplerate)
+    channels: int = property(lambda self: self._sf.channels)
     sensitivity: float = property(lambda self: self._sensitivity)
     done: bool = property(lambda self: self._done)
 
@@ -25,16 +38,21 @@ class FileController(Controller):
 
 
     def __init__(self, filename: str | Path, blocksize: int = 256, overlap: int = 0,
-                 realtime: bool = False, **kwargs):
+                 realtime: bool = False, prefetch: float = 0.0, prefetch_depth: int = 3,
+                 **kwargs):
         super().__init__(**kwargs)
         self._sf = None
         self._realtime = realtime
+        self._prefetch = prefetch
+        self._prefetch_depth = max(2, prefetch_depth)
+        self._prefetch_thread: threading.Thread | None = None
         self._next_block_time: float | None = None
         self.open(filename, blocksize=blocksize, overlap=overlap)
 
     def open(self, filename: str | Path, *, blocksize: int, overlap: int = 0):
         if self._sf and not self.done:
             raise RuntimeError("File has not been finished.")
+        self._stop_prefetch()
         self._done = False
 
         if not isinstance(filename, str):
@@ -44,8 +62,11 @@ class FileController(Controller):
         self._overlap = overlap
         self._filename = filename
         self._sf = sf.SoundFile(filename)
-        self._stream = self._sf.blocks(blocksize=self._blocksize, overlap=self._overlap,
-                                       fill_value=0.0, always_2d=True)
+        if self._prefetch > 0:
+            self._stream = self._start_prefetch()
+        else:
+            self._stream = self._sf.blocks(blocksize=self._blocksize, overlap=self._overlap,
+                                           fill_value=0.0, always_2d=True)
         self._next_block_time = None  # reset on (re-)open
 
     def read_block(self) -> tuple[np.ndarray, int]:
@@ -68,4 +89,87 @@ class FileController(Controller):
 
     def stop(self):
         self._done = True
+        self._stop_prefetch()
         self._sf.close()
+
+    # ------------------------------------------------------------------
+    # Read-ahead
+    # ------------------------------------------------------------------
+    # Chunk c holds blocks c*K … c*K+K-1, i.e. K*step + overlap samples; the
+    # first `overlap` samples of every chunk after the first repeat the tail of
+    # the previous one, so each block is a contiguous view into one buffer.
+    # Block counts and zero padding match SoundFile.blocks(fill_value=0.0).
+
+    def _start_prefetch(self) -> Generator[np.ndarray, None, None]:
+        step = self._blocksize - self._overlap
+        chunk_blocks = max(1, round(self._prefetch * self._sf.samplerate / step))
+        shape = (chunk_blocks * step + self._overlap, self._sf.channels)
+
+        free: queue.Queue = queue.Queue()
+        for _ in range(self._prefetch_depth):
+            free.put(np.empty(shape))
+        filled: queue.Queue = queue.Queue()
+        stop_event = threading.Event()
+
+        self._prefetch_stop = stop_event
+        self._prefetch_thread = threading.Thread(
+            target=self._prefetch_loop, args=(free, filled, stop_event, chunk_blocks),
+            name="FileController-prefetch", daemon=True,
+        )
+        self._prefetch_thread.start()
+        return self._prefetched_blocks(filled, free)
+
+    def _prefetch_loop(self, free: queue.Queue, filled: queue.Queue,
+                       stop_event: threading.Event, chunk_blocks: int) -> None:
+        step = self._blocksize - self._overlap
+        overlap = self._overlap
+        first = True
+        tail = np.empty((overlap, self._sf.channels))
+        try:
+            while not stop_event.is_set():
+                try:
+                    buf = free.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                offset = 0 if first else overlap
+                if offset:
+                    buf[:offset] = tail
+                n = len(self._sf.read(len(buf) - offset, always_2d=True, out=buf[offset:]))
+                buf[offset + n:] = 0.0
+                valid = offset + n
+
+                n_blocks = min(chunk_blocks, ceil((valid - overlap) / step)) if valid > overlap else 0
+                if first and valid > 0:
+                    n_blocks = max(1, n_blocks)
+                if n_blocks:
+                    filled.put((buf, n_blocks))
+                if n < len(buf) - offset:
+                    break
+                if overlap:
+                    tail[:] = buf[-overlap:]
+                first = False
+        except BaseException as exc:  # surfaced on the engine thread by read_block
+            filled.put(exc)
+            return
+        filled.put(None)
+
+    def _prefetched_blocks(self, filled: queue.Queue,
+                           free: queue.Queue) -> Generator[np.ndarray, None, None]:
+        step = self._blocksize - self._overlap
+        while True:
+            item = filled.get()
+            if item is None:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            buf, n_blocks = item
+            for i in range(n_blocks):
+                yield buf[i * step:i * step + self._blocksize]
+            free.put(buf)   # the engine is done with the previous block
+
+    def _stop_prefetch(self) -> None:
+        if self._prefetch_thread is None:
+            return
+        self._prefetch_stop.set()
+        self._prefetch_thread.join()
+        self._prefetch_thread = None
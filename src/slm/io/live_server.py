@@ -0,0 +1,353 @@
+"""Local HTTP endpoint serving the live levels to monitoring tools.
+
+:class:`LiveServer` is a :class:`~slm.io.reporter.Reporter` sink.  Every
+recorded row replaces one immutable snapshot (the row, its timestamp and the
+engine's health counters); HTTP requests are answered from whatever snapshot
+is current, on the server's own threads, so scraping takes no lock the
+engine thread could wait on::
+
+    server = LiveServer(engine, "127.0.0.1:8765")     # or "unix:/run/slm.sock"
+    engine.reporter.add_sink(server)
+    engine.run()
+    server.close()
+
+Endpoints:
+
+``/levels``
+    Latest value of every column as JSON.
+``/metrics``
+    The same in Prometheus text exposition format, plus the health counters.
+``/health``
+    Real-time factor, overruns, rows recorded … as JSON.
+``/stream``
+    Server-sent events: one ``data:`` line of ``/levels`` JSON per row
+    (a client that falls behind gets the latest row, not a backlog).
+"""
+from __future__ import annotations
+
+import json
+import math
+import os
+import re
+import socketserver
+import stat
+import threading
+import time
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+
+from slm.io.reporter import FileGroup, _fmt_timestamp
+
+if TYPE_CHECKING:
+    from slm.engine import Engine
+
+# Seconds between keep-alive comments on an idle /stream connection
+_KEEPALIVE = 15.0
+
+_CHANNEL_PREFIX = re.compile(r"^ch\d+/")
+
+
+def parse_address(address: str | int) -> tuple[str, int] | str:
+    """``'8765'`` / ``'host:8765'`` → ``(host, port)``; ``'unix:PATH'`` → ``PATH``."""
+    text = str(address)
+    if text.startswith("unix:"):
+        return text[len("unix:"):]
+    host, _, port = text.rpartition(":")
+    try:
+        return host.strip("[]") or "127.0.0.1", int(port)
+    except ValueError:
+        raise ValueError(f"Invalid server address {text!r}. "
+                         f"Expected PORT, HOST:PORT or unix:PATH.") from None
+
+
+class _Snapshot(NamedTuple):
+    sequence: int
+    timestamp: timedelta
+    row: np.ndarray
+    health: dict
+    recorded: float          # time.monotonic() when the row arrived
+
+
+class LiveServer:
+    """Serves the latest reporter row over HTTP on a TCP port or a Unix socket.
+
+    Parameters
+    ----------
+    engine:
+        The running engine; its reporter's columns are served, and its
+        processing time and overruns are reported as health.
+    address:
+        ``'HOST:PORT'``, ``'PORT'`` (on localhost) or ``'unix:PATH'``.
+        Port ``0`` picks a free port; see :attr:`address`.
+
+    Add the server to the reporter with :meth:`Reporter.add_sink
+    <slm.io.reporter.Reporter.add_sink>` and :meth:`close` it when the
+    measurement ends.
+    """
+
+    address: tuple[str, int] | str = property(lambda self: self._address)
+    closed: bool = property(lambda self: self._closed)
+
+    def __init__(self, engine: Engine, address: str | int = "127.0.0.1:8765"):
+        self._engine = engine
+        self._reporter = engine.reporter
+        self._broadband: list[tuple[str, str, int | None]] = []
+        self._bands: list[tuple[str, str, int | None, list[str], slice]] = []
+        self._precision = 1
+        self._snapshot: _Snapshot | None = None
+        self._updated = threading.Event()
+        self._closed = False
+
+        target = parse_address(address)
+        if isinstance(target, str):
+            if os.path.exists(target):
+                if not stat.S_ISSOCK(os.stat(target).st_mode):
+                    raise FileExistsError(f"{target} exists and is not a Unix socket")
+                os.unlink(target)   # left over from a previous run
+            self._server = _UnixHTTPServer(target, _Handler)
+            self._address = target
+        else:
+            self._server = ThreadingHTTPServer(target, _Handler)
+            self._address = self._server.server_address[:2]
+        self._server.live = self
+        self._thread = threading.Thread(target=self._server.serve_forever, kwargs={"poll_interval": 0.1},
+                                        name="slm-live-server", daemon=True)
+        self._thread.start()
+
+    @property
+    def url(self) -> str:
+        """Base URL of the server (``unix:PATH`` for a Unix socket)."""
+        if isinstance(self._address, str):
+            return f"unix:{self._address}"
+        host, port = self._address
+        return f"http://{f'[{host}]' if ':' in host else host}:{port}"
+
+    # ------------------------------------------------------------------
+    # Sink interface (engine thread)
+    # ------------------------------------------------------------------
+
+    def open(self, groups: list[FileGroup], precision: int) -> None:
+        """Take the column layout of the rows to come."""
+        r = self._reporter
+        self._precision = precision
+        pos = 0
+        for label in r._broadband_data:
+            self._broadband.append((label, _metric_name(label), r._column_channels.get(label)))
+            pos += 1
+        freqs = {label: f for label, _, _, f in r._band_columns}
+        for label, data in r._band_data.items():
+            width = data.shape[1]
+            self._bands.append((label, _metric_name(label), r._column_channels.get(label),
+                                [str(f) for f in freqs[label]], slice(pos, pos + width)))
+            pos += width
+
+    def append(self, timestamp: timedelta, row: np.ndarray) -> None:
+        """Publish *row* as the current snapshot and wake the /stream clients."""
+        engine = self._engine
+        previous = self._snapshot
+        processed, processing = engine.processed_seconds, engine.processing_seconds
+        health = {"rows": 1 if previous is None else previous.health["rows"] + 1,
+                  "measured_seconds": timestamp.total_seconds(),
+                  "processed_seconds": processed,
+                  "processing_seconds": processing,
+                  "overruns": engine.overruns}
+        if previous is not None and processed > previous.health["processed_seconds"]:
+            health["realtime_factor"] = ((processing - previous.health["processing_seconds"])
+                                         / (processed - previous.health["processed_seconds"]))
+        else:
+            health["realtime_factor"] = processing / processed if processed else 0.0
+        self._snapshot = _Snapshot(0 if previous is None else previous.sequence + 1,
+                                   timestamp, row, health, time.monotonic())
+        # Swap in a fresh event before setting the old one, so waiters never miss a row
+        updated, self._updated = self._updated, threading.Event()
+        updated.set()
+
+    # ------------------------------------------------------------------
+    # Rendering (server threads)
+    # ------------------------------------------------------------------
+
+    def levels(self, snapshot: _Snapshot | None = None) -> dict:
+        """The latest row as a JSON-ready dict."""
+        snapshot = snapshot or self._snapshot
+        if snapshot is None:
+            return {"timestamp": None, "seconds": None, "broadband": {}, "bands": {}}
+        row = snapshot.row
+        return {
+            "timestamp": _fmt_timestamp(snapshot.timestamp),
+            "seconds": snapshot.timestamp.total_seconds(),
+            "broadband": {label: self._value(row[k]) for k, (label, _, _) in enumerate(self._broadband)},
+            "bands": {label: {"frequencies": freqs, "levels": [self._value(v) for v in row[where]]}
+                      for label, _, _, freqs, where in self._bands},
+        }
+
+    def health(self) -> dict:
+        """Engine health as a JSON-ready dict."""
+        snapshot = self._snapshot
+        if snapshot is None:
+            return {"rows": 0, "overruns": self._engine.overruns, "last_row_age_seconds": None}
+        health = dict(snapshot.health)
+        health["last_row_age_seconds"] = round(time.monotonic() - snapshot.recorded, 3)
+        return health
+
+    def metrics(self) -> str:
+        """Prometheus text exposition of the latest row and the health counters."""
+        snapshot = self._snapshot
+        health = self.health()
+        lines = []
+
+        def family(name: str, kind: str, text: str) -> None:
+            lines.extend([f"# HELP {name} {text}", f"# TYPE {name} {kind}"])
+
+        if snapshot is not None:
+            row = snapshot.row
+            if self._broadband:
+                family("slm_level_db", "gauge", "Latest logged level of each broadband metric")
+                for k, (_, name, channel) in enumerate(self._broadband):
+                    lines.append(f"slm_level_db{_labels(metric=name, channel=channel)} {_number(row[k])}")
+            if self._bands:
+                family("slm_band_level_db", "gauge", "Latest logged level of each band")
+                for _, name, channel, freqs, where in self._bands:
+                    for freq, value in zip(freqs, row[where]):
+                        lines.append(f"slm_band_level_db{_labels(metric=name, channel=channel, band=freq)} "
+                                     f"{_number(value)}")
+            family("slm_measured_seconds", "gauge", "Timestamp of the latest logged row")
+            lines.append(f"slm_measured_seconds {_number(snapshot.timestamp.total_seconds())}")
+            family("slm_realtime_factor", "gauge",
+                   "Processing time per second of input over the latest row (1 = just keeping up)")
+            lines.append(f"slm_realtime_factor {_number(health['realtime_factor'])}")
+            family("slm_processed_seconds_total", "counter", "Seconds of input processed")
+            lines.append(f"slm_processed_seconds_total {_number(health['processed_seconds'])}")
+            family("slm_last_row_age_seconds", "gauge", "Seconds since the latest row was logged")
+            lines.append(f"slm_last_row_age_seconds {_number(health['last_row_age_seconds'])}")
+        family("slm_rows_total", "counter", "Rows logged")
+        lines.append(f"slm_rows_total {health['rows']}")
+        family("slm_overruns_total", "counter", "Input blocks dropped because processing fell behind")
+        lines.append(f"slm_overruns_total {health['overruns']}")
+        return "\n".join(lines) + "\n"
+
+    def _value(self, value: float) -> float | None:
+        return None if math.isnan(value) else round(float(value), self._precision)
+
+    def _wait(self, sequence: int, timeout: float) -> _Snapshot | None:
+        """The first snapshot newer than *sequence*, or ``None`` after *timeout* or on close."""
+        updated = self._updated
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.sequence > sequence:
+            return snapshot
+        updated.wait(timeout)
+        snapshot = self._snapshot
+        return snapshot if snapshot is not None and snapshot.sequence > sequence else None
+
+    # ------------------------------------------------------------------
+    # Control
+    # ------------------------------------------------------------------
+
+    def close(self) -> None:
+        """Stop serving and end the /stream connections."""
+        if self._closed:
+            return
+        self._closed = True
+        self._updated.set()
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        if isinstance(self._address, str) and os.path.exists(self._address):
+            os.unlink(self._address)
+
+    def __enter__(self) -> "LiveServer":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+# ---------------------------------------------------------------------------
+# HTTP plumbing
+# ---------------------------------------------------------------------------
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "slm-live"
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        live: LiveServer = self.server.live
+        path = self.path.split("?", 1)[0].rstrip("/")
+        if path == "/levels":
+            self._send(json.dumps(live.levels()), "application/json")
+        elif path == "/health":
+            self._send(json.dumps(live.health()), "application/json")
+        elif path == "/metrics":
+            self._send(live.metrics(), "text/plain; version=0.0.4")
+        elif path == "/stream":
+            self._stream(live)
+        else:
+            self._send(json.dumps({"error": f"Not found: {self.path}",
+                                   "endpoints": ["/levels", "/metrics", "/health", "/stream"]}),
+                       "application/json", status=404)
+
+    def _send(self, body: str, content_type: str, status: int = 200) -> None:
+        data = body.encode()
+        self.send_response(status)
+        self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _stream(self, live: LiveServer) -> None:
+        self.close_connection = True
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        snapshot = live._snapshot
+        sequence = -1 if snapshot is None else snapshot.sequence - 1   # start with the current row
+        try:
+            while True:
+                snapshot = live._wait(sequence, _KEEPALIVE)
+                if snapshot is not None:
+                    sequence = snapshot.sequence
+                    self.wfile.write(f"data: {json.dumps(live.levels(snapshot))}\n\n".encode())
+                elif live.closed:
+                    break
+                else:
+                    self.wfile.write(b": keep-alive\n\n")
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def address_string(self) -> str:
+        return self.client_address[0] if self.client_address else "unix"
+
+    def log_message(self, format: str, *args) -> None:
+        pass   # scrapes would flood the console display
+
+
+def _metric_name(label: str) -> str:
+    """Column label without its ``chN/`` prefix."""
+    return _CHANNEL_PREFIX.sub("", label)
+
+
+def _labels(**labels) -> str:
+    parts = []
+    for key, value in labels.items():
+        if value is not None:
+            value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+            parts.append(f'{key}="{value}"')
+    return "{" + ",".join(parts) + "}"
+
+
+def _number(value: float) -> str:
+    value = float(value)
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(value)
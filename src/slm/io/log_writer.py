@@ -0,0 +1,233 @@
+"""Stream logged rows to CSV files while the measurement runs.
+
+:class:`LogWriter` is a :class:`~slm.io.reporter.Reporter` sink: every
+recorded row is queued to a background thread, which appends it to the same
+``_log.csv`` / ``_rta_log.csv`` files :meth:`Reporter.write
+<slm.io.reporter.Reporter.write>` produces, and keeps ``_report.csv`` /
+``_rta_report.csv`` up to date with the latest row on every flush::
+
+    reporter = Reporter(precision=2, retain_rows=1)
+    ...                                   # add columns (build_chain)
+    log = LogWriter("output/site", rotate="hour")
+    reporter.add_sink(log)
+    engine.run()
+    log.close()
+
+Rows reach the disk at most *flush_interval* seconds after they are recorded,
+so a crash or power cut loses only the last few seconds, and together with
+``retain_rows`` memory stays flat however long the run.
+"""
+from __future__ import annotations
+
+import csv
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import IO
+
+import numpy as np
+
+from slm.io.reporter import FileGroup, _format_log_rows, _format_report_row
+from slm.io.writer_thread import WriterThread
+
+# strftime pattern naming the files of each rotation period
+_ROTATIONS = {"hour": "%Y-%m-%d_%H", "day": "%Y-%m-%d"}
+
+
+class LogWriter:
+    """Appends reporter rows to CSV files from a background thread.
+
+    Parameters
+    ----------
+    path:
+        Output base path, as for :meth:`Reporter.write`.
+    rotate:
+        ``None`` (one set of files, named exactly as :meth:`Reporter.write`
+        names them), ``'hour'`` or ``'day'``.  Rotated log files carry the
+        period in their name, e.g. ``site_2026-10-19_13_log.csv``; they
+        follow wall-clock boundaries of *start* + the row timestamp.  If a
+        period's files already exist from an earlier run (e.g. after a
+        restart within the hour), this run writes numbered files instead,
+        ``site_2026-10-19_13-2_log.csv`` …, and leaves them untouched.
+    start:
+        Time of the first sample (default: when the first row arrives).
+    flush_interval:
+        Seconds between writes to disk.
+    fsync:
+        ``fsync`` the files after each flush, so flushed rows survive a
+        power cut.
+    """
+
+    files: list[Path] = property(lambda self: list(self._files))
+    rows_written: int = property(lambda self: self._rows_written)
+    closed: bool = property(lambda self: self._closed)
+
+    def __init__(self, path: str | Path, rotate: str | None = None, start: datetime | None = None,
+                 flush_interval: float = 1.0, fsync: bool = True):
+        if rotate is not None and rotate not in _ROTATIONS:
+            raise ValueError(f"Unknown rotation {rotate!r}. Expected 'hour' or 'day'.")
+        self._path = Path(path)
+        self._rotate = rotate
+        self._start = start
+        self._flush_interval = flush_interval
+        self._fsync = fsync
+        self._batch: list[tuple[timedelta, np.ndarray]] = []
+        self._groups: list[FileGroup] = []
+        self._precision = 1
+        self._period: str | None = None
+        self._handles: list[IO[str]] = []
+        self._logs: dict[tuple[int, str], IO[str]] = {}
+        self._files: list[Path] = []
+        self._rows_written = 0
+        self._writer: WriterThread | None = None
+        self._closed = False
+
+    # ------------------------------------------------------------------
+    # Sink interface (called by the Reporter)
+    # ------------------------------------------------------------------
+
+    def open(self, groups: list[FileGroup], precision: int) -> None:
+        """Start the writer thread for the reporter's file layout."""
+        if self._writer is not None:
+            raise RuntimeError("LogWriter is already open")
+        self._groups = groups
+        self._precision = precision
+        if self._start is None:
+            self._start = datetime.now()
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._writer = WriterThread("slm-log", self._batch.append, flush=self._write_batch,
+                                    finish=self._close_files, flush_interval=self._flush_interval)
+
+    def append(self, timestamp: timedelta, row: np.ndarray) -> None:
+        """Queue one row; never waits for the disk."""
+        if not self._closed:
+            self._writer.put((timestamp, row))
+
+    # ------------------------------------------------------------------
+    # Control
+    # ------------------------------------------------------------------
+
+    def flush(self) -> None:
+        """Write all queued rows and the report files now, and wait until done."""
+        if self._writer is not None and not self._closed:
+            self._writer.flush()
+
+    def close(self) -> None:
+        """Write the remaining rows, close the files and stop the thread.
+
+        Re-raises any error the writer thread hit.
+        """
+        self._closed = True
+        if self._writer is not None:
+            self._writer.close()
+
+    def __enter__(self) -> "LogWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Writer thread
+    # ------------------------------------------------------------------
+
+    def _write_batch(self) -> None:
+        batch = self._batch[:]
+        self._batch.clear()
+        if not batch:
+            return
+        timestamps = np.array([t // timedelta(microseconds=1) for t, _ in batch], dtype=np.int64)
+        table = np.vstack([row for _, row in batch])
+        periods = [self._period_of(t) for t, _ in batch]
+        # Runs of rows in the same rotation period, each formatted in one go
+        start = 0
+        for stop in range(1, len(batch) + 1):
+            if stop < len(batch) and periods[stop] == periods[start]:
+                continue
+            if periods[start] != self._period or not self._handles:
+                self._open_period(periods[start])
+            self._write_rows(timestamps[start:stop], table[start:stop])
+            start = stop
+        for f in self._handles:
+            f.flush()
+            if self._fsync:
+                os.fsync(f.fileno())
+        self._rows_written += len(batch)
+        self._write_reports(table[-1])
+
+    def _write_rows(self, timestamps: np.ndarray, table: np.ndarray) -> None:
+        for g, group in enumerate(self._groups):
+            if group.broadband:
+                for text in _format_log_rows(timestamps, table[:, group.broadband_index], self._precision):
+                    self._logs[g, "log"].write(text)
+            if group.band_labels:
+                for text in _format_log_rows(timestamps, table[:, group.band_index], self._precision):
+                    self._logs[g, "rta_log"].write(text)
+
+    def _period_of(self, timestamp: timedelta) -> str | None:
+        if self._rotate is None:
+            return None
+        return (self._start + timestamp).strftime(_ROTATIONS[self._rotate])
+
+    def _base(self, group: FileGroup, period: str | None) -> Path:
+        name = self._path.name if period is None else f"{self._path.name}_{period}"
+        return self._path.parent / (name + group.suffix)
+
+    def _log_paths(self, period: str | None) -> list[tuple[int, str, Path, list[str]]]:
+        paths = []
+        for g, group in enumerate(self._groups):
+            base = self._base(group, period)
+            if group.broadband:
+                paths.append((g, "log", base.parent / f"{base.name}_log.csv",
+                              ["timestamp"] + group.broadband_header))
+            if group.band_labels:
+                paths.append((g, "rta_log", base.parent / f"{base.name}_rta_log.csv",
+                              ["timestamp"] + group.band_header))
+        return paths
+
+    def _open_period(self, period: str | None) -> None:
+        self._close_files()
+        self._period = period
+        paths = self._log_paths(period)
+        if period is not None:
+            # Files of this period left by an earlier run hold rows timed from
+            # its own start, maybe under other columns: number ours instead
+            number = 1
+            while any(path.exists() and path not in self._files for _, _, path, _ in paths):
+                number += 1
+                paths = self._log_paths(f"{period}-{number}")
+        for g, kind, path, header in paths:
+            self._open_csv(g, kind, path, header)
+
+    def _open_csv(self, g: int, kind: str, path: Path, header: list[str]) -> None:
+        f = open(path, "w", newline="")
+        csv.writer(f).writerow(header)
+        self._handles.append(f)
+        self._logs[g, kind] = f
+        if path not in self._files:
+            self._files.append(path)
+
+    def _write_reports(self, row: np.ndarray) -> None:
+        """Replace the report files with *row*, atomically."""
+        for group in self._groups:
+            base = self._base(group, None)
+            if group.broadband:
+                self._replace_csv(base.parent / f"{base.name}_report.csv", group.broadband_header,
+                                  _format_report_row(row[group.broadband_index], self._precision))
+            if group.band_labels:
+                self._replace_csv(base.parent / f"{base.name}_rta_report.csv", group.band_header,
+                                  _format_report_row(row[group.band_index], self._precision))
+
+    @staticmethod
+    def _replace_csv(path: Path, header: list[str], text: str) -> None:
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "w", newline="") as f:
+            csv.writer(f).writerow(header)
+            f.write(text)
+        os.replace(tmp, path)
+
+    def _close_files(self) -> None:
+        for f in self._handles:
+            f.close()
+        self._handles = []
+        self._logs = {}
@@ -0,0 +1,96 @@
+"""Raw PCM sample formats and vectorized conversion to floating point.
+
+Shared by the controllers that read undecoded sample data directly (memory-
+mapped WAV, raw streams).  Integers are scaled to ±1.0 full scale exactly as
+libsndfile does, so results match :class:`~slm.io.file_controller.FileController`.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class SampleFormat:
+    """One interleaved little-endian PCM sample encoding."""
+
+    name: str
+    bits: int
+    is_float: bool = False
+
+    @property
+    def sample_bytes(self) -> int:
+        return self.bits // 8
+
+    @property
+    def dtype(self) -> np.dtype:
+        """Element dtype of a raw view (24-bit samples are viewed as 3 bytes each)."""
+        if self.is_float:
+            return np.dtype(f"<f{self.sample_bytes}")
+        if self.bits in (8, 24):
+            return np.dtype(np.uint8)
+        return np.dtype(f"<i{self.sample_bytes}")
+
+    def raw_shape(self, frames: int, channels: int) -> tuple[int, ...]:
+        """Shape of a raw view of *frames* frames."""
+        return (frames, channels, 3) if self.bits == 24 else (frames, channels)
+
+    def frombuffer(self, buffer, frames: int, channels: int, offset: int = 0) -> np.ndarray:
+        """Zero-copy raw view of *frames* frames starting at byte *offset* of *buffer*."""
+        shape = self.raw_shape(frames, channels)
+        return np.frombuffer(buffer, dtype=self.dtype, count=int(np.prod(shape)),
+                             offset=offset).reshape(shape)
+
+    def scratch(self, frames: int, channels: int) -> np.ndarray | None:
+        """Work buffer for :meth:`to_float` (only 24-bit needs one)."""
+        return np.zeros((frames, channels, 4), dtype=np.uint8) if self.bits == 24 else None
+
+    def to_float(self, raw: np.ndarray, out: np.ndarray, scratch: np.ndarray | None = None) -> None:
+        """Convert raw view *raw* into *out* (floating point, ±1.0 full scale)."""
+        if self.is_float:
+            np.copyto(out, raw, casting="unsafe")
+        elif self.bits == 8:
+            np.subtract(raw, 128.0, out=out, casting="unsafe")   # 8-bit PCM is unsigned
+            out *= 1.0 / 128
+        elif self.bits == 24:
+            # Place the three bytes in the top of a little-endian int32; the
+            # result is sample << 8 with the sign in place, so scale by 2**-31.
+            if scratch is None or len(scratch) < len(raw):
+                scratch = self.scratch(len(raw), raw.shape[1])
+            scratch = scratch[:len(raw)]
+            scratch[..., 1:] = raw
+            np.multiply(scratch.view("<i4")[..., 0], 1.0 / (1 << 31), out=out, casting="unsafe")
+        else:
+            np.multiply(raw, 1.0 / (1 << (self.bits - 1)), out=out, casting="unsafe")
+
+
+# Names follow ALSA (arecord -f); ffmpeg-style aliases are accepted too.
+SAMPLE_FORMATS: dict[str, SampleFormat] = {
+    f.name: f for f in (
+        SampleFormat("U8", 8),
+        SampleFormat("S16_LE", 16),
+        SampleFormat("S24_3LE", 24),
+        SampleFormat("S32_LE", 32),
+        SampleFormat("FLOAT_LE", 32, is_float=True),
+        SampleFormat("FLOAT64_LE", 64, is_float=True),
+    )
+}
+
+_ALIASES = {
+    "u8": "U8", "s16le": "S16_LE", "s24le": "S24_3LE", "s32le": "S32_LE",
+    "f32le": "FLOAT_LE", "f64le": "FLOAT64_LE",
+}
+
+
+def sample_format(name: str | SampleFormat) -> SampleFormat:
+    """Look up a :class:`SampleFormat` by ALSA name (``S16_LE``) or ffmpeg alias (``s16le``)."""
+    if isinstance(name, SampleFormat):
+        return name
+    key = _ALIASES.get(name.lower(), name.upper())
+    try:
+        return SAMPLE_FORMATS[key]
+    except KeyError:
+        raise ValueError(
+            f"Unknown sample format {name!r}. Expected one of: {', '.join(SAMPLE_FORMATS)}"
+        ) from None
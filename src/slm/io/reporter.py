@@ -1,15 +1,21 @@
 from __future__ import annotations
 
 import csv
-from datetime import timedelta
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import TYPE_CHECKING, Callable
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, NamedTuple, Protocol
 
 import numpy as np
 
 if TYPE_CHECKING:
+    from slm.io.energy_index import EnergyIndexWriter
+    from slm.io.rollup import Rollup
+    from slm.meter import LeqAccumulator
     from slm.plugin_meter import PluginMeter
 
+# How a per-interval column combines over a rollup period
+AGGREGATES = ("energy", "exposure", "max", "min")
+
 
 def _fmt_timestamp(td: timedelta) -> str:
     """Format a timedelta as ``HH:MM:SS.mmm``."""
@@ -20,129 +26,485 @@ def _fmt_timestamp(td: timedelta) -> str:
     return "{:02}:{:02}:{:06.3f}".format(h, m, s)
 
 
+class FileGroup(NamedTuple):
+    """Columns written to one set of output files, one group per input channel.
+
+    The index arrays locate each output column in the flat row that sinks
+    receive: broadband values in column order, then each band column's bands.
+    """
+
+    suffix: str                   # appended to the output base path: "" or "_chN"
+    broadband: bool               # write _log.csv / _report.csv for this group
+    broadband_labels: list[str]
+    broadband_header: list[str]
+    broadband_index: np.ndarray
+    band_labels: list[str]
+    band_header: list[str]
+    band_index: np.ndarray
+
+
+class LogSink(Protocol):
+    """Receives every logged row as it is recorded (see :meth:`Reporter.add_sink`)."""
+
+    def open(self, groups: list[FileGroup], precision: int) -> None: ...
+
+    def append(self, timestamp: timedelta, row: np.ndarray) -> None: ...
+
+
+class _RowsView:
+    """Read-only sequence of per-interval dicts over the columnar log.
+
+    Rows are built on access, ``{"timestamp": timedelta, label: value, …}``,
+    so code that indexes a single row keeps working without the log ever
+    holding per-row objects.
+    """
+
+    def __init__(self, reporter: "Reporter", band: bool):
+        self._reporter = reporter
+        self._band = band
+
+    def __len__(self) -> int:
+        return self._reporter._n_rows
+
+    def __getitem__(self, index: int) -> dict:
+        r = self._reporter
+        n = r._n_rows
+        if not -n <= index < n:
+            raise IndexError("log row index out of range")
+        index %= n
+        row: dict = {"timestamp": timedelta(microseconds=int(r._timestamps[index]))}
+        data = r._band_data if self._band else r._broadband_data
+        for label, column in data.items():
+            row[label] = column[index].copy() if self._band else float(column[index])
+        return row
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+
 class Reporter:
+    """Samples meters every *dt* and keeps the log in columnar numpy storage.
+
+    Each broadband column is a float64 array, each band column a
+    ``(rows, bands)`` array, and the timestamps an int64 array of
+    microseconds.  The arrays grow geometrically, so recording is amortised
+    O(1) and memory stays close to 8 bytes per logged value.  :attr:`rows`
+    counts the logged intervals; :meth:`timestamps`, :meth:`broadband` and
+    :meth:`band` give vectorised access to them.
+
+    With *retain_rows*, only the most recent rows are kept in memory, so
+    unbounded runs use constant memory; pair it with a sink such as
+    :class:`~slm.io.log_writer.LogWriter` that streams every row to disk.
+    :meth:`add_rollup` aggregates the interval columns to coarser
+    resolutions as rows are recorded, and :meth:`add_energy_index` keeps
+    the running energy totals for exact queries over any interval.
+    """
+
+    rows: int = property(lambda self: self._n_rows)
+    energy_labels: list[str] = property(lambda self: [c[0] for c in self._energy_columns])
+
+    _INITIAL_ROWS = 1024
+
     def __init__(self, precision: int = 1, print_to_console: bool = False,
-                 display_fn: Callable | None = None):
+                 display_fn: Callable | None = None, retain_rows: int | None = None):
+        if retain_rows is not None and retain_rows < 1:
+            raise ValueError(f"retain_rows must be at least 1, got {retain_rows}")
         self._broadband_columns: list[tuple[str, PluginMeter, str]] = []
         self._band_columns: list[tuple[str, PluginMeter, str, list[float]]] = []
-        self._broadband_rows: list[dict] = []
-        self._band_rows: list[dict] = []
+        self._column_channels: dict[str, int | None] = {}
+        self._aggregates: dict[str, str] = {}
+        self._energy_columns: list[tuple[str, PluginMeter, LeqAccumulator, list | None]] = []
+        self._retain_rows = retain_rows
+        self._capacity = self._INITIAL_ROWS
+        if retain_rows is not None:
+            self._capacity = max(self._capacity, 2 * retain_rows)
+        self._n_rows = 0
+        self._timestamps = np.zeros(self._capacity, dtype=np.int64)
+        self._broadband_data: dict[str, np.ndarray] = {}
+        self._band_data: dict[str, np.ndarray] = {}
+        self._broadband_rows = _RowsView(self, band=False)
+        self._band_rows = _RowsView(self, band=True)
+        self._sinks: list[LogSink] = []
+        self._unopened_sinks: list[LogSink] = []
+        self._rollups: list[Rollup] = []
+        self._energy_indexes: list[EnergyIndexWriter] = []
+        self._unopened_indexes: list[EnergyIndexWriter] = []
+        self._last_row_us = 0
         self._last_log: timedelta | None = None
         self._precision = precision
         self._print_to_console = print_to_console
         self._display_fn = display_fn
 
     def add_column(self, label: str, plugin: PluginMeter, meter_name: str,
-                   center_frequencies: list[float] | None = None) -> None:
+                   center_frequencies: list[float] | None = None,
+                   channel: int | None = None, aggregate: str | None = None) -> None:
         """Register a meter output as a column.
 
         Single-channel plugins go to broadband; multi-channel plugins go to band-split.
         For multi-channel plugins, center_frequencies is required.
+        *channel* (1-based input channel) routes the column to that channel's
+        output files in :meth:`write`.  Rows logged before the column was
+        added read as NaN.
+
+        *aggregate* marks a per-interval column (a ``_dt`` metric) for
+        :meth:`add_rollup`: ``'energy'`` (Leq), ``'exposure'`` (LE),
+        ``'max'`` or ``'min'``.  Other columns are not rolled up.
+
+        Columns read from a Leq / LE accumulator (``LAeq``, ``LZE:bands`` …)
+        are also available to :meth:`add_energy_index`.
         """
-        if plugin.width == 1:
+        if aggregate is not None and aggregate not in AGGREGATES:
+            raise ValueError(f"Unknown aggregate {aggregate!r}. Expected one of {', '.join(AGGREGATES)}.")
+        if plugin.width > 1 and center_frequencies is None:
+            raise ValueError(
+                f"center_frequencies is required for multi-channel plugin '{label}' (width={plugin.width})"
+            )
+        self._register(label, plugin.width, center_frequencies, channel, plugin, meter_name)
+        if aggregate is not None:
+            self._aggregates[label] = aggregate
+
+        from slm.meter import LeqAccumulator
+        meter = getattr(plugin, "meters", {}).get(meter_name)
+        if isinstance(meter, LeqAccumulator):
+            self._energy_columns.append((label, plugin, meter, center_frequencies))
+
+    def _register(self, label: str, width: int, center_frequencies: list | None,
+                  channel: int | None, plugin: PluginMeter | None = None,
+                  meter_name: str | None = None) -> None:
+        self._column_channels[label] = channel
+        if width == 1:
             self._broadband_columns.append((label, plugin, meter_name))
+            self._broadband_data[label] = np.full(self._capacity, np.nan)
         else:
-            if center_frequencies is None:
-                raise ValueError(
-                    f"center_frequencies is required for multi-channel plugin '{label}' (width={plugin.width})"
-                )
             self._band_columns.append((label, plugin, meter_name, center_frequencies))
+            self._band_data[label] = np.full((self._capacity, width), np.nan)
+
+    def add_rollup(self, seconds: float, start: datetime | None = None,
+                   retain_rows: int | None = None) -> Rollup:
+        """Aggregate the *aggregate* columns to *seconds* resolution while recording.
+
+        Returns the :class:`~slm.io.rollup.Rollup`, itself a reporter with
+        the same accessors, sinks and :meth:`write`; see there for
+        *start* and *retain_rows*.  :meth:`write` also writes each rollup,
+        to ``<path>_<resolution>_log.csv`` etc.
+        """
+        from slm.io.rollup import Rollup
+
+        rollup = Rollup(seconds, precision=self._precision, start=start, retain_rows=retain_rows)
+        self._rollups.append(rollup)
+        return rollup
+
+    def add_energy_index(self, path: str | Path, start: datetime | None = None) -> EnergyIndexWriter:
+        """Record the running energy totals of :attr:`energy_labels` to ``<path>_energy.slmi``.
+
+        One record is appended per logged row, independent of *retain_rows*;
+        query the file with :class:`~slm.io.energy_index.EnergyIndex`.
+        *start* is the wall-clock time of the first sample.  Close the
+        returned writer when the measurement ends.
+        """
+        from slm.io.energy_index import EnergyIndexWriter
+
+        if not self._energy_columns:
+            raise ValueError("No Leq or LE columns to index (add e.g. LAeq or LZeq:bands)")
+        path = Path(path)
+        index = EnergyIndexWriter(path.parent / f"{path.name}_energy.slmi", start=start)
+        self._energy_indexes.append(index)
+        self._unopened_indexes.append(index)
+        return index
+
+    @property
+    def rollups(self) -> list[Rollup]:
+        """Rollups added with :meth:`add_rollup`, in order."""
+        return list(self._rollups)
+
+    def finish(self) -> None:
+        """Close the rollups' partly filled periods; call once recording has ended."""
+        for rollup in self._rollups:
+            rollup.finish()
+
+    def add_sink(self, sink: LogSink) -> None:
+        """Stream every row recorded from now on to *sink*.
+
+        The sink is opened with the output file layout (:meth:`_file_groups`)
+        when the next row is recorded, so add all columns first.
+        """
+        self._sinks.append(sink)
+        self._unopened_sinks.append(sink)
+
+    # ------------------------------------------------------------------
+    # Log access
+    # ------------------------------------------------------------------
+
+    def timestamps(self) -> np.ndarray:
+        """Timestamps of the logged intervals as ``timedelta64[us]`` (read-only view)."""
+        return self._view(self._timestamps).view("timedelta64[us]")
+
+    def broadband(self, label: str) -> np.ndarray:
+        """Logged values of broadband column *label*, shape ``(rows,)`` (read-only view)."""
+        return self._view(self._broadband_data[label])
+
+    def band(self, label: str) -> np.ndarray:
+        """Logged values of band column *label*, shape ``(rows, bands)`` (read-only view)."""
+        return self._view(self._band_data[label])
+
+    def _view(self, column: np.ndarray) -> np.ndarray:
+        view = column[:self._n_rows]
+        view.flags.writeable = False
+        return view
+
+    def _grow(self) -> None:
+        """Double the capacity of every column."""
+        def grown(column: np.ndarray) -> np.ndarray:
+            out = np.empty((2 * len(column),) + column.shape[1:], dtype=column.dtype)
+            out[:len(column)] = column
+            return out
+
+        self._capacity *= 2
+        self._timestamps = grown(self._timestamps)
+        for data in (self._broadband_data, self._band_data):
+            for label in data:
+                data[label] = grown(data[label])
+
+    def _discard_old_rows(self) -> None:
+        """Move the newest *retain_rows* rows to the front; amortised O(1) per row."""
+        keep = self._retain_rows
+        start = self._n_rows - keep
+        for column in [self._timestamps, *self._broadband_data.values(), *self._band_data.values()]:
+            column[:keep] = column[start:self._n_rows]
+        self._n_rows = keep
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
 
     def record(self, timestamp: timedelta, dt: float) -> None:
         """Sample all registered meters and append rows if dt has elapsed since last log."""
         if self._last_log is not None and (timestamp - self._last_log).total_seconds() < dt:
             return
 
-        fmt = f"{{:.{self._precision}f}}"
-        ts_str = _fmt_timestamp(timestamp)
-
-        broadband_row: dict = {"timestamp": timestamp}
+        i = self._next_row(timestamp)
         for label, plugin, meter_name in self._broadband_columns:
-            broadband_row[label] = float(plugin.read_db(meter_name)[0])
-        self._broadband_rows.append(broadband_row)
-
-        band_row: dict = {"timestamp": timestamp}
+            self._broadband_data[label][i] = plugin.read_db(meter_name)[0]
         for label, plugin, meter_name, _ in self._band_columns:
-            band_row[label] = plugin.read_db(meter_name).copy()
-        self._band_rows.append(band_row)
+            self._band_data[label][i] = plugin.read_db(meter_name)
+        self._commit_row(timestamp)
+        if self._energy_indexes:
+            self._feed_energy_indexes()
 
         if self._display_fn is not None:
-            bb_display = {k: v for k, v in broadband_row.items() if k != "timestamp"}
-            bd_display = {k: v for k, v in band_row.items() if k != "timestamp"}
+            bb_display = {label: float(data[i]) for label, data in self._broadband_data.items()}
+            bd_display = {label: data[i] for label, data in self._band_data.items()}
             self._display_fn(timestamp, bb_display, bd_display)
         elif self._print_to_console:
+            fmt = f"{{:.{self._precision}f}}"
+            ts_str = _fmt_timestamp(timestamp)
             if self._broadband_columns:
                 parts = [ts_str]
                 for label, _, _ in self._broadband_columns:
-                    parts.append(f"{label}: {fmt.format(broadband_row[label])}")
+                    parts.append(f"{label}: {fmt.format(self._broadband_data[label][i])}")
                 print("  ".join(parts))
             for label, _, _, _ in self._band_columns:
-                arr = band_row[label]
+                arr = self._band_data[label][i]
                 arr_str = "[" + ", ".join(fmt.format(v) for v in arr) + "]"
                 print(f"{ts_str}  {label}: {arr_str}")
 
         self._last_log = timestamp
 
+    def _next_row(self, timestamp: timedelta) -> int:
+        """Make room for a row, store its *timestamp* and return its index."""
+        if self._n_rows == self._capacity:
+            if self._retain_rows is not None:
+                self._discard_old_rows()
+            else:
+                self._grow()
+        self._timestamps[self._n_rows] = timestamp // timedelta(microseconds=1)
+        return self._n_rows
+
+    def _commit_row(self, timestamp: timedelta) -> None:
+        """Append the row filled in after :meth:`_next_row`; feed sinks and rollups."""
+        i = self._n_rows
+        self._n_rows += 1
+        if self._sinks:
+            self._feed_sinks(timestamp, i)
+        end_us = int(self._timestamps[i])
+        for rollup in self._rollups:
+            rollup._ingest(self, i, self._last_row_us, end_us)
+        self._last_row_us = end_us
+
+    def _feed_energy_indexes(self) -> None:
+        from slm.constants import REFERENCE_PRESSURE
+
+        if self._unopened_indexes:
+            from slm.io.energy_index import IndexColumn
+            columns = [IndexColumn(label, self._column_channels[label], freqs, plugin.width)
+                       for label, plugin, _, freqs in self._energy_columns]
+            for index in self._unopened_indexes:
+                index.open(columns)
+            self._unopened_indexes = []
+        # Exposure re p0^2 (Pa^2*s / p0^2) and exact duration, both running totals
+        seconds = self._energy_columns[0][2].n_samples / self._energy_columns[0][2].samplerate
+        exposure = np.concatenate([
+            meter.sum_sq / (meter.samplerate * (REFERENCE_PRESSURE * plugin.sensitivity) ** 2)
+            for _, plugin, meter, _ in self._energy_columns
+        ])
+        for index in self._energy_indexes:
+            index.append(seconds, exposure)
+
+    def _feed_sinks(self, timestamp: timedelta, i: int) -> None:
+        if self._unopened_sinks:
+            groups = self._file_groups()
+            for sink in self._unopened_sinks:
+                sink.open(groups, self._precision)
+            self._unopened_sinks.clear()
+        parts = [np.array([data[i] for data in self._broadband_data.values()])]
+        parts += [data[i] for data in self._band_data.values()]
+        row = np.concatenate(parts)
+        for sink in self._sinks:
+            sink.append(timestamp, row)
+
+    # ------------------------------------------------------------------
+    # Output files
+    # ------------------------------------------------------------------
+
+    def _file_groups(self) -> list[FileGroup]:
+        """Output file layout: one group per channel, columns in registration order."""
+        offsets: dict[str, np.ndarray] = {}
+        pos = 0
+        for label in self._broadband_data:
+            offsets[label] = np.array([pos])
+            pos += 1
+        for label, data in self._band_data.items():
+            offsets[label] = np.arange(pos, pos + data.shape[1])
+            pos += data.shape[1]
+
+        def index(labels: list[str]) -> np.ndarray:
+            return np.concatenate([offsets[label] for label in labels] or [np.zeros(0, dtype=int)])
+
+        groups = []
+        channels = sorted(set(self._column_channels.values()), key=lambda c: (c is not None, c))
+        for channel in channels or [None]:
+            prefix = "" if channel is None else f"ch{channel}/"
+
+            def _header(label: str) -> str:
+                return label[len(prefix):] if prefix and label.startswith(prefix) else label
+
+            broadband_labels = [label for label, _, _ in self._broadband_columns
+                                if self._column_channels[label] == channel]
+            band_columns = [(label, freqs) for label, _, _, freqs in self._band_columns
+                            if self._column_channels[label] == channel]
+            band_labels = [label for label, _ in band_columns]
+            groups.append(FileGroup(
+                suffix="" if channel is None else f"_ch{channel}",
+                broadband=channel is None or bool(broadband_labels),
+                broadband_labels=broadband_labels,
+                broadband_header=[_header(label) for label in broadband_labels],
+                broadband_index=index(broadband_labels),
+                band_labels=band_labels,
+                band_header=[f"{_header(label)}_{freq}" for label, freqs in band_columns for freq in freqs],
+                band_index=index(band_labels),
+            ))
+        return groups
+
     def write(self, path: str | Path) -> None:
-        """Write _log.csv, _report.csv, and optionally _rta_log.csv, _rta_report.csv."""
+        """Write _log.csv, _report.csv, and optionally _rta_log.csv, _rta_report.csv.
+
+        Columns registered with a *channel* are written to their own set of
+        files, ``<path>_ch<N>_log.csv`` etc., with the ``chN/`` prefix removed
+        from the column headers.  Rollups are finished and written as
+        ``<path>_<resolution>_log.csv`` etc.
+        """
         path = Path(path)
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        fmt = f"{{:.{self._precision}f}}"
+        for group in self._file_groups():
+            self._write_files(path.parent / (path.name + group.suffix), group)
+        for rollup in self._rollups:
+            rollup.finish()
+            rollup.write(path.parent / f"{path.name}_{rollup.name}")
+
+    def write_binary(self, path: str | Path, dtype: str = "float32") -> Path:
+        """Write the whole log to one compact ``<path>_log.slmb`` file and return its path.
+
+        All channels go into the one file, with float32 values or int16 at
+        0.01 dB (*dtype*); read it back with
+        :class:`~slm.io.binary_log.BinaryLog`.
+        """
+        from slm.io.binary_log import write_binary_log
 
-        def _format_value(v) -> str:
-            if isinstance(v, timedelta):
-                return _fmt_timestamp(v)
-            return fmt.format(v)
+        path = Path(path)
+        out = path.parent / (path.name + "_log.slmb")
+        n = self._n_rows
+        columns = [(label, self._column_channels[label], None, self._broadband_data[label][:n])
+                   for label, _, _ in self._broadband_columns]
+        columns += [(label, self._column_channels[label], freqs, self._band_data[label][:n])
+                    for label, _, _, freqs in self._band_columns]
+        write_binary_log(out, self._timestamps[:n], columns, dtype=dtype)
+        return out
+
+    def _write_files(self, path: Path, group: FileGroup) -> None:
+        """Write the output files for the columns in *group*."""
+        n = self._n_rows
+        if n == 0:
+            return
+        timestamps = self._timestamps[:n]
 
         # --- Broadband ---
-        if self._broadband_rows:
-            fieldnames = list(self._broadband_rows[0].keys())
-
-            log_path = path.parent / (path.name + "_log.csv")
-            with open(log_path, "w", newline="") as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                for row in self._broadband_rows:
-                    writer.writerow({k: _format_value(v) for k, v in row.items()})
-
-            report_fieldnames = [k for k in fieldnames if k != "timestamp"]
-            last_row = {k: v for k, v in self._broadband_rows[-1].items() if k != "timestamp"}
-            report_path = path.parent / (path.name + "_report.csv")
-            with open(report_path, "w", newline="") as f:
-                writer = csv.DictWriter(f, fieldnames=report_fieldnames)
-                writer.writeheader()
-                writer.writerow({k: _format_value(v) for k, v in last_row.items()})
+        if group.broadband:
+            table = np.column_stack([self._broadband_data[label][:n] for label in group.broadband_labels]
+                                    or [np.empty((n, 0))])
+            _write_csv(path.parent / (path.name + "_log.csv"), ["timestamp"] + group.broadband_header,
+                       _format_log_rows(timestamps, table, self._precision))
+            _write_csv(path.parent / (path.name + "_report.csv"), group.broadband_header,
+                       [_format_report_row(table[-1], self._precision)])
 
         # --- Band-split (RTA) ---
-        if self._band_columns and self._band_rows:
-            # Build flat fieldnames: timestamp + label_freq per band column
-            rta_fieldnames = ["timestamp"]
-            for label, _, _, freqs in self._band_columns:
-                for freq in freqs:
-                    rta_fieldnames.append(f"{label}_{freq}")
-
-            rta_log_path = path.parent / (path.name + "_rta_log.csv")
-            with open(rta_log_path, "w", newline="") as f:
-                writer = csv.DictWriter(f, fieldnames=rta_fieldnames)
-                writer.writeheader()
-                for row in self._band_rows:
-                    flat: dict = {"timestamp": _format_value(row["timestamp"])}
-                    for label, _, _, freqs in self._band_columns:
-                        arr = row[label]
-                        for freq, val in zip(freqs, arr):
-                            flat[f"{label}_{freq}"] = fmt.format(val)
-                    writer.writerow(flat)
-
-            rta_report_fieldnames = [f for f in rta_fieldnames if f != "timestamp"]
-            last_band_row = self._band_rows[-1]
-            rta_report_path = path.parent / (path.name + "_rta_report.csv")
-            with open(rta_report_path, "w", newline="") as f:
-                writer = csv.DictWriter(f, fieldnames=rta_report_fieldnames)
-                writer.writeheader()
-                flat_last: dict = {}
-                for label, _, _, freqs in self._band_columns:
-                    arr = last_band_row[label]
-                    for freq, val in zip(freqs, arr):
-                        flat_last[f"{label}_{freq}"] = fmt.format(val)
-                writer.writerow(flat_last)
+        if group.band_labels:
+            table = np.hstack([self._band_data[label][:n] for label in group.band_labels])
+            _write_csv(path.parent / (path.name + "_rta_log.csv"), ["timestamp"] + group.band_header,
+                       _format_log_rows(timestamps, table, self._precision))
+            _write_csv(path.parent / (path.name + "_rta_report.csv"), group.band_header,
+                       [_format_report_row(table[-1], self._precision)])
+
+
+# ---------------------------------------------------------------------------
+# CSV formatting
+# ---------------------------------------------------------------------------
+
+# Rows formatted per call of _format_log_rows' inner loop; bounds the temporary strings
+_CHUNK_ROWS = 4096
+
+
+def _format_log_rows(timestamps_us: np.ndarray, table: np.ndarray, precision: int) -> Iterator[str]:
+    """Yield CSV text for ``(rows, columns)`` *table*, a chunk of rows at a time.
+
+    Each chunk is formatted by a single ``%`` operation on a repeated row
+    template, so the per-cell work happens in C.  ``%.Nf`` and
+    ``{:.Nf}`` share the same float formatting, and the timestamp fields
+    reproduce :func:`_fmt_timestamp`, so the text is byte-identical to
+    writing each cell with ``csv.writer``.
+    """
+    rows, columns = table.shape
+    template = "%02d:%02d:%06.3f" + f",%.{precision}f" * columns + "\r\n"
+    total = timestamps_us / 1e6          # as timedelta.total_seconds()
+    whole = np.floor(total)
+    for start in range(0, rows, _CHUNK_ROWS):
+        stop = min(rows, start + _CHUNK_ROWS)
+        chunk = np.empty((stop - start, columns + 3))
+        np.floor_divide(whole[start:stop], 3600, out=chunk[:, 0])
+        np.floor_divide(np.mod(whole[start:stop], 3600), 60, out=chunk[:, 1])
+        np.mod(total[start:stop], 60, out=chunk[:, 2])
+        chunk[:, 3:] = table[start:stop]
+        yield (template * (stop - start)) % tuple(chunk.ravel().tolist())
+
+
+def _format_report_row(values: np.ndarray, precision: int) -> str:
+    """CSV text for a single row of *values*, without a timestamp."""
+    return ",".join(f"%.{precision}f" % v for v in values.tolist()) + "\r\n"
+
+
+def _write_csv(file_path: Path, header: list[str], chunks: Iterable[str]) -> None:
+    """Write *header* with ``csv.writer`` quoting, then the pre-formatted text *chunks*."""
+    with open(file_path, "w", newline="") as f:
+        csv.writer(f).writerow(header)
+        for text in chunks:
+            f.write(text)
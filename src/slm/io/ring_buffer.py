@@ -0,0 +1,120 @@
+"""Single-producer / single-consumer sample ring buffer.
+
+Used to hand audio from a driver callback thread to the engine thread
+without locks and without allocating on the producer side.  Each side owns
+one monotonically increasing frame counter (``_write_pos`` for the producer,
+``_read_pos`` for the consumer) and only reads the other's; the producer
+publishes ``_write_pos`` after the samples are in place, so the consumer
+never sees a frame before it has been written.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+
+class RingBuffer:
+    """Fixed-capacity multichannel FIFO backed by one preallocated array.
+
+    When the buffer is full, :meth:`write` keeps what fits and drops the
+    rest.  Every loss is counted exactly (:attr:`lost_frames`) and logged
+    with the producer-supplied timestamp in a preallocated event ring
+    (:attr:`lost_events`, last *max_events* entries).  :attr:`high_watermark`
+    records the fullest the buffer has been, to size it for a given setup.
+    """
+
+    capacity: int = property(lambda self: self._capacity)
+    channels: int = property(lambda self: self._buffer.shape[1])
+    available: int = property(lambda self: self._write_pos - self._read_pos)
+    high_watermark: int = property(lambda self: self._high_watermark)
+    lost_frames: int = property(lambda self: self._lost_frames)
+    overflow_count: int = property(lambda self: self._overflow_count)
+
+    def __init__(self, capacity: int, channels: int = 1, dtype: np.dtype | type = np.float32,
+                 max_events: int = 256):
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self._capacity = int(capacity)
+        self._buffer = np.zeros((self._capacity, channels), dtype=dtype)
+        self._event_time = np.full(max_events, np.nan)
+        self._event_frames = np.zeros(max_events, dtype=np.int64)
+        self.reset()
+
+    def reset(self) -> None:
+        """Discard all content and statistics.  Not safe while either side is running."""
+        self._write_pos = 0
+        self._read_pos = 0
+        self._high_watermark = 0
+        self._lost_frames = 0
+        self._overflow_count = 0
+
+    # ------------------------------------------------------------------
+    # Producer side
+    # ------------------------------------------------------------------
+
+    def write(self, data: np.ndarray, timestamp: float = float("nan")) -> int:
+        """Append ``(frames, channels)`` *data*; return the number of frames accepted."""
+        n = len(data)
+        w = self._write_pos
+        accepted = min(n, self._capacity - (w - self._read_pos))
+        if accepted > 0:
+            start = w % self._capacity
+            first = min(accepted, self._capacity - start)
+            self._buffer[start:start + first] = data[:first]
+            if accepted > first:
+                self._buffer[:accepted - first] = data[first:accepted]
+            self._write_pos = w + accepted   # publish only after the copy
+            fill = self._write_pos - self._read_pos
+            if fill > self._high_watermark:
+                self._high_watermark = fill
+        if accepted < n:
+            self.record_loss(n - accepted, timestamp)
+        return accepted
+
+    def record_loss(self, frames: int | None, timestamp: float = float("nan")) -> None:
+        """Log *frames* samples lost at *timestamp* (e.g. an upstream driver overflow).
+
+        ``frames=None`` logs a loss of unknown size; it is listed in
+        :attr:`lost_events` but not added to :attr:`lost_frames`.
+        """
+        slot = self._overflow_count % len(self._event_time)
+        self._event_time[slot] = timestamp
+        self._event_frames[slot] = -1 if frames is None else frames
+        if frames is not None:
+            self._lost_frames += frames
+        self._overflow_count += 1
+
+    # ------------------------------------------------------------------
+    # Consumer side
+    # ------------------------------------------------------------------
+
+    def read_into(self, out: np.ndarray) -> bool:
+        """Fill *out* completely and return ``True``, or leave it untouched and return ``False``."""
+        n = len(out)
+        r = self._read_pos
+        if self._write_pos - r < n:
+            return False
+        start = r % self._capacity
+        first = min(n, self._capacity - start)
+        out[:first] = self._buffer[start:start + first]
+        if n > first:
+            out[first:] = self._buffer[:n - first]
+        self._read_pos = r + n   # release the space only after the copy
+        return True
+
+    # ------------------------------------------------------------------
+    # Statistics
+    # ------------------------------------------------------------------
+
+    @property
+    def lost_events(self) -> list[tuple[float, int | None]]:
+        """``(timestamp, frames)`` of the most recent overflows, oldest first (``None``: unknown size)."""
+        size = len(self._event_time)
+        count = self._overflow_count
+        slots = [i % size for i in range(max(0, count - size), count)]
+        return [(float(self._event_time[i]),
+                 int(self._event_frames[i]) if self._event_frames[i] >= 0 else None)
+                for i in slots]
+
+    def reset_watermark(self) -> None:
+        """Restart high-watermark tracking from the current fill level."""
+        self._high_watermark = self.available
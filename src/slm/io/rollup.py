@@ -0,0 +1,165 @@
+"""Multi-resolution rollups of the per-interval log columns.
+
+A :class:`Rollup` aggregates the ``dt`` rows of a
+:class:`~slm.io.reporter.Reporter` to a coarser resolution (1 min, 15 min,
+1 h, 1 day …) while they are recorded, so reports at several resolutions no
+longer need the full ``dt`` log::
+
+    reporter = engine.reporter
+    for seconds in (60, 900, 3600, 86400):
+        reporter.add_rollup(seconds, start=datetime.now())
+
+Only columns registered with an *aggregate* take part, i.e. the ``_dt``
+metrics that describe one logging interval each, and they combine exactly:
+
+* ``energy`` (``LAeq_dt``): ``10 log10(Σ 10^(L/10) Δt / Σ Δt)``
+* ``exposure`` (``LAE_dt``): ``10 log10(Σ 10^(L/10))``
+* ``max`` / ``min`` (``LAFmax_dt``): the largest / smallest value.
+
+Each rollup is a reporter of its own, so it can keep its own number of rows
+(*retain_rows*), stream to its own :class:`~slm.io.log_writer.LogWriter` and
+be written with :meth:`~slm.io.reporter.Reporter.write`.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from slm.io.reporter import Reporter
+
+_UNITS = (("d", 86400), ("h", 3600), ("m", 60), ("s", 1))
+
+
+def resolution_name(seconds: float) -> str:
+    """Short name of a resolution: ``60`` → ``'1m'``, ``900`` → ``'15m'``, ``86400`` → ``'1d'``."""
+    for unit, size in _UNITS:
+        if seconds % size == 0:
+            return f"{int(seconds // size)}{unit}"
+    return f"{seconds:g}s"
+
+
+def parse_resolution(name: str) -> float:
+    """Seconds of a resolution name such as ``'15m'``, ``'1h'`` or ``'1d'``."""
+    units = dict(_UNITS)
+    try:
+        seconds = float(name[:-1]) * units[name[-1]]
+    except (KeyError, ValueError, IndexError):
+        raise ValueError(
+            f"Invalid rollup resolution {name!r}. Expected a number and a unit, e.g. '15m', '1h' or '1d'."
+        ) from None
+    if seconds <= 0:
+        raise ValueError(f"Rollup resolution must be positive, got {name!r}")
+    return seconds
+
+
+class Rollup(Reporter):
+    """Aggregates a reporter's interval columns over fixed periods.
+
+    Parameters
+    ----------
+    seconds:
+        Period length.
+    precision:
+        Decimal places in the CSV output.
+    start:
+        Wall-clock time of the measurement start.  Periods are then aligned
+        to local midnight (``15m`` periods end at :00, :15, …).  ``None``
+        aligns them to the start of the measurement.
+    retain_rows:
+        Rows kept in memory, as for :class:`~slm.io.reporter.Reporter`.
+
+    A row is emitted when the first ``dt`` interval of the next period
+    arrives, timestamped with the end of its last interval (the period end,
+    when *dt* divides *seconds*).  :meth:`finish` emits the final, partial
+    period.  Intervals are assigned whole to the period they end in; rows
+    that cover no time are skipped.
+    """
+
+    seconds: float = property(lambda self: self._seconds)
+    name: str = property(lambda self: resolution_name(self._seconds))
+
+    def __init__(self, seconds: float, precision: int = 1, start: datetime | None = None,
+                 retain_rows: int | None = None):
+        if seconds <= 0:
+            raise ValueError(f"Rollup resolution must be positive, got {seconds}")
+        super().__init__(precision=precision, retain_rows=retain_rows)
+        self._seconds = seconds
+        self._period_us = round(seconds * 1e6)
+        midnight = start.replace(hour=0, minute=0, second=0, microsecond=0) if start else None
+        self._offset_us = (start - midnight) // timedelta(microseconds=1) if start else 0
+        self._bound = False
+        self._accumulators: list[tuple[str, str, np.ndarray]] = []
+        self._period: int | None = None
+        self._duration = 0.0
+        self._end_us = 0
+
+    def _bind(self, source: Reporter) -> None:
+        """Create a column and an accumulator for each aggregated column of *source*."""
+        for label, _, _ in source._broadband_columns:
+            if label in source._aggregates:
+                self._register(label, 1, None, source._column_channels[label])
+        for label, _, _, freqs in source._band_columns:
+            if label in source._aggregates:
+                self._register(label, len(freqs), freqs, source._column_channels[label])
+        for data in (self._broadband_data, self._band_data):
+            for label, column in data.items():
+                self._accumulators.append(
+                    (label, source._aggregates[label], np.empty(column.shape[1:])))
+        self._aggregates = {label: source._aggregates[label] for label, _, _ in self._accumulators}
+        self._bound = True
+        self._reset()
+
+    def _reset(self) -> None:
+        initial = {"energy": 0.0, "exposure": 0.0, "max": -np.inf, "min": np.inf}
+        for _, kind, acc in self._accumulators:
+            acc.fill(initial[kind])
+        self._duration = 0.0
+
+    def _ingest(self, source: Reporter, i: int, start_us: int, end_us: int) -> None:
+        """Add row *i* of *source*, covering ``(start_us, end_us]``."""
+        if not self._bound:
+            self._bind(source)
+        if not self._accumulators or end_us <= start_us:   # e.g. the engine's row at t = 0
+            return
+        # The period containing the interval's last instant
+        period = (self._offset_us + end_us - 1) // self._period_us
+        if self._period is not None and period != self._period:
+            self._emit()
+        self._period = period
+        dt = (end_us - start_us) / 1e6
+        self._duration += dt
+        self._end_us = end_us
+        for label, kind, acc in self._accumulators:
+            data = source._broadband_data if label in source._broadband_data else source._band_data
+            value = data[label][i]
+            if kind == "energy":
+                acc += 10.0 ** (value / 10.0) * dt
+            elif kind == "exposure":
+                acc += 10.0 ** (value / 10.0)
+            elif kind == "max":
+                np.maximum(acc, value, out=acc)
+            else:
+                np.minimum(acc, value, out=acc)
+
+    def _emit(self) -> None:
+        timestamp = timedelta(microseconds=self._end_us)
+        i = self._next_row(timestamp)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for label, kind, acc in self._accumulators:
+                if kind == "energy":
+                    value = 10.0 * np.log10(acc / self._duration) if self._duration else np.nan
+                elif kind == "exposure":
+                    value = 10.0 * np.log10(acc)
+                else:
+                    value = acc
+                data = self._broadband_data if label in self._broadband_data else self._band_data
+                data[label][i] = value
+        self._commit_row(timestamp)
+        self._reset()
+
+    def finish(self) -> None:
+        """Emit the current, partly filled period (if any)."""
+        if self._period is not None:
+            self._emit()
+            self._period = None
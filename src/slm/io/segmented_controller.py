@@ -0,0 +1,123 @@
+"""Controller that streams a split recording as one continuous signal.
+
+Field recorders (the XL2 among them) split long recordings into numbered
+segment files (``..._Audio_FS128.1dB(PK)_00.wav``, ``_01.wav``, …).
+:class:`SegmentedFileController` reads them back to back: blocks span
+segment boundaries without padding, so filter state and meters carry across
+as if the recording had been a single file.
+"""
+from __future__ import annotations
+
+import glob
+import re
+from pathlib import Path
+from typing import Sequence
+
+import numpy as np
+import soundfile as sf
+
+from slm.io.controller import Controller
+
+_GLOB_CHARS = re.compile(r"[*?[]")
+
+
+def _natural_key(path: Path) -> list:
+    """Sort key that orders ``seg_2`` before ``seg_10``."""
+    return [int(part) if part.isdigit() else part for part in re.split(r"(\d+)", str(path))]
+
+
+def is_segment_pattern(path: str | Path) -> bool:
+    """True if *path* is a glob pattern rather than the name of an existing file."""
+    return bool(_GLOB_CHARS.search(str(path))) and not Path(path).exists()
+
+
+def resolve_segments(segments: str | Path | Sequence[str | Path]) -> list[Path]:
+    """Expand a glob pattern (naturally sorted) or pass an explicit list through in order."""
+    if isinstance(segments, (str, Path)):
+        if not is_segment_pattern(segments):
+            return [Path(segments)]
+        paths = sorted((Path(p) for p in glob.glob(str(segments))), key=_natural_key)
+        if not paths:
+            raise FileNotFoundError(f"No files match {str(segments)!r}")
+        return paths
+    paths = [Path(p) for p in segments]
+    if not paths:
+        raise ValueError("At least one segment file is required")
+    return paths
+
+
+class SegmentedFileController(Controller):
+    """Reads an ordered list (or glob) of segment files as one continuous stream.
+
+    All segments must share samplerate and channel count; this is checked up
+    front.  :attr:`position` is the global sample counter (samples delivered
+    so far) and :attr:`boundaries` gives the global start sample of each
+    segment.  Only the final block of the last segment is zero-padded.
+    """
+
+    blocksize: int = property(lambda self: self._blocksize)
+    samplerate: int = property(lambda self: self._samplerate)
+    sensitivity: float = property(lambda self: self._sensitivity)
+    channels: int = property(lambda self: self._channels)
+    segments: list[Path] = property(lambda self: list(self._segments))
+    boundaries: np.ndarray = property(lambda self: self._boundaries[:-1].copy())
+    frames: int = property(lambda self: int(self._boundaries[-1]))
+    position: int = property(lambda self: self._position)
+    segment_index: int = property(lambda self: self._segment_index)
+    done: bool = property(lambda self: self._done)
+
+    _sensitivity: float = 1.0
+
+    def __init__(self, segments: str | Path | Sequence[str | Path], blocksize: int = 256, **kwargs):
+        super().__init__(**kwargs)
+        self._blocksize = blocksize
+        self._segments = resolve_segments(segments)
+
+        infos = [sf.info(str(p)) for p in self._segments]
+        first = infos[0]
+        for path, info in zip(self._segments[1:], infos[1:]):
+            if (info.samplerate, info.channels) != (first.samplerate, first.channels):
+                raise ValueError(
+                    f"Segment {path.name} is {info.samplerate} Hz / {info.channels} ch, "
+                    f"but {self._segments[0].name} is {first.samplerate} Hz / {first.channels} ch"
+                )
+        self._samplerate = first.samplerate
+        self._channels = first.channels
+        self._boundaries = np.concatenate(([0], np.cumsum([info.frames for info in infos])))
+
+        self._position = 0
+        self._segment_index = 0
+        self._done = False
+        self._sf: sf.SoundFile | None = sf.SoundFile(str(self._segments[0]))
+
+    def _next_segment(self) -> None:
+        self._sf.close()
+        self._segment_index += 1
+        if self._segment_index < len(self._segments):
+            self._sf = sf.SoundFile(str(self._segments[self._segment_index]))
+        else:
+            self._sf = None
+
+    def read_block(self) -> tuple[np.ndarray, int]:
+        if self._done:
+            raise StopIteration
+        block = np.zeros((self._blocksize, self._channels))
+        filled = 0
+        while filled < self._blocksize and self._sf is not None:
+            filled += len(self._sf.read(always_2d=True, out=block[filled:]))
+            if filled < self._blocksize:
+                self._next_segment()
+        if filled == 0:
+            self._done = True
+            raise StopIteration
+        self._position += filled
+        return block, next(self._counter)
+
+    def calibrate(self, target_spl=94.0):
+        raise NotImplementedError()
+
+    def stop(self):
+        self._done = True
+        if self._sf is not None:
+            self._sf.close()
+            self._sf = None
@@ -6,28 +6,40 @@ beyond the ``sounddevice`` package.
 """
 from __future__ import annotations
 
-import queue
 import threading
+import time
+from typing import TYPE_CHECKING
 
 import numpy as np
 try:
     import sounddevice as sd
-except ImportError as _exc:
+except (ImportError, OSError) as _exc:
+    # sounddevice raises OSError when the PortAudio library itself is missing
     raise ImportError(
-        "Real-time audio requires the sounddevice package. "
+        "Real-time audio requires the sounddevice package and the PortAudio library. "
         "Install it with: pip install sounddevice"
     ) from _exc
 
 from slm.io.realtime_controller import RealtimeController
+from slm.io.ring_buffer import RingBuffer
+
+if TYPE_CHECKING:
+    from slm.io.capture import CaptureWriter
 
 
 class SounddeviceController(RealtimeController):
     """Cross-platform real-time audio controller using PortAudio via sounddevice.
 
-    The PortAudio callback runs on a dedicated OS audio thread and pushes
-    blocks into a bounded :class:`queue.Queue`.  :meth:`read_block` blocks
-    on the queue (with a short timeout) so the engine's main-thread loop
-    stays responsive to :meth:`stop` and ``KeyboardInterrupt``.
+    The PortAudio callback runs on a dedicated OS audio thread and copies
+    samples into a preallocated lock-free :class:`~slm.io.ring_buffer.RingBuffer`
+    — no allocation and no locking in the callback.  :meth:`read_block`
+    polls the ring until a full block is available, so the engine's
+    main-thread loop stays responsive to :meth:`stop` and ``KeyboardInterrupt``.
+
+    ``buffer_seconds`` and ``latency`` set the latency/robustness
+    trade-off: the ring absorbs engine stalls up to ``buffer_seconds`` long
+    before samples are lost, and ``latency`` is the PortAudio input latency
+    (``'low'``, ``'high'`` or seconds; larger survives more scheduling jitter).
 
     Parameters
     ----------
@@ -42,10 +54,26 @@ class SounddeviceController(RealtimeController):
         Number of input channels (default 1).
     dtype:
         Sample format passed to sounddevice (default ``'float32'``).
+    buffer_seconds:
+        Capacity of the ring buffer between the callback and
+        :meth:`read_block` (default 2 s).  If the engine falls further
+        behind, the newest samples are dropped and counted in
+        :attr:`lost_samples` / :attr:`lost_events`.
+    latency:
+        PortAudio input latency passed to ``sd.InputStream``
+        (default ``None``: the sounddevice default).
     queue_maxsize:
-        Maximum number of blocks buffered between the callback and
-        :meth:`read_block`.  If the engine falls behind, excess blocks
-        are dropped and :attr:`overruns` is incremented (default 4).
+        Legacy alternative to *buffer_seconds*: capacity in blocks.
+    capture:
+        Optional :class:`~slm.io.capture.CaptureWriter` that receives a copy
+        of every block handed to the engine.  Writing happens on its own
+        thread, so a slow disk never delays :meth:`read_block`.  The
+        controller never closes it: whoever created the writer closes it
+        after the measurement, and gets any write error from that
+        :meth:`~slm.io.capture.CaptureWriter.close`.
+
+    The returned block is reused and only valid until the next
+    :meth:`read_block` call.
     """
 
     def __init__(
@@ -55,7 +83,10 @@ class SounddeviceController(RealtimeController):
         blocksize: int = 1_024,
         channels: int = 1,
         dtype: str = "float32",
-        queue_maxsize: int = 4,
+        buffer_seconds: float = 2.0,
+        latency: str | float | None = None,
+        queue_maxsize: int | None = None,
+        capture: CaptureWriter | None = None,
         **kwargs,
     ) -> None:
         super().__init__(**kwargs)
@@ -64,11 +95,19 @@ class SounddeviceController(RealtimeController):
         self._blocksize = blocksize
         self._channels = channels
         self._dtype = dtype
+        self._latency = latency
         self._sensitivity: float = 1.0
-        self._queue: queue.Queue[np.ndarray] = queue.Queue(maxsize=queue_maxsize)
+        if queue_maxsize is not None:
+            capacity = queue_maxsize * blocksize
+        else:
+            capacity = max(blocksize, round(buffer_seconds * samplerate))
+        self._ring = RingBuffer(capacity, channels, dtype=dtype)
+        self._block = np.zeros((blocksize, channels), dtype=dtype)
+        self._poll_interval = blocksize / samplerate / 4
         self._stop_event = threading.Event()
         self._stream: sd.InputStream | None = None
         self._overruns: int = 0
+        self._capture = capture
 
     # ------------------------------------------------------------------
     # RealtimeController interface
@@ -97,6 +136,7 @@ class SounddeviceController(RealtimeController):
             blocksize=self._blocksize,
             channels=self._channels,
             dtype=self._dtype,
+            latency=self._latency,
             callback=self._callback,
         )
         self._stream.start()
@@ -113,27 +153,34 @@ class SounddeviceController(RealtimeController):
     def blocksize(self) -> int:
         return self._blocksize
 
+    @property
+    def channels(self) -> int:
+        return self._channels
+
     @property
     def sensitivity(self) -> float:
         return self._sensitivity
 
     def read_block(self) -> tuple[np.ndarray, int]:
-        """Block until the next audio block is available, then return it.
+        """Wait until the next audio block is available, then return it.
 
         Returns ``(block, index)`` where *block* has shape
         ``(blocksize, channels)`` — matching the :class:`FileController`
         convention so the engine's ``.transpose()`` call works unchanged.
 
         Raises :exc:`StopIteration` once :meth:`stop` has been called and
-        the queue is drained.
+        no full block remains in the ring buffer.
         """
-        while True:
-            try:
-                block = self._queue.get(timeout=0.5)
-                return block, next(self._counter)
-            except queue.Empty:
-                if self._stop_event.is_set():
-                    raise StopIteration
+        while not self._ring.read_into(self._block):
+            if self._stop_event.is_set():
+                # The producer may have written between the read and the check.
+                if self._ring.read_into(self._block):
+                    break
+                raise StopIteration
+            time.sleep(self._poll_interval)
+        if self._capture is not None:
+            self._capture.write(self._block)
+        return self._block, next(self._counter)
 
     def stop(self) -> None:
         """Signal the stream to stop and close the PortAudio device."""
@@ -166,9 +213,33 @@ class SounddeviceController(RealtimeController):
 
     @property
     def overruns(self) -> int:
-        """Number of blocks dropped due to the engine processing too slowly."""
+        """Number of callbacks that lost samples (ring full or PortAudio input overflow)."""
         return self._overruns
 
+    @property
+    def lost_samples(self) -> int:
+        """Frames dropped because the ring buffer was full."""
+        return self._ring.lost_frames
+
+    @property
+    def lost_events(self) -> list[tuple[float, int | None]]:
+        """``(adc_time, frames)`` of recent losses, in PortAudio stream time.
+
+        Ring-buffer overflows carry their exact frame count; PortAudio input
+        overflows are logged with ``frames=None`` since their size is unknown.
+        """
+        return self._ring.lost_events
+
+    @property
+    def buffer_stats(self) -> dict:
+        """Ring-buffer fill level, high watermark and capacity, in frames."""
+        return {
+            "capacity": self._ring.capacity,
+            "available": self._ring.available,
+            "high_watermark": self._ring.high_watermark,
+            "lost_samples": self._ring.lost_frames,
+        }
+
     # ------------------------------------------------------------------
     # Internal
     # ------------------------------------------------------------------
@@ -180,9 +251,11 @@ class SounddeviceController(RealtimeController):
         time_info,
         status: sd.CallbackFlags,
     ) -> None:
+        # Runs on the PortAudio thread: no allocation beyond scalars, no locks.
+        adc_time = getattr(time_info, "inputBufferAdcTime", float("nan"))
         if status:
+            # PortAudio does not say how much it dropped upstream
+            self._overruns += 1
+            self._ring.record_loss(None, adc_time)
+        if self._ring.write(indata, adc_time) < frames and not status:
             self._overruns += 1
-        try:
-            self._queue.put_nowait(indata.copy())
-        except queue.Full:
-            self._overruns += 1
\ No newline at end of file
@@ -0,0 +1,178 @@
+"""Controller for raw interleaved PCM from stdin, FIFOs and sockets.
+
+Lets the meter run as a headless pipeline stage::
+
+    arecord -f S24_3LE -r 48000 -c 1 -t raw | python -m slm --stream - --format S24_3LE ...
+
+Supported sources:
+
+* ``-`` / ``stdin`` — standard input
+* a filesystem path — a named pipe (FIFO) or any readable file
+* ``unix://PATH`` / ``tcp://HOST:PORT`` — connect to a Unix or TCP socket
+* ``unix-listen://PATH`` / ``tcp-listen://HOST:PORT`` — accept one connection
+* an open socket or binary file object
+"""
+from __future__ import annotations
+
+import os
+import socket
+import sys
+from pathlib import Path
+from typing import BinaryIO, Callable
+
+import numpy as np
+
+from slm.io import pcm
+from slm.io.controller import Controller
+from slm.io.pcm import SampleFormat
+
+
+def _split_host_port(address: str) -> tuple[str, int]:
+    host, _, port = address.rpartition(":")
+    return host or "0.0.0.0", int(port)
+
+
+def _accept_one(family: int, address, timeout: float | None) -> socket.socket:
+    server = socket.socket(family, socket.SOCK_STREAM)
+    bound = False
+    try:
+        if family != socket.AF_UNIX:
+            server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        server.bind(address)
+        bound = True
+        server.listen(1)
+        server.settimeout(timeout)
+        conn, _ = server.accept()
+        conn.settimeout(None)
+        return conn
+    finally:
+        server.close()
+        if bound and family == socket.AF_UNIX:
+            os.unlink(address)
+
+
+def open_source(source, connect_timeout: float | None = None) -> tuple[Callable, Callable]:
+    """Open *source* and return ``(readinto, close)``.
+
+    ``readinto(buffer)`` performs at most one underlying read and returns the
+    byte count (``0`` at end of stream).
+    """
+    if isinstance(source, socket.socket):
+        return source.recv_into, source.close
+    if hasattr(source, "readinto"):
+        return getattr(source, "readinto1", source.readinto), lambda: None   # caller owns it
+
+    spec = str(source)
+    if spec in ("-", "stdin"):
+        stdin: BinaryIO = sys.stdin.buffer
+        return stdin.readinto1, lambda: None
+    if spec.startswith(("tcp://", "unix://", "tcp-listen://", "unix-listen://")):
+        scheme, _, address = spec.partition("://")
+        family = socket.AF_UNIX if scheme.startswith("unix") else socket.AF_INET
+        target = address if family == socket.AF_UNIX else _split_host_port(address)
+        if scheme.endswith("-listen"):
+            sock = _accept_one(family, target, connect_timeout)
+        elif family == socket.AF_UNIX:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(connect_timeout)
+            sock.connect(target)
+            sock.settimeout(None)
+        else:
+            sock = socket.create_connection(target, timeout=connect_timeout)
+            sock.settimeout(None)
+        return sock.recv_into, sock.close
+
+    f = open(Path(spec), "rb", buffering=0)   # unbuffered: one read() per call, even on a FIFO
+    return f.readinto, f.close
+
+
+class StreamController(Controller):
+    """Reads raw interleaved little-endian PCM from a pipe, socket or stdin.
+
+    The stream is received into one preallocated buffer of about
+    *chunk_seconds* of audio.  Each read takes whatever is available (up to
+    the free space), and blocks are converted straight out of that buffer
+    through zero-copy ``np.frombuffer`` views.
+
+    Backpressure is explicit and bounded: the controller only reads when the
+    engine asks for a block and never buffers more than one chunk, so a meter
+    that falls behind stalls the producer (pipe or TCP flow control) instead
+    of growing memory or silently dropping audio.
+
+    The final partial block is zero-padded; the returned block is reused and
+    only valid until the next :meth:`read_block` call.
+    """
+
+    blocksize: int = property(lambda self: self._blocksize)
+    samplerate: int = property(lambda self: self._samplerate)
+    sensitivity: float = property(lambda self: self._sensitivity)
+    channels: int = property(lambda self: self._channels)
+    sample_format: SampleFormat = property(lambda self: self._format)
+    bytes_read: int = property(lambda self: self._bytes_read)
+    done: bool = property(lambda self: self._done)
+
+    _sensitivity: float = 1.0
+
+    def __init__(self, source, samplerate: int, channels: int = 1,
+                 sample_format: str | SampleFormat = "S16_LE", blocksize: int = 1024,
+                 chunk_seconds: float = 0.5, connect_timeout: float | None = None, **kwargs):
+        super().__init__(**kwargs)
+        self._samplerate = samplerate
+        self._channels = channels
+        self._blocksize = blocksize
+        self._format = pcm.sample_format(sample_format)
+        self._frame_bytes = channels * self._format.sample_bytes
+        self._block_bytes = blocksize * self._frame_bytes
+
+        chunk_bytes = max(2 * self._block_bytes, round(chunk_seconds * samplerate) * self._frame_bytes)
+        self._raw = np.zeros(chunk_bytes, dtype=np.uint8)
+        self._view = memoryview(self._raw)
+        self._start = 0   # first unconsumed byte
+        self._end = 0     # one past the last received byte
+        self._eof = False
+        self._bytes_read = 0
+
+        self._block = np.zeros((blocksize, channels))
+        self._scratch = self._format.scratch(blocksize, channels)
+        self._done = False
+        self._readinto, self._close = open_source(source, connect_timeout=connect_timeout)
+
+    def _fill(self) -> None:
+        """Receive until one block is buffered or the stream ends."""
+        while self._end - self._start < self._block_bytes and not self._eof:
+            if self._start + self._block_bytes > len(self._raw):
+                pending = self._end - self._start
+                self._raw[:pending] = self._raw[self._start:self._end]
+                self._start, self._end = 0, pending
+            n = self._readinto(self._view[self._end:])
+            if not n:
+                self._eof = True
+            else:
+                self._end += n
+                self._bytes_read += n
+
+    def read_block(self) -> tuple[np.ndarray, int]:
+        if self._done:
+            raise StopIteration
+        self._fill()
+        frames = min(self._blocksize, (self._end - self._start) // self._frame_bytes)
+        if frames == 0:
+            self.stop()
+            raise StopIteration
+
+        raw = self._format.frombuffer(self._raw, frames, self._channels, offset=self._start)
+        self._format.to_float(raw, self._block[:frames], self._scratch)
+        if frames < self._blocksize:
+            self._block[frames:] = 0.0
+            self._start = self._end   # end of stream: drop any trailing partial frame
+        else:
+            self._start += self._block_bytes
+        return self._block, next(self._counter)
+
+    def calibrate(self, target_spl=94.0):
+        raise NotImplementedError()
+
+    def stop(self):
+        if not self._done:
+            self._done = True
+            self._close()
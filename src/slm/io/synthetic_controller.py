@@ -0,0 +1,298 @@
+"""Controller generating synthetic test signals block by block.
+
+For benchmarks, soak tests and IEC test fixtures that need long, exactly
+reproducible input without audio files::
+
+    from slm.io.synthetic_controller import PinkNoise, Sine, SyntheticController
+
+    ctrl = SyntheticController([PinkNoise(rms=0.1), [PinkNoise(rms=0.1), Sine(1000, 0.5)]],
+                               samplerate=48000, blocksize=4800, duration=3600, seed=1)
+
+Each signal renders straight into a preallocated buffer, so memory use does
+not depend on *duration* and hours of signal stream at close to memory
+bandwidth.  All values are in controller units (Pa at sensitivity 1.0).
+"""
+from __future__ import annotations
+
+import itertools
+from abc import ABC, abstractmethod
+from math import log, pi
+
+import numpy as np
+
+from slm.io.controller import Controller
+
+
+# ---------------------------------------------------------------------------
+# Signals
+# ---------------------------------------------------------------------------
+
+class Signal(ABC):
+    """One mono signal source.
+
+    :meth:`bind` is called once by the controller with the sample rate, the
+    block size and an independent random generator; :meth:`render` then
+    writes consecutive blocks.  Deterministic signals derive everything from
+    the absolute sample index *start*, so they never drift over long runs.
+    """
+
+    samplerate: int
+
+    def bind(self, samplerate: int, blocksize: int, rng: np.random.Generator) -> None:
+        """Prepare for rendering blocks of *blocksize* samples; (re)starts the signal."""
+        self.samplerate = samplerate
+        self._ramp = np.arange(blocksize, dtype=np.int64)
+        self._index = np.empty(blocksize, dtype=np.int64)
+
+    @abstractmethod
+    def render(self, start: int, out: np.ndarray) -> None:
+        """Write samples *start* … *start* + ``len(out)`` - 1 into *out*."""
+        ...
+
+    def _positions(self, start: int, n: int, period: int | None = None) -> np.ndarray:
+        """Absolute sample indices of the block (modulo *period*), in a reused buffer."""
+        index = self._index[:n]
+        np.add(self._ramp[:n], start, out=index)
+        if period:
+            np.remainder(index, period, out=index)
+        return index
+
+
+class WhiteNoise(Signal):
+    """Gaussian white noise with RMS value *rms*."""
+
+    def __init__(self, rms: float = 1.0):
+        self.rms = rms
+
+    def bind(self, samplerate, blocksize, rng):
+        super().bind(samplerate, blocksize, rng)
+        self._rng = rng
+
+    def render(self, start, out):
+        self._rng.standard_normal(out=out)
+        out *= self.rms
+
+
+class PinkNoise(WhiteNoise):
+    """Pink (1/f power) noise with RMS value *rms*, from 10 Hz to Nyquist.
+
+    White noise through the -10 dB/decade IIR approximation of
+    J. O. Smith, accurate to about ±0.5 dB across the audio band.  The
+    filter state carries over between blocks and is warmed up in
+    :meth:`bind`, so the first block is already stationary.
+    """
+
+    _B = np.array([0.049922035, -0.095993537, 0.050612699, -0.004408786])
+    _A = np.array([1.0, -2.494956002, 2.017265875, -0.522189400])
+    _WARMUP = 16384
+
+    def bind(self, samplerate, blocksize, rng):
+        from scipy.signal import lfilter
+        super().bind(samplerate, blocksize, rng)
+        self._lfilter = lfilter
+        self._white = np.empty(blocksize)
+        impulse = np.zeros(self._WARMUP)
+        impulse[0] = 1.0
+        self._gain = 1.0 / np.sqrt(np.sum(lfilter(self._B, self._A, impulse) ** 2))
+        _, self._zi = lfilter(self._B, self._A, rng.standard_normal(self._WARMUP),
+                              zi=np.zeros(len(self._A) - 1))
+
+    def render(self, start, out):
+        white = self._white[:len(out)]
+        self._rng.standard_normal(out=white)
+        out[:], self._zi = self._lfilter(self._B, self._A, white, zi=self._zi)
+        out *= self.rms * self._gain
+
+
+class Sine(Signal):
+    """Continuous sine of *frequency* Hz and peak *amplitude*, starting at *phase* rad."""
+
+    def __init__(self, frequency: float, amplitude: float = 1.0, phase: float = 0.0):
+        self.frequency = frequency
+        self.amplitude = amplitude
+        self.phase = phase
+
+    def bind(self, samplerate, blocksize, rng):
+        super().bind(samplerate, blocksize, rng)
+        self._omega = 2 * pi * self.frequency / samplerate
+        self._ramp_rad = self._omega * np.arange(blocksize)
+
+    def render(self, start, out):
+        # Phase at *start*, reduced in cycles first so precision holds over hours
+        cycles = (self.frequency * start / self.samplerate) % 1.0
+        np.add(self._ramp_rad[:len(out)], 2 * pi * cycles + self.phase, out=out)
+        np.sin(out, out=out)
+        out *= self.amplitude
+
+
+class ToneBurst(Signal):
+    """Sine bursts of *burst* seconds, repeated every *period* seconds.
+
+    Each burst starts at a zero crossing (IEC 61672-1 §5.9).  With
+    ``period=None`` there is a single burst at the start, then silence.
+    """
+
+    def __init__(self, frequency: float, burst: float, period: float | None = None,
+                 amplitude: float = 1.0):
+        self.frequency = frequency
+        self.burst = burst
+        self.period = period
+        self.amplitude = amplitude
+
+    def bind(self, samplerate, blocksize, rng):
+        super().bind(samplerate, blocksize, rng)
+        self._burst_samples = round(self.burst * samplerate)
+        self._period_samples = round(self.period * samplerate) if self.period else None
+        if self._period_samples is not None and self._period_samples < self._burst_samples:
+            raise ValueError(f"period ({self.period} s) is shorter than the burst ({self.burst} s)")
+        self._omega = 2 * pi * self.frequency / samplerate
+
+    def render(self, start, out):
+        n = len(out)
+        if self._period_samples is None and start >= self._burst_samples:
+            out[:] = 0.0
+            return
+        pos = self._positions(start, n, self._period_samples)
+        np.multiply(pos, self._omega, out=out)
+        np.sin(out, out=out)
+        out *= self.amplitude
+        out[pos >= self._burst_samples] = 0.0
+
+
+class Sweep(Signal):
+    """Sine sweep from *f_start* to *f_end* Hz over *duration* seconds, then repeated.
+
+    ``method="log"`` is the exponential (constant time per octave) sweep,
+    ``"linear"`` a constant Hz/s sweep.
+    """
+
+    def __init__(self, f_start: float, f_end: float, duration: float, amplitude: float = 1.0,
+                 method: str = "log"):
+        if method not in ("log", "linear"):
+            raise ValueError(f"Unknown sweep method {method!r}. Expected 'log' or 'linear'.")
+        if method == "log" and (f_start <= 0 or f_end <= 0 or f_start == f_end):
+            raise ValueError("A log sweep needs distinct, positive start and end frequencies")
+        self.f_start = f_start
+        self.f_end = f_end
+        self.duration = duration
+        self.amplitude = amplitude
+        self.method = method
+
+    def bind(self, samplerate, blocksize, rng):
+        super().bind(samplerate, blocksize, rng)
+        self._period_samples = max(1, round(self.duration * samplerate))
+        self._tmp = np.empty(blocksize)
+
+    def render(self, start, out):
+        pos = self._positions(start, len(out), self._period_samples)
+        np.multiply(pos, 1.0 / self.samplerate, out=out)   # t within the sweep
+        f1, f2, T = self.f_start, self.f_end, self.duration
+        if self.method == "log":
+            # 2π f1 L (exp(t / L) - 1),  L = T / ln(f2 / f1)
+            L = T / log(f2 / f1)
+            out *= 1.0 / L
+            np.expm1(out, out=out)
+            out *= 2 * pi * f1 * L
+        else:
+            # 2π t (f1 + (f2 - f1) t / 2T)
+            tmp = self._tmp[:len(out)]
+            np.multiply(out, (f2 - f1) / (2 * T), out=tmp)
+            tmp += f1
+            out *= tmp
+            out *= 2 * pi
+        np.sin(out, out=out)
+        out *= self.amplitude
+
+
+# ---------------------------------------------------------------------------
+# Controller
+# ---------------------------------------------------------------------------
+
+class SyntheticController(Controller):
+    """Streams synthetic signals as blocks of shape ``(blocksize, channels)``.
+
+    *signals* is a single :class:`Signal` (one channel) or a list with one
+    entry per channel, each a :class:`Signal` or a list of signals that are
+    summed.  A signal object used on several channels is rendered once per
+    block and shared, which gives fully correlated channels; separate
+    objects are independent.
+
+    Every distinct signal gets its own generator spawned from *seed*, so a
+    run is reproducible and adding a signal does not change the others.
+    *duration* (seconds) ends the stream, zero-padding the last block;
+    ``None`` streams until :meth:`stop`.  The returned block is reused and
+    only valid until the next :meth:`read_block` call.
+    """
+
+    blocksize: int = property(lambda self: self._blocksize)
+    samplerate: int = property(lambda self: self._samplerate)
+    sensitivity: float = property(lambda self: self._sensitivity)
+    channels: int = property(lambda self: self._block.shape[1])
+    position: int = property(lambda self: self._position)
+    done: bool = property(lambda self: self._done)
+
+    _sensitivity: float = 1.0
+
+    def __init__(self, signals: Signal | list, samplerate: int = 48000, blocksize: int = 1024,
+                 duration: float | None = None, seed: int | None = 0, dtype=np.float64,
+                 **kwargs):
+        super().__init__(**kwargs)
+        if isinstance(signals, Signal):
+            signals = [signals]
+        self._mix = [[s] if isinstance(s, Signal) else list(s) for s in signals]
+        if not self._mix:
+            raise ValueError("At least one channel is required")
+        self._samplerate = samplerate
+        self._blocksize = blocksize
+        self._frames = None if duration is None else round(duration * samplerate)
+        self._seed = seed
+        self._block = np.zeros((blocksize, len(self._mix)), dtype=dtype)
+
+        # Distinct signals in order of first use; each renders into its own buffer
+        self._sources: list[Signal] = []
+        for channel in self._mix:
+            for signal in channel:
+                if not any(signal is s for s in self._sources):
+                    self._sources.append(signal)
+        self._buffers = np.zeros((len(self._sources), blocksize))
+        self._routing = [[next(i for i, s in enumerate(self._sources) if s is signal)
+                          for signal in channel] for channel in self._mix]
+        self.reset()
+
+    def reset(self) -> None:
+        """Restart every signal from sample 0 with the original seed."""
+        children = np.random.SeedSequence(self._seed).spawn(len(self._sources))
+        for signal, seq in zip(self._sources, children):
+            signal.bind(self._samplerate, self._blocksize, np.random.default_rng(seq))
+        self._position = 0
+        self._counter = itertools.count(0)
+        self._done = False
+
+    def read_block(self) -> tuple[np.ndarray, int]:
+        if self._done:
+            raise StopIteration
+        n = self._blocksize
+        if self._frames is not None:
+            n = min(n, self._frames - self._position)
+            if n <= 0:
+                self._done = True
+                raise StopIteration
+
+        for signal, buffer in zip(self._sources, self._buffers):
+            signal.render(self._position, buffer[:n])
+        for ch, sources in enumerate(self._routing):
+            out = self._block[:n, ch]
+            out[:] = self._buffers[sources[0], :n]
+            for i in sources[1:]:
+                out += self._buffers[i, :n]
+        if n < self._blocksize:
+            self._block[n:] = 0.0
+
+        self._position += n
+        return self._block, next(self._counter)
+
+    def calibrate(self, target_spl=94.0):
+        raise NotImplementedError()
+
+    def stop(self):
+        self._done = True
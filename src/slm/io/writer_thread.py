@@ -0,0 +1,121 @@
+"""Background thread that takes disk I/O off the engine thread.
+
+:class:`WriterThread` is the queue-and-thread core shared by the sinks that
+write while measuring (:class:`~slm.io.capture.CaptureWriter`,
+:class:`~slm.io.log_writer.LogWriter`,
+:class:`~slm.io.events.EventDetector`,
+:class:`~slm.io.energy_index.EnergyIndexWriter`).  The producer only puts
+items on an unbounded queue; a daemon thread hands them to a callback in
+order.  The first exception the callbacks raise is kept and re-raised from
+:meth:`WriterThread.close`, so an I/O error surfaces on the owner's thread
+instead of dying silently with the worker.
+"""
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from typing import Any, Callable
+
+_STOP = object()
+_IDLE = object()
+
+
+class WriterThread:
+    """Runs *handle(item)* on a daemon thread for every item :meth:`put` on its queue.
+
+    Parameters
+    ----------
+    name:
+        Thread name.
+    handle:
+        Called with each item, in order.
+    flush:
+        Called on :meth:`flush`, every *flush_interval* seconds while the
+        thread is running, and once more before it stops.
+    finish:
+        Called last on the thread, even after an error (close files here).
+    flush_interval:
+        Seconds between periodic *flush* calls (``None``: only on demand).
+    after_error:
+        Keep calling *handle* for items queued after an error (e.g. to
+        recycle buffers); by default they are discarded.
+    """
+
+    error: BaseException | None = property(lambda self: self._error)
+
+    def __init__(self, name: str, handle: Callable[[Any], None], *,
+                 flush: Callable[[], None] | None = None,
+                 finish: Callable[[], None] | None = None,
+                 flush_interval: float | None = None, after_error: bool = False):
+        self._handle = handle
+        self._flush = flush
+        self._finish = finish
+        self._flush_interval = flush_interval
+        self._after_error = after_error
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._error: BaseException | None = None
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def put(self, item: Any) -> None:
+        """Queue *item*; never waits for the disk."""
+        self._queue.put(item)
+
+    def flush(self) -> None:
+        """Handle everything queued so far, run the *flush* callback and wait until done."""
+        if self._stopped:
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait()
+
+    def close(self) -> None:
+        """Handle the remaining items, stop the thread and re-raise its first error."""
+        if not self._stopped:
+            self._stopped = True
+            self._queue.put(_STOP)
+            self._thread.join()
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _run(self) -> None:
+        interval = self._flush_interval
+        deadline = None if interval is None else time.monotonic() + interval
+        try:
+            while True:
+                try:
+                    timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    item = _IDLE
+                if item is _STOP:
+                    self._call(self._flush)
+                    break
+                if isinstance(item, threading.Event):
+                    self._call(self._flush)
+                    item.set()
+                    continue
+                if item is not _IDLE:
+                    self._call(self._handle, item)
+                if deadline is not None and time.monotonic() >= deadline:
+                    self._call(self._flush)
+                    deadline = time.monotonic() + interval
+        finally:
+            if self._finish is not None:
+                try:
+                    self._finish()
+                except BaseException as exc:
+                    if self._error is None:
+                        self._error = exc
+
+    def _call(self, fn: Callable | None, *args) -> None:
+        if fn is None or (self._error is not None and not self._after_error):
+            return
+        try:
+            fn(*args)
+        except BaseException as exc:   # reported from close()
+            if self._error is None:
+                self._error = exc
@@ -59,8 +59,14 @@ class LeqAccumulator(AccumulatingMeter):
     Attaches to a frequency-weighting output (linear Pa).  Squares the input
     internally.  ``read()`` returns mean square pressure (Pa²) so that
     ``plugin.read_db()`` gives the correct Leq in dB SPL.
+
+    :attr:`sum_sq` and :attr:`n_samples` are the running totals since the
+    start (or the last :meth:`reset`).
     """
 
+    sum_sq: np.ndarray = property(lambda self: self._sum_sq)
+    n_samples: int = property(lambda self: self._n_samples)
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._sum_sq = np.zeros((self.width,))
@@ -90,7 +96,7 @@ class MaxAccumulator(AccumulatingMeter):
         self._acc = np.full((self.width,), -np.inf)
 
     def process(self, block: np.ndarray):
-        self._acc = np.maximum(self._acc, np.max(block, axis=-1))
+        np.maximum(self._acc, np.max(block, axis=-1), out=self._acc)
 
     def read(self) -> np.ndarray:
         return self._acc
@@ -111,7 +117,7 @@ class MinAccumulator(AccumulatingMeter):
         self._acc = np.full((self.width,), np.inf)
 
     def process(self, block: np.ndarray):
-        self._acc = np.minimum(self._acc, np.min(block, axis=-1))
+        np.minimum(self._acc, np.min(block, axis=-1), out=self._acc)
 
     def read(self) -> np.ndarray:
         return self._acc
@@ -133,7 +139,7 @@ class LastAccumulatingMeter(AccumulatingMeter):
         self._last = np.zeros((self.width,))
 
     def process(self, block: np.ndarray):
-        self._last = block[:, -1]
+        self._last[:] = block[:, -1]
 
     def read(self) -> np.ndarray:
         return self._last
@@ -7,6 +7,7 @@ from scipy import signal as sig
 
 from pyoctaveband import OctaveFilterBank
 
+from slm import filter_cache
 from slm.plugin_meter import PluginMeter
 
 if TYPE_CHECKING:
@@ -59,10 +60,10 @@ class PluginOctaveBand(PluginMeter):
         if self.input.width != 1:
             raise ValueError("OctaveBandPlugin only supports inputs of width=1")
 
-        self._filter_bank = OctaveFilterBank(fs=self.samplerate, fraction=bands_per_oct, limits=list(limits),
-                                             show=False, order=order, filter_type=filter_type,
-                                             ripple=ripple, attenuation=attenuation,
-                                             stateful=True, steady_ic=not zero_zi, resample=False)
+        self._filter_bank = filter_cache.octave_filter_bank(
+            self.samplerate, fraction=bands_per_oct, limits=limits, order=order,
+            filter_type=filter_type, ripple=ripple, attenuation=attenuation, steady_ic=not zero_zi,
+        )
 
         self._width = self.n_bands
         self.output = np.zeros((self.n_bands, self.blocksize))
@@ -0,0 +1,170 @@
+"""Tear-free meter snapshots for readers on other threads.
+
+Meters are updated in place on the engine thread, so a GUI, server or shell
+calling ``plugin.read_db()`` while a block is being processed can see some
+meters before the block and some after it.  :class:`MeterSnapshots` copies
+the value of every meter into one of two preallocated buffers after each
+block (or every *interval* seconds of input) and then publishes it by
+bumping a sequence number.  The engine thread never waits on a reader::
+
+    snapshots = MeterSnapshots(engine)         # after build_chain
+    ...                                        # engine.run() on its own thread
+    view = snapshots.reader()                  # on the reading thread
+    while measuring:
+        if view.update():
+            show(view.timestamp, view.column("LAeq"), view.column("LZeq:bands"))
+
+A :class:`SnapshotReader` copies the latest published buffer into buffers of
+its own and checks the sequence number afterwards, retrying if the engine
+started overwriting that buffer meanwhile (a seqlock).  All values it
+returns come from the same block, and reading them allocates no arrays.
+"""
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from slm.constants import REFERENCE_PRESSURE
+from slm.plugin_meter import PluginMeter
+
+if TYPE_CHECKING:
+    from slm.engine import Engine
+
+
+class MeterSnapshots:
+    """Double-buffered snapshots of every meter in *engine*.
+
+    Parameters
+    ----------
+    engine:
+        The engine to attach to.  Meters are collected from its buses when
+        the snapshots are created, so build the chain first.
+    interval:
+        Publish at most once per *interval* seconds of input (e.g.
+        ``engine.dt``); ``None`` publishes after every block.
+    """
+
+    sequence: int = property(lambda self: self._sequence)
+    """Number of snapshots published so far."""
+
+    def __init__(self, engine: Engine, interval: float | None = None):
+        self._engine = engine
+        self._slots: list[tuple[PluginMeter, str, object, slice]] = []
+        self._index: dict[tuple[PluginMeter, str], slice] = {}
+        pos = 0
+        for bus in engine._busses.values():
+            for plugin in bus.plugins:
+                if not isinstance(plugin, PluginMeter):
+                    continue
+                for name, meter in plugin.meters.items():
+                    where = slice(pos, pos + plugin.width)
+                    self._slots.append((plugin, name, meter, where))
+                    self._index[(plugin, name)] = where
+                    pos += plugin.width
+        self._columns: dict[str, slice] = {}
+        reporter = engine.reporter
+        for label, plugin, name in reporter._broadband_columns:
+            where = self._index.get((plugin, name))
+            if where is not None:
+                self._columns[label] = slice(where.start, where.start + 1)
+        for label, plugin, name, _ in reporter._band_columns:
+            if (plugin, name) in self._index:
+                self._columns[label] = self._index[(plugin, name)]
+
+        self._buffers = (np.full(pos, np.nan), np.full(pos, np.nan))
+        self._frames = [0, 0]              # input frames covered by each buffer
+        self._sequence = 0
+        self._samplerate = engine.input_samplerate
+        self._interval_frames = 0 if interval is None else round(interval * self._samplerate)
+        self._frames_seen = 0
+        self._next_publish = 0
+        engine.add_listener(self._on_block)
+
+    def _on_block(self, block: np.ndarray) -> None:
+        self._frames_seen += len(block)
+        if self._frames_seen >= self._next_publish:
+            self.publish()
+            self._next_publish = self._frames_seen + self._interval_frames
+
+    def publish(self) -> None:
+        """Copy every meter into the back buffer, then make it the current snapshot.
+
+        Called on the engine thread after each block (see *interval*); call it
+        directly only from that thread.
+        """
+        sequence = self._sequence + 1
+        back = self._buffers[sequence % 2]
+        for _, _, meter, where in self._slots:
+            back[where] = meter.read()
+        self._frames[sequence % 2] = self._frames_seen
+        self._sequence = sequence          # readers switch to *back* from here on
+
+    def reader(self) -> SnapshotReader:
+        """A reader with its own buffers; use one per reading thread."""
+        return SnapshotReader(self)
+
+
+class SnapshotReader:
+    """Consistent copy of the latest snapshot, refreshed by :meth:`update`.
+
+    Arrays returned by :meth:`read_lin`, :meth:`read_db` and :meth:`column`
+    are read-only views into this reader's buffers; they change on the next
+    :meth:`update`.  dB values use the plugins' sensitivity at the time the
+    reader was created.
+    """
+
+    sequence: int = property(lambda self: self._sequence)
+    timestamp: timedelta = property(
+        lambda self: timedelta(seconds=self._frames / self._source._samplerate))
+    """Input time the snapshot was taken at (end of its last block)."""
+
+    def __init__(self, source: MeterSnapshots):
+        self._source = source
+        size = len(source._buffers[0])
+        self._lin = np.full(size, np.nan)
+        self._db = np.full(size, np.nan)
+        self._reference = np.empty(size)
+        for plugin, _, _, where in source._slots:
+            self._reference[where] = (REFERENCE_PRESSURE * plugin.sensitivity) ** 2
+        self._sequence = 0
+        self._frames = 0
+        for array in (self._lin, self._db):
+            array.flags.writeable = False
+
+    def update(self) -> bool:
+        """Copy the latest snapshot; returns ``False`` if there was nothing new."""
+        source = self._source
+        lin, db = self._lin, self._db
+        lin.flags.writeable = db.flags.writeable = True
+        try:
+            while True:
+                sequence = source._sequence
+                if sequence == self._sequence:
+                    return False
+                np.copyto(lin, source._buffers[sequence % 2])
+                frames = source._frames[sequence % 2]
+                # The engine only starts overwriting this buffer after publishing the next one
+                if source._sequence == sequence:
+                    break
+            with np.errstate(divide="ignore", invalid="ignore"):
+                np.divide(lin, self._reference, out=db)
+                np.log10(db, out=db)
+            db *= 10.0
+            self._sequence, self._frames = sequence, frames
+            return True
+        finally:
+            lin.flags.writeable = db.flags.writeable = False
+
+    def read_lin(self, plugin: PluginMeter, name: str) -> np.ndarray:
+        """Snapshot of ``plugin.read_lin(name)``."""
+        return self._lin[self._source._index[(plugin, name)]]
+
+    def read_db(self, plugin: PluginMeter, name: str) -> np.ndarray:
+        """Snapshot of ``plugin.read_db(name)``."""
+        return self._db[self._source._index[(plugin, name)]]
+
+    def column(self, label: str) -> np.ndarray:
+        """Snapshot (dB) of the reporter column *label*: shape ``(1,)`` for broadband, ``(bands,)`` for band columns."""
+        return self._db[self._source._columns[label]]
@@ -3,19 +3,40 @@ from abc import ABC, abstractmethod
 
 import numpy as np
 from scipy.signal import lfilter, lfilter_zi
-from numba import jit
 
 from slm.plugin_meter import PluginMeter
 
+# The numba kernels live in slm.time_weighting_kernels and are imported on
+# first use, so chains without Impulse weighting never load numba.
+_KERNELS = ("asymmetric_time_weighting", "asymmetric_time_weighting_2d")
+
+
+def __getattr__(name: str):
+    if name in _KERNELS:
+        from slm import time_weighting_kernels
+        return getattr(time_weighting_kernels, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 class PluginTimeWeighting(PluginMeter, ABC):
+    """Base class for time-weighting plugins.
+
+    By default the input is linear pressure (Pa) and is squared internally.
+    With ``squared_input=True`` the input is taken to be Pa² already — e.g. the
+    output of a :class:`PluginSquare` shared by several time weightings — so
+    the square is computed once per block instead of once per time constant.
+    """
     time_constant: str
 
-    def __init__(self, zero_zi: bool = True, **kwargs):
+    def __init__(self, zero_zi: bool = True, squared_input: bool = False, **kwargs):
         super().__init__(**kwargs)
         self._zero_zi = zero_zi
+        self._squared_input = squared_input
         self.output = np.zeros((self.width, self.blocksize))
 
+    def _squared(self, block: np.ndarray) -> np.ndarray:
+        return block if self._squared_input else np.square(block)
+
     @abstractmethod
     def _compute_filter(self) -> None: ...
 
@@ -50,7 +71,7 @@ class PluginSymmetricTimeWeighting(PluginTimeWeighting):
 
     def func(self, block: np.ndarray):
         self.output[:,:], self._zi[:,:] = lfilter(self._b, self._a,
-                                        np.square(block),
+                                        self._squared(block),
                                         axis=-1, zi=self._zi)
 
 
@@ -65,17 +86,16 @@ class PluginAsymmetricTimeWeighting(PluginTimeWeighting):
         self._compute_filter()
 
     def _compute_filter(self):
+        from slm.time_weighting_kernels import asymmetric_time_weighting_2d
+        self._kernel = asymmetric_time_weighting_2d
         self._alpha_rise = 1 - np.exp(-1 / (self.samplerate * self.tau[0]))
         self._alpha_fall = 1 - np.exp(-1 / (self.samplerate * self.tau[1]))
         self._zi = np.zeros(self.width)
 
     def func(self, block: np.ndarray):
-        x2 = np.square(block)
-        for ch in range(self.width):
-            self.output[ch], self._zi[ch] = asymmetric_time_weighting(
-                x2[ch], zi=self._zi[ch],
-                alpha_rise=self._alpha_rise, alpha_fall=self._alpha_fall
-            )
+        # One kernel call for all channels; output and state are updated in place.
+        self._kernel(self._squared(block), self._zi,
+                     self._alpha_rise, self._alpha_fall, self.output)
 
 
 class PluginFastTimeWeighting(PluginSymmetricTimeWeighting):
@@ -110,42 +130,3 @@ class PluginSquare(PluginTimeWeighting):
 
     def func(self, block: np.ndarray):
         np.square(block, out=self.output)
-
-
-@jit(nopython=True)
-def asymmetric_time_weighting(x, *, zi, alpha_rise, alpha_fall):
-    """
-    Process one block with IEC 61672-1 Impulse time weighting.
-
-    Parameters
-    ----------
-    x : ndarray
-        Input block (squared pressure)
-    z : float
-        Filter state (previous output sample)
-    alpha_rise : float
-        Rise coefficient (35 ms)
-    alpha_fall : float
-        Fall coefficient (1500 ms)
-
-    Returns
-    -------
-    y : ndarray
-        Output block
-    z_new : float
-        Updated filter state
-    """
-    y = np.zeros_like(x)
-    prev = zi
-
-    for n in range(len(x)):
-        if x[n] > prev:
-            a = alpha_rise
-        else:
-            a = alpha_fall
-
-        yn = (1.0 - a) * prev + a * x[n]
-        y[n] = yn
-        prev = yn
-
-    return y, prev
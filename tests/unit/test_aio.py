@@ -0,0 +1,213 @@
+"""Unit tests for Engine.run_async and slm/io/aio.py — asyncio controllers and reporters."""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from slm.assembly import build_chain, parse_metric
+from slm.engine import Engine
+from slm.io.aio import (
+    AsyncController, AsyncControllerAdapter, AsyncReporter, is_async_controller, is_async_reporter,
+)
+from slm.io.file_controller import FileController
+from slm.io.reporter import Reporter
+
+SAMPLERATE = 48_000
+BLOCKSIZE = 1024
+
+
+def _write_sine(path, amplitude: float = 0.5, seconds: float = 1.0) -> str:
+    t = np.arange(int(seconds * SAMPLERATE)) / SAMPLERATE
+    sf.write(str(path), amplitude * np.sin(2 * np.pi * 1000.0 * t), SAMPLERATE, subtype="FLOAT")
+    return str(path)
+
+
+def _engine(controller, reporter=None, metrics=("LAeq", "LAFmax")) -> tuple[Engine, Reporter]:
+    reporter = reporter or Reporter()
+    engine = Engine(controller, dt=0.25, reporter=reporter)
+    build_chain([parse_metric(m) for m in metrics], engine)
+    return engine, reporter
+
+
+def _last(reporter: Reporter) -> dict:
+    return {k: v for k, v in reporter._broadband_rows[-1].items() if k != "timestamp"}
+
+
+class _ListController:
+    """Native async controller serving precomputed blocks."""
+
+    samplerate = SAMPLERATE
+    blocksize = BLOCKSIZE
+    sensitivity = 1.0
+
+    def __init__(self, blocks):
+        self._blocks = list(blocks)
+        self._index = 0
+        self.stopped = False
+
+    async def read_block(self):
+        if self._index == len(self._blocks) or self.stopped:
+            raise StopAsyncIteration
+        self._index += 1
+        return self._blocks[self._index - 1], self._index - 1
+
+    async def stop(self):
+        self.stopped = True
+
+
+class _AsyncReporter(Reporter):
+    def __init__(self):
+        super().__init__()
+        self.awaited = 0
+
+    async def record(self, timestamp, dt):
+        self.awaited += 1
+        super().record(timestamp, dt)
+
+
+class TestProtocols:
+
+    def test_detection(self, tmp_path):
+        ctrl = FileController(_write_sine(tmp_path / "a.wav"), blocksize=BLOCKSIZE)
+        assert not is_async_controller(ctrl)
+        assert is_async_controller(AsyncControllerAdapter(ctrl))
+        assert isinstance(_ListController([]), AsyncController)
+        assert is_async_reporter(_AsyncReporter())
+        assert isinstance(_AsyncReporter(), AsyncReporter)
+        assert not is_async_reporter(Reporter())
+
+    def test_adapter_forwards_attributes(self, tmp_path):
+        ctrl = FileController(_write_sine(tmp_path / "a.wav"), blocksize=BLOCKSIZE)
+        adapter = AsyncControllerAdapter(ctrl)
+        assert adapter.samplerate == SAMPLERATE
+        assert adapter.channels == 1
+        assert adapter.controller is ctrl
+        adapter.close()
+
+
+class TestRunAsync:
+
+    def test_matches_sync_run(self, tmp_path):
+        wav = _write_sine(tmp_path / "a.wav")
+        sync_engine, sync_reporter = _engine(FileController(wav, blocksize=BLOCKSIZE))
+        sync_engine.run()
+        async_engine, async_reporter = _engine(FileController(wav, blocksize=BLOCKSIZE))
+        asyncio.run(async_engine.run_async())
+        assert _last(async_reporter) == _last(sync_reporter)
+        assert len(async_reporter._broadband_rows) == len(sync_reporter._broadband_rows)
+
+    def test_pipelines_share_one_loop(self, tmp_path):
+        loud = _write_sine(tmp_path / "loud.wav", amplitude=0.5)
+        quiet = _write_sine(tmp_path / "quiet.wav", amplitude=0.05)
+        e1, r1 = _engine(FileController(loud, blocksize=BLOCKSIZE))
+        e2, r2 = _engine(FileController(quiet, blocksize=BLOCKSIZE))
+        ticks = 0
+
+        async def heartbeat():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        async def main():
+            beat = asyncio.ensure_future(heartbeat())
+            await asyncio.gather(e1.run_async(), e2.run_async())
+            beat.cancel()
+
+        asyncio.run(main())
+        assert _last(r1)["LAeq"] - _last(r2)["LAeq"] == pytest.approx(20.0, abs=0.01)
+        assert ticks > 47   # the loop stayed responsive while both engines ran
+
+    def test_native_controller_and_async_reporter(self):
+        t = np.arange(8 * BLOCKSIZE) / SAMPLERATE
+        x = 0.5 * np.sin(2 * np.pi * 1000.0 * t)[:, np.newaxis]
+        blocks = [x[i:i + BLOCKSIZE] for i in range(0, len(x), BLOCKSIZE)]
+        reporter = _AsyncReporter()
+        engine, _ = _engine(_ListController(blocks), reporter=reporter, metrics=["LZeq"])
+        asyncio.run(engine.run_async())
+        assert reporter.awaited == 9   # 8 blocks + final snapshot
+        assert _last(reporter)["LZeq"] == pytest.approx(20 * np.log10(0.5 / np.sqrt(2) / 2e-5), abs=0.05)
+
+    def test_sync_run_rejects_async_parts(self):
+        engine, _ = _engine(_ListController([]), metrics=["LZeq"])
+        with pytest.raises(TypeError, match="run_async"):
+            engine.run()
+
+    def test_cancel_stops_controller_and_records(self):
+        """A blocking live source: cancellation must stop it and keep what was measured."""
+
+        class _Live(FileController):
+            def __init__(self):
+                self._stop = threading.Event()
+                self._counter = iter(range(10**9))
+                self._block = np.full((BLOCKSIZE, 1), 0.1)
+
+            samplerate = SAMPLERATE
+            blocksize = BLOCKSIZE
+            sensitivity = 1.0
+            channels = 1
+
+            def read_block(self):
+                if self._stop.wait(BLOCKSIZE / SAMPLERATE):
+                    raise StopIteration
+                return self._block, next(self._counter)
+
+            def stop(self):
+                self._stop.set()
+
+        live = _Live()
+        engine, reporter = _engine(live, metrics=["LZeq"])
+
+        async def main():
+            task = asyncio.ensure_future(engine.run_async())
+            await asyncio.sleep(0.2)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(main())
+        assert live._stop.is_set()
+        assert reporter._broadband_rows
+        assert reporter._broadband_rows[-1]["LZeq"] == pytest.approx(10 * np.log10(0.01 / 4e-10), abs=0.01)
+
+    def test_stop_waits_for_read_in_flight(self):
+        """A cancelled read may still be running: stop() must not close the source under it."""
+
+        class _Slow(FileController):
+            def __init__(self):
+                self._counter = iter(range(10**9))
+                self._block = np.zeros((BLOCKSIZE, 1))
+                self.reading = False
+                self.stopped_during_read = None
+
+            samplerate = SAMPLERATE
+            blocksize = BLOCKSIZE
+            sensitivity = 1.0
+            channels = 1
+
+            def read_block(self):
+                self.reading = True
+                time.sleep(0.05)
+                self.reading = False
+                return self._block, next(self._counter)
+
+            def stop(self):
+                self.stopped_during_read = self.reading
+
+        slow = _Slow()
+        engine, _ = _engine(slow, metrics=["LZeq"])
+
+        async def main():
+            task = asyncio.ensure_future(engine.run_async())
+            await asyncio.sleep(0.12)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(main())
+        assert slow.stopped_during_read is False
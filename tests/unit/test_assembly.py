@@ -197,24 +197,54 @@ class TestBuildChainStructure:
         assert len(non_fw) == 0
 
     def test_time_weighting_plugin_created_for_max(self, tmp_path):
-        """LAFmax → one time-weighting plugin on the A bus."""
+        """LAFmax → shared PluginSquare + one time-weighting plugin on the A bus."""
         engine, _ = _run_chain(tmp_path, ["LAFmax"])
         bus = engine._busses["A"]
         non_fw = [p for p in bus.plugins if p is not bus.frequency_weighting]
-        assert len(non_fw) == 1
-        assert "LAFmax" in non_fw[0].meters
-        assert isinstance(non_fw[0].meters["LAFmax"], MaxAccumulator)
+        assert len(non_fw) == 2
+        tw = next(p for p in non_fw if isinstance(p, PluginFastTimeWeighting))
+        assert "LAFmax" in tw.meters
+        assert isinstance(tw.meters["LAFmax"], MaxAccumulator)
 
     def test_shared_time_weighting_plugin(self, tmp_path):
         """LAFmax + LAFmin → same F time-weighting plugin, two meters."""
         engine, _ = _run_chain(tmp_path, ["LAFmax", "LAFmin"])
         bus = engine._busses["A"]
-        non_fw = [p for p in bus.plugins if p is not bus.frequency_weighting]
-        assert len(non_fw) == 1
-        tw = non_fw[0]
+        tws = [p for p in bus.plugins if isinstance(p, PluginFastTimeWeighting)]
+        assert len(tws) == 1
+        tw = tws[0]
         assert "LAFmax" in tw.meters
         assert "LAFmin" in tw.meters
 
+    def test_time_weightings_share_one_square(self, tmp_path):
+        """LAF, LAS, LAI and bare LA all consume a single PluginSquare."""
+        engine, _ = _run_chain(tmp_path, ["LAFmax", "LASmax", "LAImax", "LA"])
+        bus = engine._busses["A"]
+        squares = [p for p in bus.plugins if isinstance(p, PluginSquare)]
+        assert len(squares) == 1
+        sq = squares[0]
+        assert sq.input is bus.frequency_weighting
+        tws = [p for p in bus.plugins if p is not sq and p is not bus.frequency_weighting]
+        assert len(tws) == 3
+        assert all(tw.input is sq for tw in tws)
+
+    def test_shared_square_matches_inline_square(self):
+        """Feeding pre-squared input gives the same output as squaring inline."""
+        import types
+        from slm.time_weighting import PluginSlowTimeWeighting, PluginImpulseTimeWeighting
+        bus = types.SimpleNamespace(samplerate=48000, blocksize=256, sensitivity=1.0, dt=1.0,
+                                    width=1, get_chain=lambda: [])
+        bus.bus = bus
+        rng = np.random.default_rng(3)
+        for cls in (PluginFastTimeWeighting, PluginSlowTimeWeighting, PluginImpulseTimeWeighting):
+            inline = cls(input=bus)
+            shared = cls(input=bus, squared_input=True)
+            for _ in range(4):
+                x = rng.standard_normal((1, 256))
+                inline.process(x)
+                shared.process(np.square(x))
+                np.testing.assert_array_equal(inline.output, shared.output)
+
     def test_octave_band_plugin_created(self, tmp_path):
         """LZeq:bands:63-8000 → one PluginOctaveBand on the Z bus."""
         engine, _ = _run_chain(tmp_path, ["LZeq:bands:63-8000"])
@@ -296,9 +326,11 @@ class TestBuildChainStructure:
         non_fw = [p for p in bus.plugins if p is not freq_w]
 
         ob = next(p for p in non_fw if isinstance(p, PluginOctaveBand))
+        sq = next(p for p in non_fw if isinstance(p, PluginSquare))
         tw = next(p for p in non_fw if isinstance(p, PluginFastTimeWeighting))
 
-        assert tw.input is ob, "FTW must be downstream of OctaveBand, not freq_w"
+        assert sq.input is ob, "band squaring stage must be downstream of OctaveBand"
+        assert tw.input is sq, "FTW must consume the shared band PluginSquare, not freq_w"
         assert tw.width == ob.width > 1, "FTW width must equal n_bands"
         assert "LZF:bands:63-8000" in tw.meters
         assert isinstance(tw.meters["LZF:bands:63-8000"], LastAccumulatingMeter)
@@ -385,6 +417,69 @@ class TestBuildChainStructure:
         assert not np.isnan(val)
 
 
+# ---------------------------------------------------------------------------
+# Channel-mapped metrics (chN/ prefix)
+# ---------------------------------------------------------------------------
+
+class TestChannelMetrics:
+
+    def test_parse_prefix(self):
+        spec = parse_metric("ch2/LAFmax_5s")
+        assert spec.channel == 2
+        assert spec.channel_index == 1
+        assert spec.weighting == "A"
+        assert spec.window_seconds == 5.0
+        assert spec.name == "ch2/LAFmax_5s"
+
+    def test_unprefixed_reads_first_channel(self):
+        spec = parse_metric("LAeq")
+        assert spec.channel is None
+        assert spec.channel_index == 0
+
+    @pytest.mark.parametrize("name", ["ch0/LAeq", "ch2/", "ch2/LAFeq", "chx/LAeq"])
+    def test_invalid_prefix(self, name):
+        with pytest.raises(ValueError):
+            parse_metric(name)
+
+    def _run_stereo(self, tmp_path, metric_names):
+        t = np.arange(48000) / 48000
+        tone = np.sin(2 * np.pi * 1000.0 * t)
+        sf.write(str(tmp_path / "stereo.wav"), np.column_stack([0.5 * tone, 0.05 * tone]), 48000,
+                 subtype="FLOAT")
+        controller = FileController(str(tmp_path / "stereo.wav"), blocksize=1024)
+        reporter = Reporter()
+        engine = Engine(controller, dt=10.0, reporter=reporter)
+        build_chain([parse_metric(n) for n in metric_names], engine)
+        engine.run()
+        return engine, reporter
+
+    def test_per_channel_levels(self, tmp_path):
+        engine, reporter = self._run_stereo(tmp_path, ["ch1/LZeq", "ch2/LZeq", "ch2/LZFmax"])
+        assert list(engine._busses) == ["ch1/Z", "ch2/Z"]
+        level = {label: plugin.read_db(meter)[0]
+                 for label, plugin, meter in reporter._broadband_columns}
+        assert level["ch1/LZeq"] - level["ch2/LZeq"] == pytest.approx(20.0, abs=0.01)
+        assert level["ch2/LZFmax"] > level["ch2/LZeq"]
+
+    def test_unprefixed_and_ch1_are_separate_buses(self, tmp_path):
+        engine, _ = self._run_stereo(tmp_path, ["LAeq", "ch1/LAeq"])
+        assert list(engine._busses) == ["A", "ch1/A"]
+        assert [b.channel for b in engine._busses.values()] == [0, 0]
+
+    def test_channel_out_of_range_raises(self, tmp_path):
+        with pytest.raises(ValueError, match="channel 3"):
+            self._run_stereo(tmp_path, ["ch3/LAeq"])
+
+    def test_reporter_writes_per_channel_files(self, tmp_path):
+        _, reporter = self._run_stereo(tmp_path, ["ch1/LZeq", "ch2/LZeq"])
+        reporter.write(tmp_path / "m")
+        import csv
+        for ch in (1, 2):
+            with open(tmp_path / f"m_ch{ch}_report.csv") as f:
+                assert list(next(csv.DictReader(f))) == ["LZeq"]
+        assert not (tmp_path / "m_report.csv").exists()
+
+
 # ---------------------------------------------------------------------------
 # Numerical tests (XL2 fixtures)
 # ---------------------------------------------------------------------------
@@ -0,0 +1,98 @@
+"""Unit tests for slm/io/binary_log.py — compact binary log and memmap reader."""
+from __future__ import annotations
+
+import types
+from datetime import timedelta
+
+import numpy as np
+import pytest
+
+from slm.io.binary_log import INT16_MISSING, MAGIC, BinaryLog, write_binary_log
+from slm.io.reporter import Reporter
+
+ROWS = 1000
+
+
+def _reporter() -> tuple[Reporter, np.ndarray]:
+    values = np.random.default_rng(0).normal(60.0, 15.0, (ROWS, 5))
+    state = {"i": 0}
+
+    def plugin(width: int, offset: int):
+        return types.SimpleNamespace(width=width,
+                                     read_db=lambda _: values[state["i"], offset:offset + width].copy())
+
+    r = Reporter()
+    r.add_column("LAeq", plugin(1, 0), "LAeq")
+    r.add_column("LZeq:bands", plugin(3, 1), "LZeq", center_frequencies=["63", "125", "250"])
+    r.add_column("ch2/LCeq", plugin(1, 4), "LCeq", channel=2)
+    for i in range(ROWS):
+        state["i"] = i
+        r.record(timedelta(seconds=0.125 * i), dt=0.125)
+    return r, values
+
+
+class TestBinaryLog:
+
+    def test_float32_round_trip(self, tmp_path):
+        r, values = _reporter()
+        log = BinaryLog(r.write_binary(tmp_path / "m"))
+        assert log.rows == ROWS
+        assert log.labels == ["LAeq", "ch2/LCeq", "LZeq:bands"]
+        np.testing.assert_array_equal(log.timestamps(), r.timestamps())
+        np.testing.assert_array_equal(log.broadband("LAeq"), values[:, 0].astype(np.float32))
+        np.testing.assert_array_equal(log.band("LZeq:bands"), values[:, 1:4].astype(np.float32))
+        assert log.bands("LZeq:bands") == ["63", "125", "250"]
+        assert log.bands("LAeq") is None
+        assert log.channel("ch2/LCeq") == 2 and log.channel("LAeq") is None
+
+    def test_float32_columns_are_mapped_views(self, tmp_path):
+        r, _ = _reporter()
+        log = BinaryLog(r.write_binary(tmp_path / "m"))
+        column = log.band("LZeq:bands")
+        assert isinstance(column.base, np.memmap) or isinstance(column, np.memmap)
+        assert not column.flags.writeable
+        assert column.flags.c_contiguous
+
+    def test_int16_quantised_to_centi_db(self, tmp_path):
+        r, values = _reporter()
+        path = r.write_binary(tmp_path / "m", dtype="int16")
+        log = BinaryLog(path)
+        np.testing.assert_allclose(log.band("LZeq:bands"), values[:, 1:4], atol=0.005 + 1e-5)
+        np.testing.assert_array_equal(log.raw("LAeq"), np.round(values[:, 0] * 100).astype(np.int16))
+
+    def test_int16_file_size(self, tmp_path):
+        r, _ = _reporter()
+        path = r.write_binary(tmp_path / "m", dtype="int16")
+        data = ROWS * (8 + 2 * 5)          # timestamps + 5 values per row
+        assert data <= path.stat().st_size <= data + 2048
+
+    def test_int16_special_values(self, tmp_path):
+        path = tmp_path / "x.slmb"
+        write_binary_log(path, np.arange(4), [("L", None, None, np.array([np.nan, -np.inf, 400.0, -0.004]))],
+                         dtype="int16")
+        log = BinaryLog(path)
+        np.testing.assert_array_equal(log.raw("L"), [INT16_MISSING, -32767, 32767, 0])
+        np.testing.assert_array_equal(log.broadband("L")[1:], np.float32([-327.67, 327.67, 0.0]))
+        assert np.isnan(log.broadband("L")[0])
+
+    def test_data_is_aligned(self, tmp_path):
+        r, _ = _reporter()
+        log = BinaryLog(r.write_binary(tmp_path / "m"))
+        assert log._data_start % 64 == 0
+        assert all(c["offset"] % 64 == 0 for c in log._meta["columns"])
+
+    def test_empty_log(self, tmp_path):
+        path = Reporter().write_binary(tmp_path / "m")
+        assert BinaryLog(path).rows == 0
+
+    def test_rejects_other_files(self, tmp_path):
+        (tmp_path / "x.slmb").write_bytes(b"timestamp,LAeq\n")
+        with pytest.raises(ValueError, match="not an SLM binary log"):
+            BinaryLog(tmp_path / "x.slmb")
+        (tmp_path / "y.slmb").write_bytes(MAGIC[:-1] + b"\x09" + bytes(8))
+        with pytest.raises(ValueError, match="version"):
+            BinaryLog(tmp_path / "y.slmb")
+
+    def test_unknown_dtype_raises(self, tmp_path):
+        with pytest.raises(ValueError, match="int16"):
+            Reporter().write_binary(tmp_path / "m", dtype="float16")
@@ -0,0 +1,131 @@
+"""Unit tests for slm/io/capture.py — non-blocking WAV/FLAC capture."""
+from __future__ import annotations
+
+import threading
+import time
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from slm.io.capture import CaptureWriter
+
+SAMPLERATE = 48_000
+
+
+def _noise(frames: int, channels: int = 2) -> np.ndarray:
+    return np.random.default_rng(0).uniform(-0.9, 0.9, (frames, channels)).astype(np.float32)
+
+
+def _feed(writer: CaptureWriter, x: np.ndarray, blocksize: int = 1000) -> None:
+    for i in range(0, len(x), blocksize):
+        writer.write(x[i:i + blocksize])
+
+
+class TestCaptureWriter:
+
+    def test_wav_bit_exact(self, tmp_path):
+        x = _noise(50_000)
+        with CaptureWriter(tmp_path / "cap.wav", SAMPLERATE, channels=2, chunk_frames=777) as w:
+            _feed(w, x)
+        got, fs = sf.read(str(tmp_path / "cap.wav"), dtype="float32")
+        assert fs == SAMPLERATE
+        np.testing.assert_array_equal(got, x)
+        assert w.files == [tmp_path / "cap.wav"]
+        assert w.written_frames == len(x)
+
+    def test_flac_defaults_to_pcm24(self, tmp_path):
+        x = _noise(20_000, channels=1)
+        with CaptureWriter(tmp_path / "cap.flac", SAMPLERATE) as w:
+            _feed(w, x)
+        info = sf.info(str(tmp_path / "cap.flac"))
+        assert info.subtype == "PCM_24"
+        np.testing.assert_allclose(sf.read(str(tmp_path / "cap.flac"))[0], x[:, 0], atol=2 ** -23)
+
+    def test_rotate_by_duration_exact(self, tmp_path):
+        x = _noise(5 * SAMPLERATE // 2)
+        with CaptureWriter(tmp_path / "cap.wav", SAMPLERATE, channels=2, rotate_seconds=1.0) as w:
+            _feed(w, x, blocksize=1024)
+        assert [p.name for p in w.files] == ["cap_0001.wav", "cap_0002.wav", "cap_0003.wav"]
+        parts = [sf.read(str(p), dtype="float32")[0] for p in w.files]
+        assert [len(p) for p in parts] == [SAMPLERATE, SAMPLERATE, SAMPLERATE // 2]
+        np.testing.assert_array_equal(np.concatenate(parts), x)
+
+    def test_rotate_by_size(self, tmp_path):
+        x = _noise(100_000, channels=1)
+        with CaptureWriter(tmp_path / "cap.wav", SAMPLERATE, rotate_bytes=100_000,
+                           chunk_frames=1000) as w:
+            _feed(w, x)
+        sizes = [p.stat().st_size for p in w.files]
+        assert len(sizes) == 4   # 400 kB of float32 samples
+        assert all(100_000 <= s < 100_000 + 4000 + 100 for s in sizes[:-1])
+        np.testing.assert_array_equal(
+            np.concatenate([sf.read(str(p), dtype="float32")[0] for p in w.files]), x[:, 0])
+
+    def test_rotated_files_read_back_as_one_recording(self, tmp_path):
+        from slm.io.segmented_controller import SegmentedFileController
+        x = _noise(3 * SAMPLERATE, channels=1)
+        with CaptureWriter(tmp_path / "cap.wav", SAMPLERATE, rotate_seconds=0.7) as w:
+            _feed(w, x)
+        ctrl = SegmentedFileController(str(tmp_path / "cap_*.wav"), blocksize=SAMPLERATE)
+        got = np.concatenate([ctrl.read_block()[0].copy() for _ in range(3)])
+        np.testing.assert_array_equal(got[:, 0].astype(np.float32), x[:, 0])
+
+    def test_stalled_disk_never_blocks_and_keeps_timeline(self, tmp_path):
+        x = _noise(SAMPLERATE, channels=1)
+        w = CaptureWriter(tmp_path / "cap.wav", SAMPLERATE, buffer_seconds=0.1, chunk_frames=1000)
+        release = threading.Event()
+        original = w._write
+
+        def slow_write(data):
+            release.wait()
+            original(data)
+
+        w._write = slow_write
+        start = time.perf_counter()
+        _feed(w, x)
+        assert time.perf_counter() - start < 0.5   # producer never waited on the disk
+        assert w.dropped_frames > 0
+        assert w.drop_events > 0
+        release.set()
+        w.close()
+
+        got = sf.read(str(tmp_path / "cap.wav"), dtype="float32")[0]
+        assert len(got) == len(x)                           # dropped audio became silence
+        assert np.count_nonzero(got == 0.0) >= w.dropped_frames
+        kept = got != 0.0
+        np.testing.assert_array_equal(got[kept], x[kept, 0])
+
+    def test_pool_capacity_counts_audio_not_blocks(self, tmp_path):
+        """Small blocks share pool buffers, so the pool really holds buffer_seconds of audio."""
+        x = _noise(3 * SAMPLERATE, channels=1)
+        w = CaptureWriter(tmp_path / "cap.wav", SAMPLERATE, buffer_seconds=4.0)
+        release = threading.Event()
+        original = w._write
+        w._write = lambda data: (release.wait(), original(data))
+        _feed(w, x, blocksize=64)
+        assert w.dropped_frames == 0
+        release.set()
+        w.close()
+        np.testing.assert_array_equal(sf.read(str(tmp_path / "cap.wav"), dtype="float32")[0], x[:, 0])
+
+    def test_writer_error_raised_on_close(self, tmp_path):
+        w = CaptureWriter(tmp_path / "cap.wav", SAMPLERATE)
+
+        def broken(data):
+            raise OSError("disk full")
+
+        w._write = broken
+        assert w.write(np.zeros((10, 1))) == 10
+        with pytest.raises(OSError, match="disk full"):
+            w.close()
+
+    def test_write_after_close_ignored(self, tmp_path):
+        w = CaptureWriter(tmp_path / "cap.wav", SAMPLERATE)
+        w.close()
+        assert w.write(np.zeros((10, 1))) == 0
+        w.close()
+
+    def test_invalid_subtype(self, tmp_path):
+        with pytest.raises(ValueError, match="FLOAT"):
+            CaptureWriter(tmp_path / "cap.flac", SAMPLERATE, subtype="FLOAT")
@@ -4,8 +4,10 @@ from __future__ import annotations
 import csv
 import io
 import tempfile
+import threading
 from pathlib import Path
-from unittest.mock import patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pytest
@@ -18,9 +20,13 @@ from slm.app.cli import (
     sensitivity_from_dbv,
     _fmt_sensitivity,
     run_measurement,
+    _file_controller,
+    _finish_logs,
     SLMShell,
 )
 from slm.constants import REFERENCE_PRESSURE
+from slm.io.file_controller import FileController
+from slm.io.wav_memmap_controller import WavMemmapController
 
 
 # ---------------------------------------------------------------------------
@@ -38,6 +44,14 @@ class TestSLMConfigToml:
         assert loaded.dt == pytest.approx(2.0)
         assert loaded.output == "out/x"
 
+    def test_correction_round_trip(self, tmp_path):
+        config = SLMConfig(metrics=["LAeq"], correction="mic/windscreen.txt")
+        toml_path = tmp_path / "config.toml"
+        config.to_toml(toml_path)
+        assert SLMConfig.from_toml(toml_path).correction == "mic/windscreen.txt"
+        SLMConfig(metrics=["LAeq"]).to_toml(toml_path)
+        assert SLMConfig.from_toml(toml_path).correction is None
+
     def test_empty_metrics_round_trip(self, tmp_path):
         config = SLMConfig(metrics=[], dt=1.0, output="out")
         toml_path = tmp_path / "config.toml"
@@ -71,6 +85,39 @@ class TestSLMConfigToml:
         with pytest.raises(ValueError, match="Unknown"):
             SLMConfig.from_toml(toml_path)
 
+    def test_channels_round_trip(self, tmp_path):
+        config = SLMConfig(metrics=["LAeq"], channels=[1, 3])
+        toml_path = tmp_path / "config.toml"
+        config.to_toml(toml_path)
+        assert SLMConfig.from_toml(toml_path).channels == [1, 3]
+        SLMConfig(metrics=["LAeq"]).to_toml(toml_path)
+        assert SLMConfig.from_toml(toml_path).channels is None
+
+    @pytest.mark.parametrize("value", ["2", "[0]", "[1.5]", "[true]"])
+    def test_invalid_channels_raises(self, tmp_path, value):
+        toml_path = tmp_path / "bad.toml"
+        toml_path.write_text(f"[measurement]\nchannels = {value}\n", encoding="utf-8")
+        with pytest.raises(ValueError, match="channels"):
+            SLMConfig.from_toml(toml_path)
+
+    def test_rotate_round_trip(self, tmp_path):
+        toml_path = tmp_path / "config.toml"
+        SLMConfig(metrics=["LAeq"], rotate="hour").to_toml(toml_path)
+        assert SLMConfig.from_toml(toml_path).rotate == "hour"
+
+    def test_invalid_rotate_raises(self, tmp_path):
+        toml_path = tmp_path / "bad.toml"
+        toml_path.write_text('[measurement]\nrotate = "week"\n', encoding="utf-8")
+        with pytest.raises(ValueError, match="rotate"):
+            SLMConfig.from_toml(toml_path)
+
+    def test_resolved_metrics_expands_channels(self):
+        config = SLMConfig(metrics=["LAeq", "ch4/LCeq", "LAFmax"], channels=[1, 2])
+        assert config.resolved_metrics() == [
+            "ch1/LAeq", "ch2/LAeq", "ch4/LCeq", "ch1/LAFmax", "ch2/LAFmax",
+        ]
+        assert SLMConfig(metrics=["LAeq"]).resolved_metrics() == ["LAeq"]
+
     def test_file_created(self, tmp_path):
         config = SLMConfig(metrics=["LAeq"], dt=1.0, output="out")
         toml_path = tmp_path / "sub" / "config.toml"
@@ -242,6 +289,51 @@ class TestRunMeasurementIntegration:
         expected_blocks = info.frames // blocksize
         assert n_rows == pytest.approx(expected_blocks, abs=2)
 
+    def test_error_stops_prefetch_thread(self, tmp_path):
+        path = tmp_path / "a.flac"
+        sf.write(str(path), np.zeros(48_000), 48_000)
+        config = SLMConfig(metrics=["LAeq"], dt=1.0, output=str(tmp_path / "result"))
+        with patch("slm.engine.Engine.run", side_effect=RuntimeError("boom")):
+            with pytest.raises(RuntimeError, match="boom"):
+                run_measurement(str(path), 1.0, config)
+        assert not any(t.name == "FileController-prefetch" for t in threading.enumerate())
+
+    def test_close_error_still_writes_report(self, meas_000, tmp_path):
+        config = SLMConfig(metrics=["LAeq"], dt=1.0, output=str(tmp_path / "result"))
+        with patch("slm.io.energy_index.EnergyIndexWriter.close", side_effect=OSError("disk full")):
+            with pytest.raises(OSError, match="disk full"):
+                run_measurement(str(meas_000.wav_path), meas_000.sensitivity, config)
+        assert (tmp_path / "result_report.csv").exists()
+
+
+class TestFinishLogs:
+
+    def test_closes_everything_and_reraises_first_error(self):
+        logs = [MagicMock(), MagicMock(), MagicMock()]
+        logs[0].close.side_effect = OSError("first")
+        logs[1].close.side_effect = RuntimeError("second")
+        with pytest.raises(OSError, match="first"):
+            _finish_logs(SimpleNamespace(finish=lambda: None), logs)
+        for log in logs:
+            log.close.assert_called_once()
+
+
+class TestFileControllerSelection:
+
+    def test_wav_is_memory_mapped(self, tmp_path):
+        path = tmp_path / "a.wav"
+        sf.write(str(path), np.zeros(100), 48_000, subtype="PCM_24")
+        assert isinstance(_file_controller(path, 256, False, 2.0), WavMemmapController)
+
+    def test_flac_and_realtime_are_decoded(self, tmp_path):
+        flac, wav = tmp_path / "a.flac", tmp_path / "a.wav"
+        sf.write(str(flac), np.zeros(100), 48_000)
+        sf.write(str(wav), np.zeros(100), 48_000)
+        for path, realtime in ((flac, False), (wav, True)):
+            controller = _file_controller(path, 256, realtime, 0.0)
+            assert isinstance(controller, FileController)
+            controller.stop()
+
 
 # ---------------------------------------------------------------------------
 # SLMShell REPL commands
@@ -0,0 +1,149 @@
+"""Unit tests for slm/correction.py — response tables, FIR design and partitioned convolution."""
+from __future__ import annotations
+
+import types
+
+import numpy as np
+import pytest
+import soundfile as sf
+from scipy.signal import freqz, lfilter
+
+from slm.correction import PluginCorrection, design_correction_fir, load_response
+
+SAMPLERATE = 48_000
+BLOCKSIZE = 256
+
+
+def _mock_bus(samplerate=SAMPLERATE, blocksize=BLOCKSIZE, sensitivity=1.0, dt=1.0):
+    mock = types.SimpleNamespace(
+        samplerate=samplerate, blocksize=blocksize,
+        sensitivity=sensitivity, dt=dt,
+        width=1, get_chain=lambda: [],
+    )
+    mock.bus = mock
+    return mock
+
+
+def _run(plugin, x: np.ndarray) -> np.ndarray:
+    out = []
+    for i in range(0, len(x), BLOCKSIZE):
+        plugin.process(x[np.newaxis, i:i + BLOCKSIZE])
+        out.append(plugin.output[0].copy())
+    return np.concatenate(out)
+
+
+# ---------------------------------------------------------------------------
+# load_response
+# ---------------------------------------------------------------------------
+
+class TestLoadResponse:
+
+    def test_whitespace_and_comments(self, tmp_path):
+        path = tmp_path / "mic.txt"
+        path.write_text("# freq  dB\n1000 0.0\n20 -1.5   # low end\n\n10000 2.0\n")
+        freqs, gains = load_response(path)
+        np.testing.assert_array_equal(freqs, [20.0, 1000.0, 10000.0])
+        np.testing.assert_array_equal(gains, [-1.5, 0.0, 2.0])
+
+    def test_csv_with_header(self, tmp_path):
+        path = tmp_path / "mic.csv"
+        path.write_text("frequency,gain\n100,1.0\n200;2.0\n")
+        freqs, gains = load_response(path)
+        np.testing.assert_array_equal(freqs, [100.0, 200.0])
+        np.testing.assert_array_equal(gains, [1.0, 2.0])
+
+    def test_too_few_rows_raises(self, tmp_path):
+        path = tmp_path / "mic.txt"
+        path.write_text("1000 0.0\n")
+        with pytest.raises(ValueError, match="at least two"):
+            load_response(path)
+
+
+# ---------------------------------------------------------------------------
+# design_correction_fir
+# ---------------------------------------------------------------------------
+
+class TestDesignCorrectionFir:
+
+    FREQS = np.array([20.0, 1000.0, 4000.0, 20000.0])
+    GAINS = np.array([0.0, 0.0, 3.0, 3.0])
+
+    def _gain_db(self, taps, freq):
+        _, h = freqz(taps, worN=[freq], fs=SAMPLERATE)
+        return 20 * np.log10(np.abs(h[0]))
+
+    def test_length(self):
+        assert len(design_correction_fir(self.FREQS, self.GAINS, SAMPLERATE, n_taps=4096)) == 4096
+        assert len(design_correction_fir(self.FREQS, self.GAINS, SAMPLERATE, n_taps=1025)) == 1025
+
+    def test_follows_table(self):
+        taps = design_correction_fir(self.FREQS, self.GAINS, SAMPLERATE, n_taps=4096)
+        assert self._gain_db(taps, 500.0) == pytest.approx(0.0, abs=0.1)
+        assert self._gain_db(taps, 8000.0) == pytest.approx(3.0, abs=0.1)
+
+    def test_invert(self):
+        taps = design_correction_fir(self.FREQS, self.GAINS, SAMPLERATE, n_taps=4096, invert=True)
+        assert self._gain_db(taps, 8000.0) == pytest.approx(-3.0, abs=0.1)
+
+
+# ---------------------------------------------------------------------------
+# PluginCorrection — partitioned overlap-save convolution
+# ---------------------------------------------------------------------------
+
+class TestPluginCorrection:
+
+    @pytest.mark.parametrize("n_taps", [1, 100, BLOCKSIZE, 4096, 4097])
+    def test_matches_direct_convolution(self, n_taps):
+        rng = np.random.default_rng(0)
+        taps = rng.standard_normal(n_taps)
+        x = rng.standard_normal(BLOCKSIZE * 40)
+        plugin = PluginCorrection(taps=taps, input=_mock_bus())
+        np.testing.assert_allclose(_run(plugin, x), lfilter(taps, [1.0], x), atol=1e-9)
+
+    def test_reset_clears_history(self):
+        rng = np.random.default_rng(1)
+        taps = rng.standard_normal(600)
+        plugin = PluginCorrection(taps=taps, input=_mock_bus())
+        _run(plugin, rng.standard_normal(BLOCKSIZE * 4))
+        plugin.reset()
+        x = rng.standard_normal(BLOCKSIZE * 4)
+        np.testing.assert_allclose(_run(plugin, x), lfilter(taps, [1.0], x), atol=1e-9)
+
+    def test_from_response_file(self, tmp_path):
+        path = tmp_path / "flat.txt"
+        path.write_text("20 6.0\n20000 6.0\n")
+        plugin = PluginCorrection.from_response_file(path, input=_mock_bus(), n_taps=257)
+        x = np.sin(2 * np.pi * 1000.0 * np.arange(BLOCKSIZE * 20) / SAMPLERATE)
+        y = _run(plugin, x)[BLOCKSIZE * 4:]
+        gain_db = 10 * np.log10(np.mean(y ** 2) / np.mean(x ** 2))
+        assert gain_db == pytest.approx(6.0, abs=0.1)
+
+
+# ---------------------------------------------------------------------------
+# Bus integration
+# ---------------------------------------------------------------------------
+
+class TestBusCorrection:
+
+    def test_correction_applied_before_weighting(self, tmp_path):
+        from slm.engine import Engine
+        from slm.frequency_weighting import PluginZWeighting
+        from slm.io.file_controller import FileController
+        from slm.meter import LeqAccumulator
+
+        wav = tmp_path / "sine.wav"
+        t = np.arange(SAMPLERATE) / SAMPLERATE
+        sf.write(str(wav), (0.5 * np.sin(2 * np.pi * 1000.0 * t)).astype(np.float32), SAMPLERATE)
+
+        controller = FileController(str(wav), blocksize=BLOCKSIZE)
+        controller.set_sensitivity(1.0, unit="V")
+        engine = Engine(controller, dt=10.0)
+        taps = np.zeros(32)
+        taps[0] = 2.0   # +6.02 dB, pure gain
+        bus = engine.add_bus("Z", PluginZWeighting, correction=taps)
+        bus.frequency_weighting.create_meter(LeqAccumulator, name="leq")
+        engine.run()
+
+        assert isinstance(bus.correction, PluginCorrection)
+        expected = 0.5 ** 2 / 2 * 2.0 ** 2   # mean(x²) of the sine, times gain²
+        assert bus.frequency_weighting.read_lin("leq")[0] == pytest.approx(expected, rel=1e-2)
@@ -0,0 +1,187 @@
+"""Unit tests for slm/decimation.py and engine input decimation."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+import soundfile as sf
+from scipy.signal import freqz, upfirdn
+
+from slm.assembly import build_chain, parse_metric, required_bandwidth, weighting_bandwidths
+from slm.decimation import (
+    ATTENUATION_DB,
+    WEIGHTING_TOLERANCE_DB,
+    Decimator,
+    choose_decimation,
+    design_antialias,
+    weighting_deviation,
+)
+from slm.engine import Engine
+from slm.io.reporter import Reporter
+from slm.io.synthetic_controller import Sine, SyntheticController, WhiteNoise
+
+
+class TestChooseDecimation:
+
+    @pytest.mark.parametrize("samplerate,blocksize,bandwidth,expected", [
+        (192_000, 1024, 20_000, 4),
+        (96_000, 1024, 20_000, 2),
+        (48_000, 1024, 20_000, 1),
+        (44_100, 1024, 20_000, 1),
+        (192_000, 1023, 20_000, 3),     # factor must divide the blocksize
+        (48_000, 4800, 1_414, 15),      # 1/1-octave bands up to 1 kHz
+    ])
+    def test_factor(self, samplerate, blocksize, bandwidth, expected):
+        assert choose_decimation(samplerate, blocksize, bandwidth) == expected
+
+    @pytest.mark.parametrize("metrics,expected", [
+        (["LAeq"], 1),                       # A curve bends near 20 kHz at any lower rate
+        (["LCFmax", "LZeq"], 1),
+        (["LZeq"], 4),
+        (["LAeq:bands:1/3:20-4000"], 4),     # A curve unchanged up to the top band edge
+    ])
+    def test_weighting_limits_factor(self, metrics, expected):
+        specs = [parse_metric(m) for m in metrics]
+        assert choose_decimation(192_000, 2048, required_bandwidth(specs),
+                                 weighting_bandwidths(specs)) == expected
+
+    def test_weighting_deviation(self):
+        assert weighting_deviation("A", 192_000, 2, 20_000) > 1.0
+        assert weighting_deviation("A", 192_000, 4, 4_000) < WEIGHTING_TOLERANCE_DB
+
+
+class TestRequiredBandwidth:
+
+    def test_broadband_needs_20k(self):
+        assert required_bandwidth([parse_metric("LAeq"), parse_metric("LZeq:bands:63-1000")]) == 20_000
+
+    def test_weighting_bandwidths(self):
+        specs = [parse_metric(m) for m in ("LZeq", "LAeq:bands:1/1:63-1000", "LCeq",
+                                           "LAFmax:bands:1/1:63-250")]
+        assert weighting_bandwidths(specs) == {"A": pytest.approx(1000 * 2 ** 0.5), "C": 20_000}
+
+    def test_bands_need_upper_edge(self):
+        specs = [parse_metric("LZeq:bands:63-1000"), parse_metric("LAeq:bands:1/3:20-4000")]
+        assert required_bandwidth(specs) == pytest.approx(4000 * 2 ** (1 / 6))
+
+
+class TestDecimator:
+
+    def test_antialias_response(self):
+        fs, factor, bandwidth = 192_000, 4, 20_000
+        taps = design_antialias(fs, factor, bandwidth)
+        w, h = freqz(taps, worN=1 << 16, fs=fs)
+        db = 20 * np.log10(np.abs(h) + 1e-300)
+        assert np.abs(db[w <= bandwidth]).max() < 0.001
+        assert db[w >= fs / factor - bandwidth].max() < -ATTENUATION_DB + 1
+
+    def test_blockwise_equals_one_shot(self):
+        taps = design_antialias(96_000, 2, 20_000)
+        x = np.random.default_rng(0).standard_normal((2, 40 * 512))
+        dec = Decimator(2, taps, channels=2, blocksize=512)
+        y = np.concatenate([dec.process(x[:, i:i + 512]) for i in range(0, x.shape[1], 512)], axis=1)
+        np.testing.assert_allclose(y, upfirdn(taps, x, 1, 2, axis=-1)[:, :y.shape[1]], atol=1e-12)
+
+    def test_blocksize_must_be_multiple(self):
+        with pytest.raises(ValueError, match="multiple"):
+            Decimator(4, np.ones(5), channels=1, blocksize=1022)
+
+
+def _run(controller, metrics, factor=1):
+    reporter = Reporter()
+    engine = Engine(controller, dt=0.5, reporter=reporter)
+    specs = [parse_metric(m) for m in metrics]
+    if factor > 1:
+        engine.set_decimation(factor, required_bandwidth(specs))
+    build_chain(specs, engine)
+    engine.run()
+    return engine, reporter
+
+
+class TestEngineDecimation:
+
+    def _tone(self):
+        return SyntheticController([[Sine(1000.0, 0.5), Sine(3150.0, 0.2)]],
+                                   samplerate=192_000, blocksize=2048, duration=3.0)
+
+    def test_working_rate(self):
+        engine, reporter = _run(self._tone(), ["LZeq"], factor=4)
+        assert engine.samplerate == 48_000
+        assert engine.blocksize == 512
+        assert engine.input_samplerate == 192_000
+        assert engine.decimation == 4
+        last_block = 3 * 192_000 // 2048   # 281 full blocks and a zero-padded one
+        assert reporter._broadband_rows[-1]["timestamp"].total_seconds() == pytest.approx(
+            last_block * 2048 / 192_000)
+
+    def test_levels_match_full_rate(self):
+        metrics = ["LAeq", "LCeq", "LZeq", "LAFmax", "LZeq:bands:1/3:800-16000"]
+        _, full = _run(self._tone(), metrics)
+        _, dec = _run(self._tone(), metrics, factor=4)
+        for m in ("LAeq", "LCeq", "LZeq", "LAFmax"):
+            assert dec._broadband_rows[-1][m] == pytest.approx(full._broadband_rows[-1][m], abs=0.05)
+        bands_full = full._band_rows[-1]["LZeq:bands:1/3:800-16000"]
+        bands_dec = dec._band_rows[-1]["LZeq:bands:1/3:800-16000"]
+        loud = bands_full > 60   # the two tone bands; the rest is leakage
+        np.testing.assert_allclose(bands_dec[loud], bands_full[loud], atol=0.05)
+
+    def test_ultrasonic_content_removed(self):
+        ctrl = SyntheticController([[Sine(1000.0, 0.5), Sine(60_000.0, 0.5)]], samplerate=192_000,
+                                   blocksize=2048, duration=2.0)
+        _, reporter = _run(ctrl, ["LZeq"], factor=4)
+        assert reporter._broadband_rows[-1]["LZeq"] == pytest.approx(
+            20 * np.log10(0.5 / np.sqrt(2) / 2e-5), abs=0.05)
+
+    def test_multichannel(self):
+        ctrl = SyntheticController([Sine(1000.0, 0.5), Sine(1000.0, 0.05)], samplerate=96_000,
+                                   blocksize=1024, duration=2.0)
+        _, reporter = _run(ctrl, ["ch1/LZeq", "ch2/LZeq"], factor=2)
+        row = reporter._broadband_rows[-1]
+        assert row["ch1/LZeq"] - row["ch2/LZeq"] == pytest.approx(20.0, abs=0.01)
+
+    def test_set_after_bus_raises(self):
+        engine = Engine(SyntheticController(WhiteNoise(), samplerate=96_000, duration=1.0))
+        engine.add_bus("Z")
+        with pytest.raises(RuntimeError):
+            engine.set_decimation(2)
+
+    def test_factor_must_divide(self):
+        engine = Engine(SyntheticController(WhiteNoise(), samplerate=96_000, blocksize=1000))
+        with pytest.raises(ValueError, match="divide"):
+            engine.set_decimation(7)
+
+
+class TestRunMeasurementDecimation:
+
+    def test_prints_working_rate(self, tmp_path, capsys):
+        from slm.app.cli import run_measurement
+        from slm.app.config import SLMConfig
+
+        t = np.arange(96_000) / 96_000
+        sf.write(str(tmp_path / "hi.wav"), 0.5 * np.sin(2 * np.pi * 1000.0 * t), 96_000, subtype="FLOAT")
+        config = SLMConfig(metrics=["LZeq"], dt=0.5, output=str(tmp_path / "m"))
+        run_measurement(str(tmp_path / "hi.wav"), 1.0, config, blocksize=1024)
+        assert "Working rate: 48000 Hz (96000 Hz input decimated by 2)" in capsys.readouterr().out
+        capsys.readouterr()
+        run_measurement(str(tmp_path / "hi.wav"), 1.0, config, blocksize=1024, decimate=False)
+        assert "Working rate" not in capsys.readouterr().out
+
+    def test_high_frequency_laeq_matches_native(self, tmp_path, capsys):
+        """8–18 kHz noise: the default run must give the input-rate LAeq."""
+        import csv
+        from scipy.signal import butter, sosfilt
+        from slm.app.cli import run_measurement
+        from slm.app.config import SLMConfig
+
+        rate = 192_000
+        noise = np.random.default_rng(0).standard_normal(3 * rate)
+        x = 0.1 * sosfilt(butter(8, (8_000, 18_000), "bandpass", fs=rate, output="sos"), noise)
+        sf.write(str(tmp_path / "hf.wav"), x, rate, subtype="FLOAT")
+
+        levels = []
+        for decimate in (True, False):
+            config = SLMConfig(metrics=["LAeq"], dt=1.0, output=str(tmp_path / f"m{decimate}"))
+            run_measurement(str(tmp_path / "hf.wav"), 1.0, config, blocksize=2048, decimate=decimate)
+            with open(tmp_path / f"m{decimate}_report.csv") as f:
+                levels.append(float(next(csv.DictReader(f))["LAeq"]))
+        assert "Working rate" not in capsys.readouterr().out
+        assert levels[0] == pytest.approx(levels[1], abs=0.01)
@@ -0,0 +1,170 @@
+"""Unit tests for slm/io/display.py — threaded, rate-capped console display."""
+import re
+import sys
+import threading
+import time
+from datetime import timedelta
+
+import numpy as np
+import pytest
+
+from slm.io.display import _BarDisplay, _DisplayThread, make_display_fn
+from slm.io.reporter import _fmt_timestamp
+
+
+class _SlowRender:
+    """Render stub that records frames and takes *seconds* per frame."""
+
+    def __init__(self, seconds: float = 0.0):
+        self.seconds = seconds
+        self.frames = []
+        self.started = threading.Event()
+
+    def __call__(self, timestamp, broadband_row, band_row):
+        self.started.set()
+        time.sleep(self.seconds)
+        self.frames.append((timestamp, broadband_row, band_row))
+
+
+def _row(k: int):
+    return timedelta(seconds=k), {"LAeq": float(k)}, {}
+
+
+# ---------------------------------------------------------------------------
+# Display thread
+# ---------------------------------------------------------------------------
+
+class TestDisplayThread:
+
+    def test_slow_render_never_blocks_caller(self):
+        render = _SlowRender(seconds=0.2)
+        display = _DisplayThread(render, max_fps=None)
+        t0 = time.perf_counter()
+        for k in range(1000):
+            display(*_row(k))
+        assert time.perf_counter() - t0 < 0.15
+        display.close()
+        assert display.frames + display.dropped == 1000
+        assert display.dropped > 900
+
+    def test_close_draws_latest_row(self):
+        render = _SlowRender(seconds=0.05)
+        display = _DisplayThread(render, max_fps=1.0)
+        display(*_row(0))
+        render.started.wait(1.0)
+        for k in range(1, 50):
+            display(*_row(k))
+        display.close()
+        assert render.frames[-1][1] == {"LAeq": 49.0}
+        assert display.closed
+
+    def test_frame_rate_capped(self):
+        render = _SlowRender()
+        display = _DisplayThread(render, max_fps=20.0)
+        t_end = time.monotonic() + 0.5
+        k = 0
+        while time.monotonic() < t_end:
+            display(*_row(k))
+            k += 1
+            time.sleep(0.001)
+        display.close()
+        # ~10 frames in 0.5 s, plus the final one drawn by close()
+        assert 5 <= len(render.frames) <= 13
+        assert render.frames[-1][0] == timedelta(seconds=k - 1)
+
+    def test_band_rows_copied(self):
+        render = _SlowRender(seconds=0.05)
+        display = _DisplayThread(render, max_fps=None)
+        display(*_row(0))
+        render.started.wait(1.0)
+        column = np.array([1.0, 2.0])
+        display(timedelta(seconds=1), {}, {"Leq:bands": column})
+        column[:] = 0.0      # the reporter reuses its rows
+        display.close()
+        np.testing.assert_array_equal(render.frames[-1][2]["Leq:bands"], [1.0, 2.0])
+
+    def test_render_error_raised_on_close(self):
+        def render(*args):
+            raise OSError("terminal gone")
+        display = _DisplayThread(render)
+        display(*_row(0))
+        with pytest.raises(OSError, match="terminal gone"):
+            display.close()
+
+    def test_invalid_rate_raises(self):
+        with pytest.raises(ValueError, match="max_fps"):
+            _DisplayThread(_SlowRender(), max_fps=0)
+
+    def test_make_display_fn_plain(self, capsys):
+        display = make_display_fn("plain", precision=1)
+        display(timedelta(seconds=1), {"LAeq": 61.25}, {})
+        display.close()
+        assert capsys.readouterr().out == "00:00:01.000  LAeq: 61.2\n"
+
+    def test_plain_prints_every_row_on_terminal(self, capsys, monkeypatch):
+        monkeypatch.setattr(sys.stdout, "isatty", lambda: True)
+        display = make_display_fn("plain", precision=0)
+        for k in range(500):
+            display(*_row(k))
+        display.close()
+        lines = capsys.readouterr().out.splitlines()
+        assert lines == [f"{_fmt_timestamp(timedelta(seconds=k))}  LAeq: {k}" for k in range(500)]
+
+    def test_blocked_stdout_never_blocks_caller(self, monkeypatch):
+        release = threading.Event()
+        written = []
+
+        class _BlockingStdout:
+            def isatty(self):
+                return False
+
+            def write(self, text):
+                release.wait(5.0)
+                written.append(text)
+
+            def flush(self):
+                pass
+
+        monkeypatch.setattr(sys, "stdout", _BlockingStdout())
+        display = make_display_fn("bars", precision=0)
+        t0 = time.perf_counter()
+        for k in range(100):
+            display(*_row(k))
+        assert time.perf_counter() - t0 < 0.5
+        release.set()
+        display.close()
+        lines = "".join(written).splitlines()
+        assert lines == [f"{_fmt_timestamp(timedelta(seconds=k))}  LAeq: {k}" for k in range(100)]
+
+
+# ---------------------------------------------------------------------------
+# Bar display redraws
+# ---------------------------------------------------------------------------
+
+class TestBarRedraw:
+
+    def _frames(self, capsys, rows):
+        bars = _BarDisplay(precision=1)
+        outputs = []
+        for k, row in enumerate(rows):
+            bars(timedelta(seconds=k), row, {})
+            outputs.append(capsys.readouterr().out)
+        return outputs
+
+    def test_first_frame_written_whole(self, capsys):
+        first, = self._frames(capsys, [{"LAeq": 60.0, "LAF": 70.0}])
+        assert first.count("\n") == 3
+        assert "60.0 dB" in first and "70.0 dB" in first
+
+    def test_only_changed_cells_rewritten(self, capsys):
+        _, second = self._frames(capsys, [{"LAeq": 60.0, "LAF": 70.0},
+                                          {"LAeq": 60.0, "LAF": 70.4}])
+        visible = re.sub(r"\x1b\[[0-9;]*[A-Za-z]", "", second).strip()
+        # the timestamp's seconds digit and LAF's tenths digit; the LAeq line is untouched
+        assert visible == "14"
+        assert "\n" not in second
+
+    def test_line_count_change_redraws_all(self, capsys):
+        _, second = self._frames(capsys, [{"LAeq": 60.0}, {"LAeq": 60.0, "LAF": 70.0}])
+        assert second.startswith("\x1b[2A\r\x1b[J")
+        assert second.count("\n") == 3
@@ -0,0 +1,197 @@
+"""Unit tests for slm/io/energy_index.py — cumulative energy index and interval queries."""
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from slm.io.energy_index import EnergyIndex, EnergyIndexWriter, IndexColumn
+
+SAMPLERATE = 48_000
+
+
+def _write(path, energies: np.ndarray, dt: float = 1.0, start=None, bands=None) -> None:
+    """Index per-interval *energies* (rows, width) as running totals."""
+    width = energies.shape[1]
+    writer = EnergyIndexWriter(path, start=start)
+    writer.open([IndexColumn("LAeq", None, bands, width)])
+    totals = np.cumsum(energies, axis=0)
+    for k, total in enumerate(totals, start=1):
+        writer.append(k * dt, total)
+    writer.close()
+
+
+def _measure(tmp_path, seconds: float = 10.0):
+    """Run white noise through LZeq + LZE and index them; return the index and the signal."""
+    from slm.assembly import build_chain, parse_metric
+    from slm.engine import Engine
+    from slm.io.reporter import Reporter
+    from slm.io.synthetic_controller import SyntheticController, WhiteNoise
+
+    ctrl = SyntheticController(WhiteNoise(rms=0.2), samplerate=SAMPLERATE, blocksize=4800,
+                               duration=seconds, seed=3)
+    reporter = Reporter()
+    engine = Engine(ctrl, dt=1.0, reporter=reporter)
+    build_chain([parse_metric("LZeq"), parse_metric("LZE"), parse_metric("LAFmax_dt")], engine)
+    writer = reporter.add_energy_index(tmp_path / "m")
+    engine.run()
+    writer.close()
+
+    signal = SyntheticController(WhiteNoise(rms=0.2), samplerate=SAMPLERATE, blocksize=4800,
+                                 duration=seconds, seed=3)
+    blocks = []
+    while True:
+        try:
+            blocks.append(signal.read_block()[0][:, 0].copy())
+        except StopIteration:
+            break
+    return reporter, EnergyIndex(tmp_path / "m_energy.slmi"), np.concatenate(blocks)
+
+
+# ---------------------------------------------------------------------------
+# File format
+# ---------------------------------------------------------------------------
+
+class TestFormat:
+
+    def test_round_trip(self, tmp_path):
+        energies = np.arange(1.0, 7.0).reshape(6, 1)
+        _write(tmp_path / "i.slmi", energies, start=datetime(2026, 3, 1, 14, 0))
+        index = EnergyIndex(tmp_path / "i.slmi")
+        assert index.rows == 7
+        assert index.labels == ["LAeq"]
+        assert index.start == datetime(2026, 3, 1, 14, 0)
+        np.testing.assert_array_equal(index.seconds(), np.arange(7.0))
+        np.testing.assert_array_equal(index.exposure("LAeq"), np.concatenate(([0], np.cumsum(energies))))
+
+    def test_bands(self, tmp_path):
+        _write(tmp_path / "i.slmi", np.ones((3, 2)), bands=[500, 1000])
+        index = EnergyIndex(tmp_path / "i.slmi")
+        assert index.bands("LAeq") == ["500", "1000"]
+        assert index.exposure("LAeq").shape == (4, 2)
+
+    def test_partial_record_ignored(self, tmp_path):
+        _write(tmp_path / "i.slmi", np.ones((4, 1)))
+        with open(tmp_path / "i.slmi", "ab") as f:
+            f.write(b"\0" * 11)   # a record cut short by a crash
+        assert EnergyIndex(tmp_path / "i.slmi").rows == 5
+
+    def test_records_on_disk_before_close(self, tmp_path):
+        writer = EnergyIndexWriter(tmp_path / "i.slmi", flush_interval=60.0)
+        writer.open([IndexColumn("LAeq", None, None, 1)])
+        for k in range(1, 6):
+            writer.append(float(k), np.array([float(k)]))
+        writer.flush()
+        assert writer.rows_written == 5
+        assert EnergyIndex(tmp_path / "i.slmi").rows == 6
+        writer.close()
+
+    def test_writer_error_raised_on_close(self, tmp_path):
+        writer = EnergyIndexWriter(tmp_path / "i.slmi")
+        writer.open([IndexColumn("LAeq", None, None, 1)])
+        writer._file.close()   # the next write fails on the writer thread
+        writer.append(1.0, np.array([1.0]))
+        with pytest.raises(ValueError, match="closed file"):
+            writer.close()
+
+    def test_not_an_index_raises(self, tmp_path):
+        (tmp_path / "x.slmi").write_bytes(b"not an index at all")
+        with pytest.raises(ValueError, match="not an SLM energy index"):
+            EnergyIndex(tmp_path / "x.slmi")
+
+
+# ---------------------------------------------------------------------------
+# Queries
+# ---------------------------------------------------------------------------
+
+class TestQueries:
+
+    def test_leq_and_le_of_interval(self, tmp_path):
+        energies = np.array([[1.0], [10.0], [100.0], [1000.0]])
+        _write(tmp_path / "i.slmi", energies)
+        index = EnergyIndex(tmp_path / "i.slmi")
+        assert index.leq("LAeq", 1, 3) == pytest.approx(10 * np.log10(110 / 2))
+        assert index.le("LAeq", 1, 3) == pytest.approx(10 * np.log10(110))
+        assert index.le("LAeq", timedelta(0), timedelta(seconds=4)) == pytest.approx(10 * np.log10(1111))
+
+    def test_times_snap_to_nearest_row(self, tmp_path):
+        _write(tmp_path / "i.slmi", np.ones((10, 1)))
+        index = EnergyIndex(tmp_path / "i.slmi")
+        assert index.interval(1.4, 7.6) == (1.0, 8.0)
+        assert index.interval(-5, 99) == (0.0, 10.0)
+
+    def test_empty_interval_raises(self, tmp_path):
+        _write(tmp_path / "i.slmi", np.ones((10, 1)))
+        with pytest.raises(ValueError, match="covers no logged interval"):
+            EnergyIndex(tmp_path / "i.slmi").leq("LAeq", 3.2, 3.4)
+
+    def test_band_query_returns_array(self, tmp_path):
+        _write(tmp_path / "i.slmi", np.array([[1.0, 2.0], [3.0, 4.0]]), bands=[500, 1000])
+        np.testing.assert_allclose(EnergyIndex(tmp_path / "i.slmi").le("LAeq", 0, 2),
+                                   10 * np.log10([4.0, 6.0]))
+
+
+# ---------------------------------------------------------------------------
+# Reporter integration
+# ---------------------------------------------------------------------------
+
+class TestReporterIndex:
+
+    def test_only_accumulator_columns_indexed(self, tmp_path):
+        reporter, index, _ = _measure(tmp_path, seconds=3.0)
+        assert reporter.energy_labels == ["LZeq", "LZE"]
+        assert index.labels == ["LZeq", "LZE"]
+
+    def test_interval_matches_signal(self, tmp_path):
+        _, index, signal = _measure(tmp_path)
+        # Boundaries sit at the samples actually processed: the zero record,
+        # the engine's row after the first block, one per second and the final one
+        np.testing.assert_allclose(index.seconds(), [0.0, 0.1, *np.arange(1.1, 9.2), 10.0])
+        assert index.interval(2, 7) == pytest.approx((2.1, 7.1))
+        a, b = round(2.1 * SAMPLERATE), round(7.1 * SAMPLERATE)
+        expected = 10 * np.log10(np.mean(signal[a:b] ** 2) / 2e-5 ** 2)
+        assert index.leq("LZeq", 2, 7) == pytest.approx(expected, abs=1e-9)
+        assert index.le("LZE", 2, 7) == pytest.approx(expected + 10 * np.log10(5), abs=1e-9)
+
+    def test_whole_run_matches_final_row(self, tmp_path):
+        reporter, index, _ = _measure(tmp_path)
+        end = index.seconds()[-1]
+        assert index.leq("LZeq", 0, end) == pytest.approx(reporter.broadband("LZeq")[-1], abs=1e-9)
+        assert index.le("LZE", 0, end) == pytest.approx(reporter.broadband("LZE")[-1], abs=1e-9)
+
+    def test_no_indexable_columns_raises(self, tmp_path):
+        from slm.io.reporter import Reporter
+        with pytest.raises(ValueError, match="No Leq or LE columns"):
+            Reporter().add_energy_index(tmp_path / "m")
+
+
+# ---------------------------------------------------------------------------
+# CLI query
+# ---------------------------------------------------------------------------
+
+class TestQueryEnergy:
+
+    def test_offsets(self, tmp_path):
+        from slm.app.cli import query_energy
+        _write(tmp_path / "m_energy.slmi", np.full((7200, 1), 1e6))
+        text = query_energy(tmp_path / "m", "LAeq", "0:10", "1:10")
+        assert text.splitlines() == ["LAeq  00:10:00.000 - 01:10:00.000  (3600.000 s)",
+                                     "  Leq  60.00 dB", "  LE   95.56 dB"]
+
+    def test_clock_times(self, tmp_path):
+        from slm.app.cli import query_energy
+        _write(tmp_path / "m_energy.slmi", np.full((7200, 1), 1e6), start=datetime(2026, 3, 1, 13, 30))
+        first_line = query_energy(tmp_path / "m_energy.slmi", "LAeq", "14:03", "14:47",
+                                  clock=True).splitlines()[0]
+        assert first_line == "LAeq  2026-03-01 14:03:00.000 - 2026-03-01 14:47:00.000  (2640.000 s)"
+
+    def test_clock_needs_start(self, tmp_path):
+        from slm.app.cli import query_energy
+        _write(tmp_path / "m_energy.slmi", np.ones((10, 1)))
+        with pytest.raises(ValueError, match="no start time"):
+            query_energy(tmp_path / "m", "LAeq", "14:03", "14:04", clock=True)
+
+    def test_unknown_metric_raises(self, tmp_path):
+        from slm.app.cli import query_energy
+        _write(tmp_path / "m_energy.slmi", np.ones((10, 1)))
+        with pytest.raises(ValueError, match="Indexed: LAeq"):
+            query_energy(tmp_path / "m", "LCeq", "0", "5")
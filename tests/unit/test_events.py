@@ -0,0 +1,185 @@
+"""Unit tests for slm/io/events.py — threshold-triggered events with pre-trigger audio."""
+import csv
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from slm.app.config import SLMConfig
+from slm.assembly import build_chain, parse_metric
+from slm.engine import Engine
+from slm.io.events import EventDetector, parse_trigger
+from slm.io.file_controller import FileController
+from slm.io.reporter import Reporter
+
+SAMPLERATE = 48_000
+BLOCKSIZE = 1000
+
+
+def _signal(bursts=((2.0, 3.0), (6.0, 6.5)), duration: float = 8.0) -> np.ndarray:
+    """Quiet noise (~34 dB) with 1 kHz bursts at 85 dB (sensitivity 1 V/Pa)."""
+    t = np.arange(round(duration * SAMPLERATE)) / SAMPLERATE
+    x = 0.001 * np.random.default_rng(1).standard_normal(len(t))
+    for a, b in bursts:
+        on = (t >= a) & (t < b)
+        x[on] += 0.5 * np.sin(2 * np.pi * 1000.0 * t[on])
+    return x.astype(np.float32)
+
+
+def _run(tmp_path: Path, signal: np.ndarray, triggers, metrics=("LAF", "LAE"), close=True, **kwargs):
+    wav = tmp_path / "in.wav"
+    sf.write(str(wav), signal, SAMPLERATE, subtype="FLOAT")
+    controller = FileController(str(wav), blocksize=BLOCKSIZE)
+    controller.set_sensitivity(1.0, unit="V")
+    engine = Engine(controller, dt=1.0, reporter=Reporter())
+    build_chain([parse_metric(m) for m in metrics], engine)
+    kwargs.setdefault("audio", "wav")
+    detector = EventDetector(engine, triggers, tmp_path / "m", **kwargs)
+    engine.run()
+    if close:
+        detector.close()
+    return detector
+
+
+# ---------------------------------------------------------------------------
+# Triggers
+# ---------------------------------------------------------------------------
+
+class TestParseTrigger:
+
+    @pytest.mark.parametrize("text, expected", [("LAF>85", ("LAF", 85.0)),
+                                                ("LAeq_1m > 70.5", ("LAeq_1m", 70.5)),
+                                                ("ch2/LCpeak>-3", ("ch2/LCpeak", -3.0))])
+    def test_parse(self, text, expected):
+        assert parse_trigger(text) == expected
+
+    @pytest.mark.parametrize("text", ["LAF", "LAF<85", "LAF>loud", ">85"])
+    def test_invalid_raises(self, text):
+        with pytest.raises(ValueError, match="METRIC>LIMIT"):
+            parse_trigger(text)
+
+    def test_unknown_metric_raises(self, tmp_path):
+        with pytest.raises(ValueError, match="not a broadband metric"):
+            _run(tmp_path, _signal(duration=1.0), [("LAS", 70.0)])
+
+
+# ---------------------------------------------------------------------------
+# Detection
+# ---------------------------------------------------------------------------
+
+class TestDetection:
+
+    def test_events_found(self, tmp_path):
+        detector = _run(tmp_path, _signal(), [("LAF", 70.0)], hold_seconds=0.5)
+        events = detector.events
+        assert [e.number for e in events] == [1, 2]
+        assert events[0].start == pytest.approx(2.0, abs=BLOCKSIZE / SAMPLERATE)
+        # LAF decays ~35 dB/s after the burst, so stays above 70 dB for ~0.4 s
+        assert 3.2 < events[0].stop < 3.7
+        assert events[0].trigger == "LAF"
+        assert events[0].peaks["LAF"] == pytest.approx(85.0, abs=0.3)
+
+    def test_sel(self, tmp_path):
+        detector = _run(tmp_path, _signal(), [("LAF", 70.0)], hold_seconds=0.5)
+        # 1 s at 85 dB → SEL 85 dB; 0.5 s → 82 dB (the quiet tails add nothing measurable)
+        assert detector.events[0].sel == pytest.approx(85.0, abs=0.2)
+        assert detector.events[1].sel == pytest.approx(82.0, abs=0.2)
+
+    def test_quiet_input_has_no_events(self, tmp_path):
+        detector = _run(tmp_path, _signal(bursts=()), [("LAF", 70.0)])
+        assert detector.events == []
+        assert not (tmp_path / "m_events.csv").exists()
+
+    def test_close_ends_active_event(self, tmp_path):
+        detector = _run(tmp_path, _signal(bursts=((3.0, 5.0),), duration=4.0), [("LAF", 70.0)],
+                        close=False)
+        assert detector.active
+        detector.close()
+        assert detector.events[0].stop == pytest.approx(4.0, abs=0.05)
+
+    def test_any_trigger_opens_event(self, tmp_path):
+        detector = _run(tmp_path, _signal(), [("LAeq_1m", 80.0), ("LAF", 70.0)],
+                        metrics=("LAeq_1m", "LAF", "LAE"))
+        assert [e.trigger for e in detector.events] == ["LAF", "LAF"]
+        assert set(detector.events[0].peaks) == {"LAeq_1m", "LAF"}
+
+    def test_sel_from_opening_trigger_exposure(self, tmp_path):
+        quiet = _signal(bursts=())
+        signal = np.column_stack([quiet, _signal()])      # bursts on channel 2 only
+        detector = _run(tmp_path, signal, [("LAF", 70.0), ("ch2/LAF", 70.0)], hold_seconds=0.5,
+                        metrics=("LAF", "ch2/LAF", "LAE", "ch2/LAE"),
+                        exposure={"LAF": "LAE", "ch2/LAF": "ch2/LAE"})
+        assert [e.trigger for e in detector.events] == ["ch2/LAF", "ch2/LAF"]
+        assert detector.events[0].sel == pytest.approx(85.0, abs=0.2)
+
+    def test_trigger_without_exposure_has_no_sel(self, tmp_path):
+        detector = _run(tmp_path, _signal(), [("LAF", 70.0)], exposure={})
+        assert np.isnan(detector.events[0].sel)
+
+    def test_exposure_for_unknown_trigger_raises(self, tmp_path):
+        with pytest.raises(ValueError, match="not an event trigger"):
+            _run(tmp_path, _signal(duration=1.0), [("LAF", 70.0)], exposure={"LCF": "LAE"})
+
+
+# ---------------------------------------------------------------------------
+# Output files
+# ---------------------------------------------------------------------------
+
+class TestOutput:
+
+    def test_snippet_includes_pre_trigger(self, tmp_path):
+        signal = _signal()
+        detector = _run(tmp_path, signal, [("LAF", 70.0)], pre_seconds=1.5, hold_seconds=0.5)
+        event = detector.events[0]
+        audio, fs = sf.read(str(event.audio), dtype="float32")
+        first = round(event.start * SAMPLERATE) - round(1.5 * SAMPLERATE)
+        assert fs == SAMPLERATE
+        np.testing.assert_array_equal(audio, signal[first:first + len(audio)])
+        # pre-trigger + event + hold tail, to the block
+        expected = event.stop - event.start + 1.5 + 0.5
+        assert len(audio) / SAMPLERATE == pytest.approx(expected, abs=2 * BLOCKSIZE / SAMPLERATE)
+
+    def test_events_csv(self, tmp_path):
+        _run(tmp_path, _signal(), [("LAF", 70.0)], hold_seconds=0.5,
+             start=datetime(2026, 3, 1, 14, 0))
+        with open(tmp_path / "m_events.csv", newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert len(rows) == 2
+        assert rows[0]["start"].startswith("2026-03-01 14:00:0")
+        assert rows[0]["trigger"] == "LAF"
+        assert rows[0]["audio"] == "m_event_0001.wav"
+        assert float(rows[0]["SEL"]) == pytest.approx(85.0, abs=0.2)
+
+    def test_no_audio(self, tmp_path):
+        detector = _run(tmp_path, _signal(), [("LAF", 70.0)], audio=None)
+        assert detector.events[0].audio is None
+        assert list(tmp_path.glob("m_event_*")) == []
+
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+class TestEventConfig:
+
+    def test_round_trip(self, tmp_path):
+        toml_path = tmp_path / "c.toml"
+        SLMConfig(metrics=["LAeq"], events=["LAF>85", "LAeq_1m>70"], event_pre=3.0).to_toml(toml_path)
+        config = SLMConfig.from_toml(toml_path)
+        assert config.events == ["LAF>85", "LAeq_1m>70"]
+        assert (config.event_pre, config.event_hold) == (3.0, 2.0)
+
+    def test_invalid_trigger_raises(self, tmp_path):
+        toml_path = tmp_path / "c.toml"
+        toml_path.write_text('[events]\ntriggers = ["LAF above 85"]\n', encoding="utf-8")
+        with pytest.raises(ValueError, match="triggers"):
+            SLMConfig.from_toml(toml_path)
+
+    def test_metrics_added_for_events(self):
+        from slm.app.cli import _metric_names
+        config = SLMConfig(metrics=["LZeq", "LAeq_dt"], events=["LAF>85", "ch2/LCF>90"])
+        assert _metric_names(config) == ["LZeq", "LAeq_dt", "LAF", "ch2/LCF", "LAE", "ch2/LCE"]
+        config = SLMConfig(metrics=["LAeq", "LAF"], events=["LAF>85"])
+        assert _metric_names(config) == ["LAeq", "LAF"]
@@ -0,0 +1,89 @@
+"""Unit tests for FileController read-ahead prefetching."""
+from __future__ import annotations
+
+import threading
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from slm.io.file_controller import FileController
+
+SAMPLERATE = 48_000
+BLOCKSIZE = 256
+
+
+def _write(path, frames: int, channels: int = 2, **kwargs):
+    rng = np.random.default_rng(0)
+    sf.write(str(path), rng.uniform(-0.5, 0.5, (frames, channels)), SAMPLERATE, **kwargs)
+
+
+def _read_all(controller) -> list[np.ndarray]:
+    blocks = []
+    while True:
+        try:
+            block, _ = controller.read_block()
+        except StopIteration:
+            return blocks
+        blocks.append(block.copy())
+
+
+class TestPrefetch:
+
+    @pytest.mark.parametrize("frames", [0, 1, 100, BLOCKSIZE, 10 * BLOCKSIZE, 10 * BLOCKSIZE + 7, 12_345])
+    @pytest.mark.parametrize("overlap", [0, 64, BLOCKSIZE - 1])
+    @pytest.mark.parametrize("prefetch", [BLOCKSIZE / SAMPLERATE, 0.02])
+    def test_matches_direct_reading(self, tmp_path, frames, overlap, prefetch):
+        path = tmp_path / "a.wav"
+        _write(path, frames)
+        expected = _read_all(FileController(path, blocksize=BLOCKSIZE, overlap=overlap))
+        ctrl = FileController(path, blocksize=BLOCKSIZE, overlap=overlap, prefetch=prefetch)
+        got = _read_all(ctrl)
+        assert ctrl.done
+        assert len(got) == len(expected)
+        for g, e in zip(got, expected):
+            np.testing.assert_array_equal(g, e)
+
+    def test_flac(self, tmp_path):
+        path = tmp_path / "a.flac"
+        _write(path, 50_000, format="FLAC", subtype="PCM_16")
+        expected = _read_all(FileController(path, blocksize=BLOCKSIZE))
+        got = _read_all(FileController(path, blocksize=BLOCKSIZE, prefetch=0.1))
+        np.testing.assert_array_equal(np.concatenate(got), np.concatenate(expected))
+
+    def test_block_indices(self, tmp_path):
+        path = tmp_path / "a.wav"
+        _write(path, 3 * BLOCKSIZE)
+        ctrl = FileController(path, blocksize=BLOCKSIZE, prefetch=0.01)
+        assert [ctrl.read_block()[1] for _ in range(3)] == [0, 1, 2]
+
+    def test_stop_mid_stream_joins_thread(self, tmp_path):
+        path = tmp_path / "a.wav"
+        _write(path, SAMPLERATE * 5)
+        ctrl = FileController(path, blocksize=BLOCKSIZE, prefetch=0.05, prefetch_depth=2)
+        ctrl.read_block()
+        ctrl.stop()
+        assert ctrl.done
+        assert not any(t.name == "FileController-prefetch" for t in threading.enumerate())
+
+    def test_reopen(self, tmp_path):
+        a, b = tmp_path / "a.wav", tmp_path / "b.wav"
+        _write(a, 1000)
+        _write(b, 2000, channels=1)
+        ctrl = FileController(a, blocksize=BLOCKSIZE, prefetch=0.01)
+        _read_all(ctrl)
+        ctrl.open(b, blocksize=BLOCKSIZE)
+        blocks = _read_all(ctrl)
+        assert len(blocks) == 8 and blocks[0].shape == (BLOCKSIZE, 1)
+
+    def test_reader_error_surfaces_on_read_block(self, tmp_path, monkeypatch):
+        path = tmp_path / "a.wav"
+        _write(path, 1000)
+
+        def broken_read(*args, **kwargs):
+            raise sf.LibsndfileError(0, "decode failed")
+
+        monkeypatch.setattr(sf.SoundFile, "read", broken_read)
+        ctrl = FileController(path, blocksize=BLOCKSIZE, prefetch=0.01)
+        with pytest.raises(sf.LibsndfileError):
+            ctrl.read_block()
@@ -0,0 +1,122 @@
+"""Unit tests for slm/filter_cache.py."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from pyoctaveband import WeightingFilter
+from scipy.signal import butter, sosfilt_zi
+
+from slm import filter_cache
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    filter_cache.disable_persistence()
+    filter_cache.clear()
+    yield
+    filter_cache.disable_persistence()
+    filter_cache.clear()
+
+
+class TestWeightingDesign:
+
+    def test_matches_direct_design(self):
+        sos, zi = filter_cache.weighting_design(48_000, "A")
+        expected = WeightingFilter(fs=48_000, curve="A").sos
+        np.testing.assert_array_equal(sos, expected)
+        np.testing.assert_array_equal(zi[:, 0, :], sosfilt_zi(expected))
+
+    def test_second_call_is_a_hit(self):
+        first = filter_cache.weighting_design(48_000, "C")
+        second = filter_cache.weighting_design(48_000, "C")
+        assert first[0] is second[0]
+        info = filter_cache.cache_info()
+        assert info["hits"] == 1 and info["misses"] == 1
+
+    def test_keyed_by_samplerate(self):
+        a = filter_cache.weighting_design(48_000, "A")[0]
+        b = filter_cache.weighting_design(44_100, "A")[0]
+        assert not np.array_equal(a, b)
+
+    def test_zi_template_is_read_only(self):
+        _, zi = filter_cache.weighting_design(48_000, "A")
+        with pytest.raises(ValueError):
+            zi[0, 0, 0] = 1.0
+
+
+class TestButterDesign:
+
+    def test_bandpass_matches_direct_design(self):
+        sos, _ = filter_cache.butter_design(2, (900.0, 1100.0), "bandpass", 48_000)
+        expected = butter(2, [900.0, 1100.0], btype="bandpass", fs=48_000, output="sos")
+        np.testing.assert_array_equal(sos, expected)
+
+    def test_list_and_tuple_share_key(self):
+        a = filter_cache.butter_design(2, (900.0, 1100.0), "bandpass", 48_000)
+        b = filter_cache.butter_design(2, [900, 1100], "bandpass", 48_000)
+        assert a[0] is b[0]
+
+
+class TestOctaveFilterBank:
+
+    def test_copies_are_independent(self):
+        a = filter_cache.octave_filter_bank(48_000, 1.0, (63.0, 8000.0))
+        b = filter_cache.octave_filter_bank(48_000, 1.0, (63.0, 8000.0))
+        assert a is not b
+        rng = np.random.default_rng(0)
+        a.filter(rng.standard_normal((1, 512)), sigbands=True, detrend=False, calculate_level=False)
+        # b has never filtered anything: its lazily-allocated state is still empty
+        assert all(z.size == 0 for z in b.zi)
+        assert filter_cache.cache_info()["misses"] == 1
+
+
+class TestPersistence:
+
+    def test_designs_reload_from_disk(self, tmp_path, monkeypatch):
+        filter_cache.enable_persistence(tmp_path)
+        sos, _ = filter_cache.weighting_design(48_000, "A")
+        assert list(tmp_path.glob("weighting-*.pkl"))
+
+        # Simulate a new process: empty memory cache, design step unavailable
+        filter_cache.clear()
+        import pyoctaveband
+        monkeypatch.setattr(pyoctaveband, "WeightingFilter", None)
+        reloaded, _ = filter_cache.weighting_design(48_000, "A")
+        np.testing.assert_array_equal(reloaded, sos)
+        info = filter_cache.cache_info()
+        assert info["disk_hits"] == 1 and info["misses"] == 0
+
+    def test_no_temp_files_left_behind(self, tmp_path):
+        filter_cache.enable_persistence(tmp_path)
+        filter_cache.weighting_design(48_000, "A")
+        filter_cache.weighting_design(48_000, "C")
+        assert not list(tmp_path.glob("*.tmp"))
+        assert len(list(tmp_path.glob("*.pkl"))) == 2
+
+    def test_write_failure_is_not_fatal(self, tmp_path, monkeypatch):
+        filter_cache.enable_persistence(tmp_path)
+
+        def unwritable(*args, **kwargs):
+            raise OSError(28, "No space left on device")
+
+        monkeypatch.setattr(filter_cache.tempfile, "NamedTemporaryFile", unwritable)
+        sos, _ = filter_cache.weighting_design(48_000, "A")
+        assert sos.shape[1] == 6
+        assert not list(tmp_path.iterdir())
+
+
+class TestPluginsUseCache:
+
+    def test_reset_does_not_redesign(self):
+        import types
+        from slm.frequency_weighting import PluginAWeighting
+
+        bus = types.SimpleNamespace(samplerate=48_000, blocksize=256, sensitivity=1.0, dt=1.0,
+                                    width=1, get_chain=lambda: [])
+        bus.bus = bus
+        plugin = PluginAWeighting(input=bus)
+        plugin.reset()
+        plugin.reset()
+        info = filter_cache.cache_info()
+        assert info["misses"] == 1
+        assert info["hits"] == 2
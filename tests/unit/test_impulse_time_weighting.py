@@ -20,6 +20,7 @@ from __future__ import annotations
 import types
 
 import numpy as np
+import pytest
 
 from slm.time_weighting import PluginImpulseTimeWeighting
 
@@ -211,3 +212,33 @@ class TestImpulseAsymmetry:
             f"Fall/rise ratio = {ratio:.1f}× (expected ≥ 10×, "
             f"from τ_fall/τ_rise = {1500/35:.0f}×)"
         )
+
+
+class TestImpulseKernel2D:
+    """The multi-channel kernel must match the single-channel reference exactly."""
+
+    def test_matches_1d_reference_per_channel(self):
+        from slm.time_weighting import asymmetric_time_weighting, asymmetric_time_weighting_2d
+
+        rng = np.random.default_rng(7)
+        alpha_rise = 1 - np.exp(-1 / (SAMPLERATE * 0.035))
+        alpha_fall = 1 - np.exp(-1 / (SAMPLERATE * 1.5))
+        x = rng.standard_normal((5, 2_000)) ** 2
+        zi = rng.random(5)
+        out = np.empty_like(x)
+        zi_2d = zi.copy()
+        asymmetric_time_weighting_2d(x, zi_2d, alpha_rise, alpha_fall, out)
+
+        for ch in range(5):
+            y, z = asymmetric_time_weighting(x[ch], zi=zi[ch],
+                                             alpha_rise=alpha_rise, alpha_fall=alpha_fall)
+            np.testing.assert_allclose(out[ch], y, rtol=1e-12)
+            assert zi_2d[ch] == pytest.approx(z, rel=1e-12)
+
+    def test_plugin_writes_into_preallocated_output(self):
+        bus    = _mock_bus()
+        plugin = PluginImpulseTimeWeighting(input=bus, width=3)
+        buffer = plugin.output
+        plugin.process(np.ones((3, BLOCKSIZE)))
+        assert plugin.output is buffer
+        assert np.all(plugin.output[:, -1] > 0)
@@ -0,0 +1,193 @@
+"""Unit tests for slm/io/live_server.py — live levels over HTTP."""
+import http.client
+import json
+import socket
+import threading
+import urllib.request
+from datetime import timedelta
+
+import numpy as np
+import pytest
+
+from slm.assembly import build_chain, parse_metric
+from slm.engine import Engine
+from slm.io.live_server import LiveServer, parse_address
+from slm.io.reporter import Reporter
+from slm.io.synthetic_controller import SyntheticController, WhiteNoise
+
+
+def _engine(metrics=("LZeq", "ch2/LAF", "LZeq:bands:250-2000"), seconds: float = 3.0):
+    ctrl = SyntheticController([WhiteNoise(rms=0.2), WhiteNoise(rms=0.1)], samplerate=48_000,
+                               blocksize=4800, duration=seconds, seed=3)
+    engine = Engine(ctrl, dt=1.0, reporter=Reporter(precision=2))
+    build_chain([parse_metric(m) for m in metrics], engine)
+    return engine
+
+
+@pytest.fixture
+def measured():
+    """A finished 3 s measurement with a server on a free localhost port."""
+    engine = _engine()
+    server = LiveServer(engine, "127.0.0.1:0")
+    engine.reporter.add_sink(server)
+    engine.run()
+    yield engine, server
+    server.close()
+
+
+def _get(server: LiveServer, path: str) -> tuple[int, str, str]:
+    try:
+        with urllib.request.urlopen(server.url + path, timeout=5) as response:
+            return response.status, response.headers["Content-Type"], response.read().decode()
+    except urllib.error.HTTPError as error:
+        return error.code, error.headers["Content-Type"], error.read().decode()
+
+
+# ---------------------------------------------------------------------------
+# Addresses
+# ---------------------------------------------------------------------------
+
+class TestAddress:
+
+    @pytest.mark.parametrize("text, expected", [("8765", ("127.0.0.1", 8765)),
+                                                ("0.0.0.0:9000", ("0.0.0.0", 9000)),
+                                                ("[::1]:9000", ("::1", 9000)),
+                                                ("unix:/run/slm.sock", "/run/slm.sock")])
+    def test_parse(self, text, expected):
+        assert parse_address(text) == expected
+
+    def test_invalid_raises(self):
+        with pytest.raises(ValueError, match="HOST:PORT"):
+            parse_address("localhost")
+
+
+# ---------------------------------------------------------------------------
+# Endpoints
+# ---------------------------------------------------------------------------
+
+class TestEndpoints:
+
+    def test_levels(self, measured):
+        engine, server = measured
+        status, content_type, body = _get(server, "/levels")
+        levels = json.loads(body)
+        assert status == 200 and content_type.startswith("application/json")
+        assert levels["timestamp"] == "00:00:02.900"
+        assert levels["broadband"]["LZeq"] == round(float(engine.reporter.broadband("LZeq")[-1]), 2)
+        assert set(levels["broadband"]) == {"LZeq", "ch2/LAF"}
+        bands = levels["bands"]["LZeq:bands:250-2000"]
+        assert len(bands["frequencies"]) == len(bands["levels"])
+        assert bands["levels"] == [round(float(v), 2) for v in engine.reporter.band("LZeq:bands:250-2000")[-1]]
+
+    def test_metrics(self, measured):
+        engine, server = measured
+        status, content_type, body = _get(server, "/metrics")
+        assert status == 200 and content_type.startswith("text/plain; version=0.0.4")
+        lines = body.splitlines()
+        assert "# TYPE slm_level_db gauge" in lines
+        laf = next(line for line in lines if line.startswith('slm_level_db{metric="LAF"'))
+        assert laf.startswith('slm_level_db{metric="LAF",channel="2"} ')
+        assert float(laf.split()[-1]) == pytest.approx(engine.reporter.broadband("ch2/LAF")[-1])
+        assert any(line.startswith('slm_band_level_db{metric="LZeq:bands:250-2000",band="1k') for line in lines)
+        assert f"slm_rows_total {engine.reporter.rows}" in lines
+        assert "slm_overruns_total 0" in lines
+
+    def test_health(self, measured):
+        engine, server = measured
+        health = json.loads(_get(server, "/health")[2])
+        assert health["rows"] == engine.reporter.rows
+        assert health["processed_seconds"] == pytest.approx(3.0)
+        assert health["overruns"] == 0
+        assert 0.0 < health["realtime_factor"] < 1.0
+        assert health["last_row_age_seconds"] >= 0.0
+
+    def test_before_first_row(self):
+        engine = _engine()
+        with LiveServer(engine, "127.0.0.1:0") as server:
+            engine.reporter.add_sink(server)
+            assert json.loads(_get(server, "/levels")[2])["broadband"] == {}
+            assert _get(server, "/metrics")[2].splitlines()[-1] == "slm_overruns_total 0"
+
+    def test_unknown_path(self, measured):
+        status, _, body = _get(measured[1], "/nope")
+        assert status == 404
+        assert "/metrics" in json.loads(body)["endpoints"]
+
+    def test_nan_served_as_null(self):
+        engine = _engine(metrics=("LZeq",))
+        with LiveServer(engine, "127.0.0.1:0") as server:
+            engine.reporter.add_sink(server)
+            server.open([], 2)
+            server.append(timedelta(seconds=1), np.array([np.nan]))
+            assert json.loads(_get(server, "/levels")[2])["broadband"] == {"LZeq": None}
+            assert 'slm_level_db{metric="LZeq"} NaN' in _get(server, "/metrics")[2]
+
+
+# ---------------------------------------------------------------------------
+# Streaming and transports
+# ---------------------------------------------------------------------------
+
+class TestStream:
+
+    def test_stream_pushes_each_row(self):
+        engine = _engine(metrics=("LZeq",))
+        server = LiveServer(engine, "127.0.0.1:0")
+        engine.reporter.add_sink(server)
+        received = []
+        ready = threading.Event()
+
+        def client():
+            host, port = server.address
+            conn = http.client.HTTPConnection(host, port, timeout=5)
+            conn.request("GET", "/stream")
+            response = conn.getresponse()
+            ready.set()
+            for line in response:
+                if line.startswith(b"data: "):
+                    received.append(json.loads(line[6:]))
+            conn.close()
+
+        thread = threading.Thread(target=client)
+        thread.start()
+        ready.wait(5)
+        server.open([], 2)
+        for k in range(1, 6):
+            server.append(timedelta(seconds=k), np.array([60.0 + k]))
+        server.close()
+        thread.join(5)
+        # the client may connect after the first rows; every row after that arrives in order
+        seconds = [r["seconds"] for r in received]
+        assert seconds and seconds == sorted(set(seconds)) and seconds[-1] == 5.0
+
+    def test_unix_socket(self, tmp_path):
+        engine = _engine(metrics=("LZeq",), seconds=1.0)
+        path = tmp_path / "slm.sock"
+        with LiveServer(engine, f"unix:{path}") as server:
+            engine.reporter.add_sink(server)
+            engine.run()
+            assert server.url == f"unix:{path}"
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.connect(str(path))
+            sock.sendall(b"GET /health HTTP/1.1\r\nHost: slm\r\nConnection: close\r\n\r\n")
+            reply = b""
+            while chunk := sock.recv(4096):
+                reply += chunk
+            sock.close()
+            assert reply.startswith(b"HTTP/1.1 200")
+            assert json.loads(reply.split(b"\r\n\r\n", 1)[1])["rows"] == engine.reporter.rows
+        assert not path.exists()
+
+    def test_stale_unix_socket_replaced(self, tmp_path):
+        path = tmp_path / "slm.sock"
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(str(path))
+        stale.close()                      # a socket file left over from a previous run
+        with LiveServer(_engine(metrics=("LZeq",), seconds=1.0), f"unix:{path}"):
+            assert path.is_socket()
+
+    def test_unix_path_not_a_socket_raises(self, tmp_path):
+        path = tmp_path / "slm.sock"
+        path.write_text("keep me")
+        with pytest.raises(FileExistsError, match="not a Unix socket"):
+            LiveServer(_engine(metrics=("LZeq",), seconds=1.0), f"unix:{path}")
+        assert path.read_text() == "keep me"
@@ -0,0 +1,138 @@
+"""Unit tests for slm/io/log_writer.py — streaming, rotating log output."""
+from __future__ import annotations
+
+import csv
+import filecmp
+import types
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from slm.io.log_writer import LogWriter
+from slm.io.reporter import Reporter
+
+
+def _reporter(n_rows: int = 0, retain_rows: int | None = None, sink=None) -> Reporter:
+    """Reporter with broadband and band columns on two channels, *n_rows* logged at dt = 10 s."""
+    rng = np.random.default_rng(0)
+    values = rng.normal(60.0, 10.0, (n_rows, 7))
+    state = {"i": 0}
+
+    def plugin(width: int, offset: int):
+        return types.SimpleNamespace(width=width,
+                                     read_db=lambda _: values[state["i"], offset:offset + width].copy())
+
+    r = Reporter(precision=2, retain_rows=retain_rows)
+    r.add_column("LAeq", plugin(1, 0), "LAeq")
+    r.add_column("LZeq:bands", plugin(3, 1), "LZeq", center_frequencies=["63", "125", "250"])
+    r.add_column("ch2/LCeq", plugin(1, 4), "LCeq", channel=2)
+    r.add_column("ch2/LZeq:bands", plugin(2, 5), "LZeq", center_frequencies=["1000", "2000"],
+                 channel=2)
+    if sink is not None:
+        r.add_sink(sink)
+    for i in range(n_rows):
+        state["i"] = i
+        r.record(timedelta(seconds=10 * i), dt=10.0)
+    return r
+
+
+def _rows(path) -> list[dict]:
+    with open(path, newline="") as f:
+        return list(csv.DictReader(f))
+
+
+class TestLogWriter:
+
+    def test_matches_reporter_write(self, tmp_path):
+        _reporter(500).write(tmp_path / "batch" / "m")
+        log = LogWriter(tmp_path / "stream" / "m", flush_interval=0.01)
+        _reporter(500, retain_rows=1, sink=log)
+        log.close()
+        names = sorted(p.name for p in (tmp_path / "batch").iterdir())
+        assert names == sorted(p.name for p in (tmp_path / "stream").iterdir())
+        assert len(names) == 8
+        for name in names:
+            assert filecmp.cmp(tmp_path / "batch" / name, tmp_path / "stream" / name, shallow=False)
+
+    def test_rows_on_disk_before_close(self, tmp_path):
+        log = LogWriter(tmp_path / "m", flush_interval=60.0)
+        reporter = _reporter(5, sink=log)
+        log.flush()
+        assert len(_rows(tmp_path / "m_log.csv")) == 5
+        report = _rows(tmp_path / "m_report.csv")
+        assert report == [{"LAeq": f"{reporter.broadband('LAeq')[-1]:.2f}"}]
+        assert not list(tmp_path.glob("*.tmp"))
+        log.close()
+
+    def test_hourly_rotation(self, tmp_path):
+        # Rows every 10 s from 12:58:00 for 4 minutes: 12 rows in the 12 h file, 12 in the 13 h file
+        log = LogWriter(tmp_path / "m", rotate="hour", start=datetime(2026, 3, 1, 12, 58),
+                        flush_interval=0.01)
+        _reporter(24, retain_rows=1, sink=log)
+        log.close()
+        first = _rows(tmp_path / "m_2026-03-01_12_log.csv")
+        second = _rows(tmp_path / "m_2026-03-01_13_log.csv")
+        assert len(first) == len(second) == 12
+        assert second[0]["timestamp"] == "00:02:00.000"
+        assert len(_rows(tmp_path / "m_2026-03-01_13_ch2_rta_log.csv")) == 12
+        assert (tmp_path / "m_report.csv").exists()
+        assert (tmp_path / "m_ch2_rta_report.csv").exists()
+        assert len(log.files) == 8
+
+    def test_daily_rotation_names(self, tmp_path):
+        log = LogWriter(tmp_path / "m", rotate="day", start=datetime(2026, 3, 1, 23, 59, 50))
+        _reporter(3, sink=log)
+        log.close()
+        names = {p.name for p in log.files}
+        assert {"m_2026-03-01_log.csv", "m_2026-03-02_log.csv", "m_2026-03-02_ch2_rta_log.csv"} <= names
+        assert len(names) == 8
+
+    def test_restart_within_period_numbers_files(self, tmp_path):
+        for start in (datetime(2026, 3, 1, 12, 10), datetime(2026, 3, 1, 12, 40)):
+            log = LogWriter(tmp_path / "m", rotate="hour", start=start, flush_interval=0.01)
+            _reporter(6, retain_rows=1, sink=log)
+            log.close()
+        first = _rows(tmp_path / "m_2026-03-01_12_log.csv")
+        second = _rows(tmp_path / "m_2026-03-01_12-2_log.csv")
+        assert [r["timestamp"] for r in first] == [r["timestamp"] for r in second]
+        assert first[0]["timestamp"] == "00:00:00.000" and len(first) == 6
+        assert len(_rows(tmp_path / "m_2026-03-01_12-2_ch2_rta_log.csv")) == 6
+        assert {p.name for p in log.files} == {f"m_2026-03-01_12-2{suffix}" for suffix in
+                                               ("_log.csv", "_rta_log.csv", "_ch2_log.csv",
+                                                "_ch2_rta_log.csv")}
+
+    def test_restart_with_other_metrics_keeps_headers(self, tmp_path):
+        earlier = b"timestamp,LAF,LAeq\r\n00:00:00.000,60.0,61.0\r\n"   # other metrics
+        (tmp_path / "m_2026-03-01_12_log.csv").write_bytes(earlier)
+        log = LogWriter(tmp_path / "m", rotate="hour", start=datetime(2026, 3, 1, 12, 10),
+                        flush_interval=0.01)
+        _reporter(3, sink=log)
+        log.close()
+        assert (tmp_path / "m_2026-03-01_12_log.csv").read_bytes() == earlier
+        rows = _rows(tmp_path / "m_2026-03-01_12-2_log.csv")
+        assert list(rows[0]) == ["timestamp", "LAeq"] and len(rows) == 3
+
+    def test_retained_memory_stays_flat(self, tmp_path):
+        log = LogWriter(tmp_path / "m", flush_interval=0.01)
+        reporter = _reporter(5000, retain_rows=10, sink=log)
+        log.close()
+        assert reporter.rows <= 2 * Reporter._INITIAL_ROWS
+        assert reporter._capacity == Reporter._INITIAL_ROWS
+        assert log.rows_written == 5000
+        assert reporter.timestamps()[-1] == np.timedelta64(49_990, "s")
+
+    def test_writer_error_raised_on_close(self, tmp_path):
+        (tmp_path / "m_log.csv").mkdir()
+        log = LogWriter(tmp_path / "m", flush_interval=0.01)
+        _reporter(3, sink=log)
+        with pytest.raises(IsADirectoryError):
+            log.close()
+
+    def test_invalid_rotation_raises(self, tmp_path):
+        with pytest.raises(ValueError, match="hour"):
+            LogWriter(tmp_path / "m", rotate="week")
+
+    def test_invalid_retain_rows_raises(self):
+        with pytest.raises(ValueError, match="retain_rows"):
+            Reporter(retain_rows=0)
@@ -106,6 +106,14 @@ class TestMaxAccumulator:
         m.process(block)
         np.testing.assert_array_equal(m.read(), [5.0, 4.0])
 
+    def test_updates_in_place(self):
+        p = _parent()
+        m = MaxAccumulator(name="max", parent=p)
+        acc = m.read()
+        m.process(np.array([[1.0, 7.0, 2.0, 3.0]]))
+        assert m.read() is acc
+        np.testing.assert_array_equal(acc, [7.0])
+
 
 # ---------------------------------------------------------------------------
 # MinAccumulator
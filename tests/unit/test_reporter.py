@@ -175,6 +175,63 @@ class TestRecordContent:
         assert len(r._broadband_rows) == len(r._band_rows) == 2
 
 
+# ---------------------------------------------------------------------------
+# Columnar log storage
+# ---------------------------------------------------------------------------
+
+class TestColumnarLog:
+
+    def _reporter(self, n: int) -> Reporter:
+        r = Reporter()
+        state = {"i": 0}
+        r.add_column("LAF", types.SimpleNamespace(width=1, read_db=lambda _: np.array([float(state["i"])])), "LAF")
+        r.add_column("LZeq", types.SimpleNamespace(width=2, read_db=lambda _: np.array([1.0, 2.0]) * state["i"]),
+                     "LZeq", center_frequencies=["63", "125"])
+        for i in range(n):
+            state["i"] = i
+            r.record(_td(0.1 * i), dt=0.1)
+        return r
+
+    def test_grows_past_initial_capacity(self):
+        n = 3 * Reporter._INITIAL_ROWS + 5
+        r = self._reporter(n)
+        assert r.rows == n
+        np.testing.assert_array_equal(r.broadband("LAF"), np.arange(n))
+        np.testing.assert_array_equal(r.band("LZeq")[:, 1], 2.0 * np.arange(n))
+
+    def test_timestamps_are_timedelta64(self):
+        r = self._reporter(3)
+        ts = r.timestamps()
+        assert ts.dtype == np.dtype("timedelta64[us]")
+        assert ts[2] == np.timedelta64(200_000, "us")
+        assert r._broadband_rows[2]["timestamp"] == _td(0.2)
+
+    def test_views_are_read_only(self):
+        r = self._reporter(3)
+        with pytest.raises(ValueError):
+            r.broadband("LAF")[0] = 1.0
+        with pytest.raises(ValueError):
+            r.band("LZeq")[0, 0] = 1.0
+
+    def test_memory_close_to_8_bytes_per_value(self):
+        r = self._reporter(10_000)
+        stored = r._timestamps.nbytes + sum(a.nbytes for a in r._broadband_data.values()) \
+            + sum(a.nbytes for a in r._band_data.values())
+        assert stored <= 2 * 8 * 4 * r.rows   # 4 values per row, at most 2x headroom
+
+    def test_column_added_late_reads_nan(self):
+        r = Reporter()
+        r.add_column("LAF", _plugin(1, np.array([94.0])), "LAF")
+        r.record(_td(1.0), dt=1.0)
+        r.add_column("LCF", _plugin(1, np.array([90.0])), "LCF")
+        r.record(_td(2.0), dt=1.0)
+        np.testing.assert_array_equal(r.broadband("LCF"), [np.nan, 90.0])
+
+    def test_empty_reporter_is_truthy(self):
+        assert Reporter()
+        assert Reporter().rows == 0
+
+
 # ---------------------------------------------------------------------------
 # write() — broadband CSVs
 # ---------------------------------------------------------------------------
@@ -290,6 +347,44 @@ class TestWriteRTA:
         assert not (base.parent / (base.name + "_rta_report.csv")).exists()
 
 
+# ---------------------------------------------------------------------------
+# write() — vectorised formatting
+# ---------------------------------------------------------------------------
+
+class TestWriteFormatting:
+
+    @pytest.mark.parametrize("precision", [0, 1, 2, 3])
+    def test_matches_per_cell_csv_writer(self, tmp_path, precision):
+        rng = np.random.default_rng(precision)
+        n = 5000   # more than one formatting chunk
+        values = rng.normal(50.0, 30.0, (n, 4))
+        # Rounding ties, negative values rounding to zero, non-finite and huge values
+        values[::97, 1] = np.resize([0.125, 2.675, -0.004, -0.0, np.nan, np.inf, -np.inf, 1e20,
+                                     99.995, 0.5, -2.5, 1.005], len(values[::97]))
+        timestamps = [timedelta(microseconds=int(i * 333_333.5)) for i in range(n - 1)] + [_td(400_000.25)]
+        state = {"i": 0}
+        r = Reporter(precision=precision)
+        r.add_column("LAeq", types.SimpleNamespace(width=1, read_db=lambda _: values[state["i"], :1]), "LAeq")
+        r.add_column("LZeq", types.SimpleNamespace(width=3, read_db=lambda _: values[state["i"], 1:]), "LZeq",
+                     center_frequencies=["63", "125", "250"])
+        for i, ts in enumerate(timestamps):
+            state["i"] = i
+            r.record(ts, dt=0.0)
+        r.write(tmp_path / "m")
+
+        fmt = f"{{:.{precision}f}}"
+        expected = io.StringIO(newline="")
+        writer = csv.writer(expected)
+        writer.writerow(["timestamp", "LZeq_63", "LZeq_125", "LZeq_250"])
+        for ts, row in zip(timestamps, values):
+            writer.writerow([_fmt_timestamp(ts)] + [fmt.format(v) for v in row[1:]])
+        assert (tmp_path / "m_rta_log.csv").read_bytes() == expected.getvalue().encode()
+
+        lines = (tmp_path / "m_log.csv").read_bytes().split(b"\r\n")
+        assert lines[-2] == f"{_fmt_timestamp(timestamps[-1])},{fmt.format(values[-1, 0])}".encode()
+        assert (tmp_path / "m_report.csv").read_bytes() == f"LAeq\r\n{fmt.format(values[-1, 0])}\r\n".encode()
+
+
 # ---------------------------------------------------------------------------
 # Console printing
 # ---------------------------------------------------------------------------
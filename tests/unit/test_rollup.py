@@ -0,0 +1,215 @@
+"""Unit tests for slm/io/rollup.py."""
+import csv
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from slm.app.config import SLMConfig
+from slm.io.reporter import Reporter
+from slm.io.rollup import parse_resolution, resolution_name
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+class _Source:
+    """PluginMeter stub whose read_db returns whatever *value* is set to."""
+
+    def __init__(self, width: int = 1):
+        self.width = width
+        self.value = np.zeros(width)
+
+    def read_db(self, name):
+        return np.array(self.value, dtype=float).reshape(self.width)
+
+
+def _reporter(aggregates=("energy", "exposure", "max", "min")):
+    r = Reporter(precision=2)
+    sources = {}
+    for kind in aggregates:
+        sources[kind] = _Source()
+        r.add_column(f"L_{kind}", sources[kind], "m", aggregate=kind)
+    return r, sources
+
+
+def _run(r: Reporter, sources: dict, levels: list[float], dt: float = 1.0) -> None:
+    for k, level in enumerate(levels, start=1):
+        for source in sources.values():
+            source.value = np.array([level])
+        r.record(timedelta(seconds=k * dt), dt=dt)
+
+
+def _leq(levels) -> float:
+    return 10 * np.log10(np.mean(10 ** (np.asarray(levels) / 10)))
+
+
+# ---------------------------------------------------------------------------
+# Resolution names
+# ---------------------------------------------------------------------------
+
+class TestResolution:
+
+    @pytest.mark.parametrize("seconds, name", [(1, "1s"), (60, "1m"), (900, "15m"),
+                                               (3600, "1h"), (86400, "1d"), (0.5, "0.5s")])
+    def test_name(self, seconds, name):
+        assert resolution_name(seconds) == name
+
+    @pytest.mark.parametrize("name, seconds", [("10s", 10), ("15m", 900), ("1h", 3600),
+                                               ("1d", 86400), ("1.5m", 90)])
+    def test_parse(self, name, seconds):
+        assert parse_resolution(name) == seconds
+
+    @pytest.mark.parametrize("name", ["", "15", "m", "15x", "0m"])
+    def test_parse_invalid_raises(self, name):
+        with pytest.raises(ValueError):
+            parse_resolution(name)
+
+
+# ---------------------------------------------------------------------------
+# Aggregation
+# ---------------------------------------------------------------------------
+
+class TestAggregation:
+
+    def test_combines_each_period(self):
+        r, sources = _reporter()
+        rollup = r.add_rollup(3)
+        levels = [60.0, 70.0, 80.0, 50.0, 50.0, 50.0]
+        _run(r, sources, levels)
+        r.finish()
+        assert rollup.rows == 2
+        assert rollup.timestamps().tolist() == [timedelta(seconds=3), timedelta(seconds=6)]
+        np.testing.assert_allclose(rollup.broadband("L_energy"), [_leq(levels[:3]), 50.0])
+        np.testing.assert_allclose(rollup.broadband("L_exposure"),
+                                   [_leq(levels[:3]) + 10 * np.log10(3), 50.0 + 10 * np.log10(3)])
+        np.testing.assert_array_equal(rollup.broadband("L_max"), [80.0, 50.0])
+        np.testing.assert_array_equal(rollup.broadband("L_min"), [60.0, 50.0])
+
+    def test_period_emitted_when_next_one_starts(self):
+        r, sources = _reporter(["energy"])
+        rollup = r.add_rollup(2)
+        _run(r, sources, [60.0, 60.0])
+        assert rollup.rows == 0
+        _run(r, sources, [60.0, 60.0, 60.0])
+        assert rollup.rows == 1
+
+    def test_finish_emits_partial_period(self):
+        r, sources = _reporter(["energy"])
+        rollup = r.add_rollup(60)
+        _run(r, sources, [70.0] * 5)
+        r.finish()
+        assert rollup.rows == 1
+        assert rollup.timestamps()[0] == np.timedelta64(5, "s")
+        np.testing.assert_allclose(rollup.broadband("L_energy"), [70.0])
+
+    def test_energy_weighted_by_interval_length(self):
+        r, sources = _reporter(["energy"])
+        rollup = r.add_rollup(10)
+        sources["energy"].value = np.array([80.0])
+        r.record(timedelta(seconds=1), dt=1.0)     # covers (0, 1]
+        sources["energy"].value = np.array([60.0])
+        r.record(timedelta(seconds=4), dt=1.0)     # covers (1, 4]
+        r.finish()
+        expected = 10 * np.log10((10 ** 8 * 1 + 10 ** 6 * 3) / 4)
+        np.testing.assert_allclose(rollup.broadband("L_energy"), [expected])
+
+    def test_zero_length_row_skipped(self):
+        r, sources = _reporter(["energy", "max"])
+        rollup = r.add_rollup(2)
+        sources["max"].value = np.array([99.0])
+        r.record(timedelta(0), dt=1.0)
+        _run(r, sources, [60.0, 60.0])
+        r.finish()
+        assert rollup.rows == 1
+        np.testing.assert_allclose(rollup.broadband("L_max"), [60.0])
+
+    def test_band_columns(self):
+        r = Reporter()
+        source = _Source(width=3)
+        r.add_column("Leq:bands", source, "m", center_frequencies=[500, 1000, 2000],
+                     aggregate="energy")
+        rollup = r.add_rollup(2)
+        for k, values in enumerate([[60, 70, 80], [60, 50, 80]], start=1):
+            source.value = np.array(values, dtype=float)
+            r.record(timedelta(seconds=k), dt=1.0)
+        r.finish()
+        assert rollup.band("Leq:bands").shape == (1, 3)
+        np.testing.assert_allclose(rollup.band("Leq:bands")[0],
+                                   [60.0, _leq([70, 50]), 80.0])
+
+    def test_unaggregated_columns_ignored(self):
+        r, sources = _reporter(["energy"])
+        r.add_column("LAF", _Source(), "LAF")
+        rollup = r.add_rollup(2)
+        _run(r, sources, [60.0, 60.0])
+        r.finish()
+        assert list(rollup._broadband_data) == ["L_energy"]
+
+    def test_several_resolutions(self):
+        r, sources = _reporter(["max"])
+        minute, ten = r.add_rollup(60), r.add_rollup(600)
+        _run(r, sources, [float(k % 97) for k in range(1200)])
+        r.finish()
+        assert (minute.rows, ten.rows) == (20, 2)
+        np.testing.assert_array_equal(ten.broadband("L_max"), [96.0, 96.0])
+        assert r.rollups == [minute, ten]
+
+    def test_invalid_aggregate_raises(self):
+        with pytest.raises(ValueError, match="aggregate"):
+            Reporter().add_column("L", _Source(), "m", aggregate="mean")
+
+
+# ---------------------------------------------------------------------------
+# Wall-clock alignment and memory
+# ---------------------------------------------------------------------------
+
+class TestAlignment:
+
+    def test_periods_follow_wall_clock(self):
+        r, sources = _reporter(["energy"])
+        # Start 10:07:00 → 15-minute periods end at 10:15, 10:30
+        rollup = r.add_rollup(900, start=datetime(2026, 3, 1, 10, 7))
+        _run(r, sources, [60.0] * 30, dt=60.0)
+        r.finish()
+        ends = [t // np.timedelta64(1, "m") for t in rollup.timestamps()]
+        assert ends == [8, 23, 30]
+
+    def test_retain_rows(self):
+        r, sources = _reporter(["energy"])
+        rollup = r.add_rollup(1, retain_rows=2)
+        _run(r, sources, [60.0] * 5000)
+        r.finish()
+        assert rollup._capacity == Reporter._INITIAL_ROWS
+        assert rollup.timestamps()[-1] == np.timedelta64(5000, "s")
+
+
+# ---------------------------------------------------------------------------
+# Output files and configuration
+# ---------------------------------------------------------------------------
+
+class TestRollupOutput:
+
+    def test_write_includes_rollups(self, tmp_path):
+        r, sources = _reporter(["energy", "max"])
+        r.add_rollup(2)
+        _run(r, sources, [60.0, 70.0, 80.0])
+        r.write(tmp_path / "m")
+        with open(tmp_path / "m_2s_log.csv", newline="") as f:
+            rows = list(csv.reader(f))
+        assert rows[0] == ["timestamp", "L_energy", "L_max"]
+        assert rows[1] == ["00:00:02.000", f"{_leq([60, 70]):.2f}", "70.00"]
+        assert rows[2] == ["00:00:03.000", "80.00", "80.00"]
+        assert (tmp_path / "m_2s_report.csv").exists()
+
+    def test_config_round_trip(self, tmp_path):
+        toml_path = tmp_path / "c.toml"
+        SLMConfig(metrics=["LAeq_dt"], rollups=["15m", "1h"]).to_toml(toml_path)
+        assert SLMConfig.from_toml(toml_path).rollups == ["15m", "1h"]
+
+    def test_config_invalid_rollups_raise(self, tmp_path):
+        toml_path = tmp_path / "c.toml"
+        toml_path.write_text('[measurement]\nrollups = ["15 minutes"]\n', encoding="utf-8")
+        with pytest.raises(ValueError, match="rollups"):
+            SLMConfig.from_toml(toml_path)
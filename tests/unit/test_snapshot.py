@@ -0,0 +1,94 @@
+"""Unit tests for slm/snapshot.py — double-buffered meter snapshots."""
+import threading
+from datetime import timedelta
+
+import numpy as np
+import pytest
+
+from slm.assembly import build_chain, parse_metric
+from slm.engine import Engine
+from slm.io.reporter import Reporter
+from slm.io.synthetic_controller import SyntheticController, WhiteNoise
+from slm.snapshot import MeterSnapshots
+
+SAMPLERATE = 48_000
+BLOCKSIZE = 480
+
+
+def _engine(seconds: float = 1.0, metrics=("LZeq", "LZE", "LAFmax", "LZeq:bands:250-2000")):
+    ctrl = SyntheticController(WhiteNoise(rms=0.2), samplerate=SAMPLERATE, blocksize=BLOCKSIZE,
+                               duration=seconds, seed=3)
+    engine = Engine(ctrl, dt=0.1, reporter=Reporter())
+    build_chain([parse_metric(m) for m in metrics], engine)
+    return engine
+
+
+def _meter(engine: Engine, label: str):
+    return next((plugin, name) for lbl, plugin, name in engine.reporter._broadband_columns if lbl == label)
+
+
+class TestSnapshots:
+
+    def test_matches_meters_after_run(self):
+        engine = _engine()
+        snapshots = MeterSnapshots(engine)
+        view = snapshots.reader()
+        engine.run()
+        assert view.update()
+        assert view.timestamp == timedelta(seconds=1)
+        assert snapshots.sequence == SAMPLERATE // BLOCKSIZE
+        for label in ("LZeq", "LZE", "LAFmax"):
+            plugin, name = _meter(engine, label)
+            np.testing.assert_array_equal(view.read_lin(plugin, name), plugin.read_lin(name))
+            np.testing.assert_allclose(view.read_db(plugin, name), plugin.read_db(name))
+            np.testing.assert_allclose(view.column(label), [engine.reporter.broadband(label)[-1]])
+        np.testing.assert_allclose(view.column("LZeq:bands:250-2000"),
+                                   engine.reporter.band("LZeq:bands:250-2000")[-1])
+
+    def test_update_without_new_snapshot(self):
+        engine = _engine()
+        view = MeterSnapshots(engine).reader()
+        assert not view.update()
+        assert np.isnan(view.column("LZeq")).all()
+        engine.run()
+        assert view.update()
+        assert not view.update()
+
+    def test_views_are_read_only_and_reused(self):
+        engine = _engine()
+        view = MeterSnapshots(engine).reader()
+        engine.run()
+        view.update()
+        level = view.column("LZeq")
+        with pytest.raises(ValueError):
+            level[0] = 0.0
+        assert np.shares_memory(level, view.column("LZeq"))
+
+    def test_interval(self):
+        engine = _engine()
+        snapshots = MeterSnapshots(engine, interval=0.25)
+        engine.run()
+        # after the first block, then every 0.25 s of input
+        assert snapshots.sequence == 4
+
+    def test_concurrent_reader_sees_one_block(self):
+        engine = _engine(seconds=5.0)
+        snapshots = MeterSnapshots(engine)
+        (eq_plugin, eq), (e_plugin, e) = _meter(engine, "LZeq"), _meter(engine, "LZE")
+        thread = threading.Thread(target=engine.run)
+        view = snapshots.reader()
+        checked = 0
+        thread.start()
+        while True:
+            running = thread.is_alive()
+            if view.update():
+                # LE = Leq·T holds only if both meters and the time come from the same block
+                seconds = view.timestamp.total_seconds()
+                ratio = view.read_lin(e_plugin, e)[0] / view.read_lin(eq_plugin, eq)[0]
+                assert ratio == pytest.approx(seconds, rel=1e-9)
+                checked += 1
+            elif not running:
+                break
+        thread.join()
+        assert checked > 0
+        assert view.sequence == snapshots.sequence
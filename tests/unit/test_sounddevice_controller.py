@@ -4,6 +4,7 @@ from __future__ import annotations
 import queue
 import threading
 import time
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import numpy as np
@@ -154,13 +155,14 @@ class TestReadBlock:
                 ctrl.read_block()
 
     def test_callback_copies_buffer(self):
-        """Each block stored in the queue must be an independent copy."""
+        """Samples stored in the ring buffer must be independent of the callback buffer."""
         ctrl = _make_controller(blocksize=64, queue_maxsize=16)
         original = np.ones((64, 1), dtype=np.float32)
         ctrl._callback(original, 64, None, None)
-        # Mutate the original — the queued block must be unaffected
+        # Mutate the original — the buffered block must be unaffected
         original[:] = 0.0
-        queued = ctrl._queue.get_nowait()
+        ctrl.stop()
+        queued, _ = ctrl.read_block()
         assert np.all(queued == 1.0)
 
     def test_overrun_on_full_queue(self):
@@ -183,6 +185,80 @@ class TestReadBlock:
         ctrl._callback(block, 64, None, status)
         assert ctrl.overruns == 1
 
+    def test_input_overflow_logged_with_unknown_size(self):
+        ctrl = _make_controller(blocksize=64, queue_maxsize=8)
+        block = np.zeros((64, 1), dtype=np.float32)
+        status = MagicMock()
+        status.__bool__ = lambda s: True
+        ctrl._callback(block, 64, SimpleNamespace(inputBufferAdcTime=7.5), status)
+        assert ctrl.lost_events == [(7.5, None)]
+        assert ctrl.lost_samples == 0
+
+
+class TestCapture:
+
+    def test_tee_to_wav(self, tmp_path):
+        import soundfile as sf
+        from slm.io.capture import CaptureWriter
+
+        writer = CaptureWriter(tmp_path / "live.wav", 48_000, channels=2)
+        ctrl = _make_controller(blocksize=256, channels=2, queue_maxsize=16, capture=writer)
+        fake = _FakeStream(ctrl._callback, 12, 256, 2, on_done=ctrl.stop)
+        with patch("slm.io.sounddevice_controller.sd.InputStream", return_value=fake):
+            ctrl.start()
+            blocks = []
+            with pytest.raises(StopIteration):
+                while True:
+                    blocks.append(ctrl.read_block()[0].copy())
+        assert not writer.closed      # the owner closes it
+        writer.close()
+        captured, _ = sf.read(str(tmp_path / "live.wav"), dtype="float32")
+        np.testing.assert_array_equal(captured, np.concatenate(blocks))
+        assert len(captured) == 12 * 256
+
+    def test_capture_error_ends_reading_normally(self, tmp_path):
+        from slm.io.capture import CaptureWriter
+
+        with patch.object(CaptureWriter, "_write_buffer", side_effect=OSError(28, "No space left on device")):
+            writer = CaptureWriter(tmp_path / "live.wav", 48_000, channels=2)
+        ctrl = _make_controller(blocksize=256, channels=2, queue_maxsize=16, capture=writer)
+        fake = _FakeStream(ctrl._callback, 4, 256, 2, on_done=ctrl.stop)
+        with patch("slm.io.sounddevice_controller.sd.InputStream", return_value=fake):
+            ctrl.start()
+            with pytest.raises(StopIteration):
+                while True:
+                    ctrl.read_block()
+            with pytest.raises(OSError, match="No space left"):
+                writer.close()
+
+
+class TestRingBuffer:
+
+    def test_capacity_from_buffer_seconds(self):
+        ctrl = _make_controller(samplerate=48_000, blocksize=1_024, buffer_seconds=0.5)
+        assert ctrl.buffer_stats["capacity"] == 24_000
+
+    def test_callback_frames_independent_of_blocksize(self):
+        """Callbacks of any size are re-sliced into engine blocks."""
+        ctrl = _make_controller(blocksize=64, channels=2)
+        data = np.arange(300, dtype=np.float32).reshape(150, 2)
+        ctrl._callback(data[:100], 100, None, None)
+        ctrl._callback(data[100:], 50, None, None)
+        first, _ = ctrl.read_block()
+        np.testing.assert_array_equal(first, data[:64])
+        second, _ = ctrl.read_block()
+        np.testing.assert_array_equal(second, data[64:128])
+        assert ctrl.buffer_stats["available"] == 22
+
+    def test_lost_samples_and_timestamps(self):
+        ctrl = _make_controller(blocksize=64, queue_maxsize=2)
+        block = np.zeros((48, 1), dtype=np.float32)
+        for t in (1.0, 2.0, 3.0):
+            ctrl._callback(block, 48, SimpleNamespace(inputBufferAdcTime=t), None)
+        assert ctrl.lost_samples == 3 * 48 - 128
+        assert ctrl.lost_events == [(3.0, 16)]
+        assert ctrl.buffer_stats["high_watermark"] == 128
+
 
 class TestListDevices:
 
@@ -252,4 +328,40 @@ class TestEngineIntegration:
         assert len(reporter._broadband_rows) >= 1
         # The final LAeq value should be a finite number
         last = reporter._broadband_rows[-1]["LAeq"]
-        assert np.isfinite(last)
\ No newline at end of file
+        assert np.isfinite(last)
+
+
+class TestRunRealtimeMeasurement:
+
+    def _config(self, tmp_path):
+        from slm.app.config import SLMConfig
+        return SLMConfig(metrics=["LAeq"], dt=1.0, output=str(tmp_path / "live"))
+
+    def test_capture_error_is_reported_and_logs_closed(self, tmp_path, capsys):
+        from slm.app import cli
+        from slm.io.capture import CaptureWriter
+
+        original_close = CaptureWriter.close
+
+        def failing_close(self):
+            original_close(self)
+            raise OSError(28, "No space left on device")
+
+        with patch("slm.io.sounddevice_controller.sd.InputStream", return_value=MagicMock()), \
+                patch("slm.engine.Engine.run", side_effect=KeyboardInterrupt), \
+                patch.object(CaptureWriter, "close", failing_close), \
+                patch("slm.app.cli._finish_logs", wraps=cli._finish_logs) as finish:
+            cli.run_realtime_measurement(1.0, self._config(tmp_path), capture=str(tmp_path / "a.wav"))
+        assert "No space left on device" in capsys.readouterr().out
+        finish.assert_called_once()
+
+    def test_setup_error_never_starts_stream(self, tmp_path):
+        from slm.app import cli
+
+        with patch("slm.io.sounddevice_controller.sd.InputStream") as stream, \
+                patch("slm.app.cli._live_server", side_effect=OSError("address in use")):
+            with pytest.raises(OSError, match="address in use"):
+                cli.run_realtime_measurement(1.0, self._config(tmp_path),
+                                             capture=str(tmp_path / "a.wav"), serve="127.0.0.1:0")
+        stream.assert_not_called()
+        assert not any(t.name == "slm-capture" for t in threading.enumerate())
@@ -0,0 +1,117 @@
+"""Startup guards for ``slm --help`` and ``slm --list-devices``.
+
+Both entry points must stay instant: they may not import the DSP stack
+(scipy, numba, pyoctaveband).  Each check runs in a fresh interpreter so the
+test session's own imports do not mask a regression.
+"""
+from __future__ import annotations
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+import slm
+
+SRC_DIR = Path(slm.__file__).resolve().parents[1]
+HEAVY = ("scipy", "numba", "pyoctaveband", "soundfile")
+
+# Runs slm's CLI entry point in-process and reports which heavy modules got loaded.
+_PROBE = """
+import json, sys, types
+argv = {argv!r}
+if "--list-devices" in argv:
+    # Stand-in for sounddevice so the check does not depend on PortAudio.
+    sys.modules["sounddevice"] = types.SimpleNamespace(query_devices=lambda: [])
+sys.argv = ["slm", *argv]
+from slm.app.__main__ import main
+try:
+    main()
+except SystemExit:
+    pass
+print(json.dumps(sorted(m for m in {heavy!r} if m in sys.modules)), file=sys.stderr)
+"""
+
+
+def _env() -> dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC_DIR), env.get("PYTHONPATH")]))
+    return env
+
+
+def _heavy_modules_loaded(*argv: str) -> list[str]:
+    proc = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(argv=list(argv), heavy=HEAVY)],
+        env=_env(), capture_output=True, text=True, check=True,
+    )
+    return json.loads(proc.stderr.strip().splitlines()[-1])
+
+
+class TestLazyImports:
+
+    def test_help_imports_no_dsp_stack(self):
+        assert _heavy_modules_loaded("--help") == []
+
+    def test_list_devices_imports_no_dsp_stack(self):
+        assert _heavy_modules_loaded("--list-devices") == []
+
+    def test_package_import_is_lazy(self):
+        proc = subprocess.run(
+            [sys.executable, "-c",
+             "import sys, slm, slm.io; "
+             f"print(sorted(m for m in {HEAVY!r} + ('numpy',) if m in sys.modules))"],
+            env=_env(), capture_output=True, text=True, check=True,
+        )
+        assert proc.stdout.strip() == "[]"
+
+    def test_lazy_attributes_resolve(self):
+        from slm import Engine, build_chain
+        from slm.io import FileController, Reporter
+        from slm.time_weighting import asymmetric_time_weighting
+        assert callable(build_chain) and callable(asymmetric_time_weighting)
+        assert Engine.__module__ == "slm.engine"
+        assert FileController.__module__ == "slm.io.file_controller"
+        assert Reporter.__module__ == "slm.io.reporter"
+
+    def test_unknown_attribute_raises(self):
+        with pytest.raises(AttributeError):
+            slm.does_not_exist
+
+
+# ``python -m slm --list-devices`` with the same sounddevice stand-in as _PROBE.
+_LIST_DEVICES = """
+import sys, types
+sys.modules["sounddevice"] = types.SimpleNamespace(query_devices=lambda: [])
+sys.argv = ["slm", "--list-devices"]
+from slm.app.__main__ import main
+main()
+"""
+
+
+@pytest.mark.slow
+class TestStartupLatency:
+    """Wall-clock budget for the instant entry points (median of several runs)."""
+
+    BUDGET_S = 0.5
+
+    @staticmethod
+    def _median_runtime(*cmd: str) -> tuple[float, list[float]]:
+        timings = []
+        for _ in range(5):
+            t0 = time.perf_counter()
+            subprocess.run([sys.executable, *cmd], env=_env(), capture_output=True, check=True)
+            timings.append(time.perf_counter() - t0)
+        return statistics.median(timings), timings
+
+    def test_help_latency(self):
+        median, timings = self._median_runtime("-m", "slm", "--help")
+        assert median < self.BUDGET_S, timings
+
+    def test_list_devices_latency(self):
+        median, timings = self._median_runtime("-c", _LIST_DEVICES)
+        assert median < self.BUDGET_S, timings
@@ -0,0 +1,200 @@
+"""Unit tests for slm/io/stream_controller.py and slm/io/pcm.py — raw PCM from pipes and sockets."""
+from __future__ import annotations
+
+import os
+import socket
+import threading
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from slm.io.pcm import SAMPLE_FORMATS, sample_format
+from slm.io.stream_controller import StreamController
+
+SAMPLERATE = 48_000
+BLOCKSIZE = 256
+
+_SF_SUBTYPES = {
+    "U8": "PCM_U8", "S16_LE": "PCM_16", "S24_3LE": "PCM_24", "S32_LE": "PCM_32",
+    "FLOAT_LE": "FLOAT", "FLOAT64_LE": "DOUBLE",
+}
+
+
+def _raw(frames: int, channels: int = 2, fmt: str = "S16_LE", tmp_path=None) -> tuple[bytes, np.ndarray]:
+    """Return raw PCM bytes of a noise signal and the samples libsndfile decodes from them."""
+    rng = np.random.default_rng(0)
+    x = rng.uniform(-0.9, 0.9, (frames, channels))
+    path = tmp_path / f"x_{fmt}.raw"
+    sf.write(str(path), x, SAMPLERATE, format="RAW", subtype=_SF_SUBTYPES[fmt], endian="LITTLE")
+    expected, _ = sf.read(str(path), samplerate=SAMPLERATE, channels=channels, format="RAW",
+                          subtype=_SF_SUBTYPES[fmt], endian="LITTLE", always_2d=True)
+    return path.read_bytes(), expected
+
+
+def _read_all(controller) -> np.ndarray:
+    blocks = []
+    while True:
+        try:
+            block, _ = controller.read_block()
+        except StopIteration:
+            return np.concatenate(blocks) if blocks else np.zeros((0, controller.channels))
+        blocks.append(block.copy())
+
+
+def _send_in_pieces(sock: socket.socket, data: bytes, piece: int = 777) -> threading.Thread:
+    def run():
+        with sock:
+            for i in range(0, len(data), piece):
+                sock.sendall(data[i:i + piece])
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    return thread
+
+
+class TestSampleFormat:
+
+    def test_aliases(self):
+        assert sample_format("s24le") is SAMPLE_FORMATS["S24_3LE"]
+        assert sample_format("float_le") is SAMPLE_FORMATS["FLOAT_LE"]
+
+    def test_unknown_raises(self):
+        with pytest.raises(ValueError, match="S16_LE"):
+            sample_format("mp3")
+
+    @pytest.mark.parametrize("fmt", list(SAMPLE_FORMATS))
+    def test_to_float_matches_libsndfile(self, tmp_path, fmt):
+        data, expected = _raw(300, fmt=fmt, tmp_path=tmp_path)
+        f = sample_format(fmt)
+        out = np.empty((300, 2))
+        f.to_float(f.frombuffer(data, 300, 2), out)
+        np.testing.assert_array_equal(out, expected)
+
+
+class TestStreamController:
+
+    @pytest.mark.parametrize("fmt", ["S16_LE", "S24_3LE", "FLOAT_LE"])
+    def test_socketpair_in_odd_pieces(self, tmp_path, fmt):
+        data, expected = _raw(5000, fmt=fmt, tmp_path=tmp_path)
+        rx, tx = socket.socketpair()
+        _send_in_pieces(tx, data)
+        ctrl = StreamController(rx, samplerate=SAMPLERATE, channels=2, sample_format=fmt,
+                                blocksize=BLOCKSIZE, chunk_seconds=0.01)
+        got = _read_all(ctrl)
+        assert got.shape == (20 * BLOCKSIZE, 2)
+        np.testing.assert_array_equal(got[:5000], expected)
+        np.testing.assert_array_equal(got[5000:], 0.0)
+        assert ctrl.bytes_read == len(data)
+
+    def test_trailing_partial_frame_dropped(self, tmp_path):
+        data, expected = _raw(BLOCKSIZE, fmt="S16_LE", tmp_path=tmp_path)
+        rx, tx = socket.socketpair()
+        _send_in_pieces(tx, data + b"\x01")
+        ctrl = StreamController(rx, samplerate=SAMPLERATE, channels=2, blocksize=BLOCKSIZE)
+        np.testing.assert_array_equal(_read_all(ctrl), expected)
+
+    def test_tcp_connect(self, tmp_path):
+        data, expected = _raw(3000, fmt="S16_LE", tmp_path=tmp_path)
+        server = socket.create_server(("127.0.0.1", 0))
+        port = server.getsockname()[1]
+
+        def serve():
+            conn, _ = server.accept()
+            server.close()
+            _send_in_pieces(conn, data).join()
+
+        threading.Thread(target=serve, daemon=True).start()
+        ctrl = StreamController(f"tcp://127.0.0.1:{port}", samplerate=SAMPLERATE, channels=2,
+                                blocksize=BLOCKSIZE, connect_timeout=5)
+        np.testing.assert_array_equal(_read_all(ctrl)[:3000], expected)
+
+    @pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets not available")
+    def test_unix_listen(self, tmp_path):
+        data, expected = _raw(3000, fmt="S24_3LE", tmp_path=tmp_path)
+        path = str(tmp_path / "slm.sock")
+
+        def connect():
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            while True:
+                try:
+                    sock.connect(path)
+                    break
+                except (FileNotFoundError, ConnectionRefusedError):
+                    threading.Event().wait(0.01)
+            _send_in_pieces(sock, data).join()
+
+        threading.Thread(target=connect, daemon=True).start()
+        ctrl = StreamController(f"unix-listen://{path}", samplerate=SAMPLERATE, channels=2,
+                                sample_format="S24_3LE", blocksize=BLOCKSIZE, connect_timeout=5)
+        np.testing.assert_array_equal(_read_all(ctrl)[:3000], expected)
+        assert not os.path.exists(path)
+
+    @pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="named pipes not available")
+    def test_fifo(self, tmp_path):
+        data, expected = _raw(3000, channels=1, fmt="S16_LE", tmp_path=tmp_path)
+        fifo = tmp_path / "audio.fifo"
+        os.mkfifo(fifo)
+
+        def write():
+            with open(fifo, "wb") as f:
+                f.write(data)
+
+        threading.Thread(target=write, daemon=True).start()
+        ctrl = StreamController(fifo, samplerate=SAMPLERATE, channels=1, blocksize=BLOCKSIZE)
+        np.testing.assert_array_equal(_read_all(ctrl)[:3000], expected)
+
+    def test_backpressure_stalls_producer(self):
+        """A consumer that stops reading must block the sender, not buffer without bound."""
+        rx, tx = socket.socketpair()
+        tx.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4096)
+        rx.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+        total = 8 * 1024 * 1024
+        sent = 0
+
+        def produce():
+            nonlocal sent
+            chunk = bytes(8192)
+            with tx:
+                while sent < total:
+                    sent += tx.send(chunk[:total - sent])
+
+        thread = threading.Thread(target=produce, daemon=True)
+        thread.start()
+        ctrl = StreamController(rx, samplerate=SAMPLERATE, channels=1, blocksize=BLOCKSIZE,
+                                chunk_seconds=0.1)
+        for _ in range(10):
+            ctrl.read_block()
+        thread.join(timeout=0.5)
+        assert thread.is_alive()                       # producer is blocked by flow control
+        assert ctrl.bytes_read <= len(ctrl._raw)        # never more than one chunk buffered
+        assert sent < total
+
+        n = len(_read_all(ctrl)) + 10 * BLOCKSIZE
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+        assert n * 2 == total
+
+    def test_stop_closes_source(self):
+        rx, tx = socket.socketpair()
+        ctrl = StreamController(rx, samplerate=SAMPLERATE, blocksize=BLOCKSIZE)
+        ctrl.stop()
+        assert rx.fileno() == -1
+        with pytest.raises(StopIteration):
+            ctrl.read_block()
+        tx.close()
+
+
+class TestRunStreamMeasurement:
+
+    def test_writes_report(self, tmp_path):
+        from slm.app.cli import run_stream_measurement
+        from slm.app.config import SLMConfig
+
+        t = np.arange(SAMPLERATE) / SAMPLERATE
+        pcm16 = (0.5 * np.sin(2 * np.pi * 1000.0 * t) * 32767).astype("<i2")
+        rx, tx = socket.socketpair()
+        _send_in_pieces(tx, pcm16.tobytes(), piece=4096)
+        config = SLMConfig.from_args(metrics=["LZeq"], dt=0.5, output=str(tmp_path / "m"))
+        run_stream_measurement(rx, 1.0, config, samplerate=SAMPLERATE, blocksize=BLOCKSIZE)
+        assert (tmp_path / "m_report.csv").exists()
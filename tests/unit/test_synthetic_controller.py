@@ -0,0 +1,147 @@
+"""Unit tests for slm/io/synthetic_controller.py — block-wise synthetic signals."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from scipy.signal import chirp, welch
+
+from slm.io.synthetic_controller import (
+    PinkNoise, Sine, Sweep, SyntheticController, ToneBurst, WhiteNoise,
+)
+
+SAMPLERATE = 48_000
+
+
+def _read_all(controller) -> np.ndarray:
+    blocks = []
+    while True:
+        try:
+            block, _ = controller.read_block()
+        except StopIteration:
+            return np.concatenate(blocks)
+        blocks.append(block.copy())
+
+
+def _render(signal, seconds: float = 1.0, blocksize: int = 1000, **kwargs) -> np.ndarray:
+    ctrl = SyntheticController(signal, samplerate=SAMPLERATE, blocksize=blocksize,
+                               duration=seconds, **kwargs)
+    return _read_all(ctrl)[:round(seconds * SAMPLERATE), 0]
+
+
+class TestSignals:
+
+    def test_sine_matches_closed_form(self):
+        t = np.arange(SAMPLERATE) / SAMPLERATE
+        np.testing.assert_allclose(_render(Sine(997.0, 0.5, phase=0.3), blocksize=333),
+                                   0.5 * np.sin(2 * np.pi * 997.0 * t + 0.3), atol=1e-9)
+
+    def test_sine_phase_continuous_at_late_start(self):
+        """Phase is derived from the absolute sample index, so hour offsets stay exact."""
+        sine = Sine(1000.0)
+        sine.bind(SAMPLERATE, 48, np.random.default_rng())
+        out = np.empty(48)
+        sine.render(10 * 3600 * SAMPLERATE, out)   # ten hours in: a whole number of cycles
+        np.testing.assert_allclose(out, np.sin(2 * np.pi * 1000.0 * np.arange(48) / SAMPLERATE),
+                                   atol=1e-9)
+
+    def test_tone_burst_gating(self):
+        x = _render(ToneBurst(4000.0, burst=0.01, period=0.1), seconds=0.3, blocksize=1024)
+        burst = round(0.01 * SAMPLERATE)
+        period = round(0.1 * SAMPLERATE)
+        t = np.arange(burst) / SAMPLERATE
+        for k in range(3):
+            np.testing.assert_allclose(x[k * period:k * period + burst],
+                                       np.sin(2 * np.pi * 4000.0 * t), atol=1e-9)
+            assert not x[k * period + burst:(k + 1) * period].any()
+
+    def test_single_burst(self):
+        x = _render(ToneBurst(1000.0, burst=0.05), seconds=0.5)
+        assert x[:2400].any()
+        assert not x[2400:].any()
+
+    @pytest.mark.parametrize("method,scipy_method", [("log", "logarithmic"), ("linear", "linear")])
+    def test_sweep_matches_scipy_chirp(self, method, scipy_method):
+        t = np.arange(SAMPLERATE) / SAMPLERATE
+        expected = chirp(t, 20.0, 1.0, 20000.0, method=scipy_method, phi=-90)
+        np.testing.assert_allclose(_render(Sweep(20.0, 20000.0, 1.0, method=method)), expected,
+                                   atol=1e-6)
+
+    def test_sweep_repeats(self):
+        x = _render(Sweep(100.0, 1000.0, 0.25), seconds=0.5)
+        np.testing.assert_array_equal(x[:12000], x[12000:])
+
+    def test_white_noise_rms(self):
+        assert np.std(_render(WhiteNoise(rms=0.2), seconds=2.0)) == pytest.approx(0.2, rel=0.01)
+
+    def test_pink_noise_rms_and_slope(self):
+        x = _render(PinkNoise(rms=0.5), seconds=20.0, blocksize=4800)
+        assert np.std(x) == pytest.approx(0.5, rel=0.02)
+        f, p = welch(x, SAMPLERATE, nperseg=8192)
+        band = lambda lo, hi: np.sum(p[(f >= lo) & (f < hi)])
+        # Equal power per octave
+        assert 10 * np.log10(band(1000, 2000) / band(100, 200)) == pytest.approx(0.0, abs=0.7)
+
+
+class TestSyntheticController:
+
+    def test_blocks_and_zero_padding(self):
+        ctrl = SyntheticController(Sine(1000.0), samplerate=SAMPLERATE, blocksize=1024, duration=0.05)
+        x = _read_all(ctrl)
+        assert x.shape == (3 * 1024, 1)
+        assert not x[2400:].any()
+        assert ctrl.position == 2400
+
+    def test_seeded_runs_are_identical(self):
+        a = _render(PinkNoise(), seconds=0.5, seed=7)
+        b = _render(PinkNoise(), seconds=0.5, seed=7)
+        c = _render(PinkNoise(), seconds=0.5, seed=8)
+        np.testing.assert_array_equal(a, b)
+        assert not np.array_equal(a, c)
+
+    def test_independent_of_blocksize(self):
+        np.testing.assert_array_equal(_render(Sweep(20.0, 2000.0, 0.3), blocksize=256),
+                                      _render(Sweep(20.0, 2000.0, 0.3), blocksize=4800))
+
+    def test_multichannel_mix(self):
+        common = WhiteNoise(rms=0.1)
+        ctrl = SyntheticController([common, [common, Sine(1000.0, 0.5)], WhiteNoise(rms=0.1)],
+                                   samplerate=SAMPLERATE, blocksize=4800, duration=1.0)
+        x = _read_all(ctrl)
+        assert ctrl.channels == 3
+        t = np.arange(len(x)) / SAMPLERATE
+        np.testing.assert_allclose(x[:, 1] - x[:, 0], 0.5 * np.sin(2 * np.pi * 1000.0 * t), atol=1e-12)
+        assert abs(np.corrcoef(x[:, 0], x[:, 2])[0, 1]) < 0.02   # separate objects: independent
+
+    def test_adding_a_signal_keeps_others(self):
+        a = WhiteNoise()
+        alone = _read_all(SyntheticController([a], blocksize=480, duration=0.1))
+        both = _read_all(SyntheticController([a, Sine(50.0)], blocksize=480, duration=0.1))
+        np.testing.assert_array_equal(alone[:, 0], both[:, 0])
+
+    def test_reset_restarts(self):
+        ctrl = SyntheticController(PinkNoise(), blocksize=480, duration=0.1)
+        first = _read_all(ctrl)
+        ctrl.reset()
+        np.testing.assert_array_equal(_read_all(ctrl), first)
+
+    def test_unbounded_until_stop(self):
+        ctrl = SyntheticController(WhiteNoise(), blocksize=64)
+        for expected in range(1000):
+            assert ctrl.read_block()[1] == expected
+        ctrl.stop()
+        with pytest.raises(StopIteration):
+            ctrl.read_block()
+
+    def test_engine_level(self):
+        from slm.assembly import build_chain, parse_metric
+        from slm.engine import Engine
+        from slm.io.reporter import Reporter
+
+        ctrl = SyntheticController(Sine(1000.0, amplitude=1.0), samplerate=SAMPLERATE,
+                                   blocksize=4800, duration=2.0)
+        reporter = Reporter()
+        engine = Engine(ctrl, dt=1.0, reporter=reporter)
+        build_chain([parse_metric("LZeq")], engine)
+        engine.run()
+        assert reporter._broadband_rows[-1]["LZeq"] == pytest.approx(
+            20 * np.log10(np.sqrt(0.5) / 2e-5), abs=0.01)
@@ -0,0 +1,153 @@
+"""Unit tests for slm/io/wav_memmap_controller.py — header parsing, conversion and random access."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from slm.io.file_controller import FileController
+from slm.io.wav_memmap_controller import WavMemmapController, read_wav_info
+
+SAMPLERATE = 48_000
+BLOCKSIZE = 256
+DATA_WAVS = sorted(Path("data/slm-test-01").glob("*_Audio_*.wav"))
+
+
+def _write(path: Path, channels: int = 2, frames: int = 1000, **kwargs) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    x = rng.uniform(-0.9, 0.9, (frames, channels))
+    sf.write(str(path), x, SAMPLERATE, **kwargs)
+    return sf.read(str(path), always_2d=True)[0]   # quantised reference
+
+
+def _read_all(controller) -> np.ndarray:
+    blocks = []
+    while True:
+        try:
+            block, _ = controller.read_block()
+        except StopIteration:
+            break
+        blocks.append(block.copy())
+    return np.concatenate(blocks)
+
+
+# ---------------------------------------------------------------------------
+# read_wav_info
+# ---------------------------------------------------------------------------
+
+class TestReadWavInfo:
+
+    def test_pcm24(self, tmp_path):
+        path = tmp_path / "a.wav"
+        _write(path, channels=3, frames=123, subtype="PCM_24")
+        info = read_wav_info(path)
+        assert (info.samplerate, info.channels, info.bits_per_sample, info.is_float) == (SAMPLERATE, 3, 24, False)
+        assert info.frames == 123
+
+    def test_rf64(self, tmp_path):
+        path = tmp_path / "a.wav"
+        _write(path, frames=500, format="RF64", subtype="FLOAT")
+        assert path.read_bytes()[:4] == b"RF64"
+        info = read_wav_info(path)
+        assert info.is_float and info.frames == 500
+
+    def test_w64(self, tmp_path):
+        path = tmp_path / "a.w64"
+        _write(path, channels=2, frames=333, format="W64", subtype="PCM_24")
+        assert path.read_bytes()[:4] == b"riff"
+        info = read_wav_info(path)
+        assert (info.channels, info.bits_per_sample, info.frames) == (2, 24, 333)
+
+    def test_truncated_data_chunk_is_clamped(self, tmp_path):
+        path = tmp_path / "a.wav"
+        _write(path, channels=1, frames=100, subtype="PCM_16")
+        with open(path, "ab") as f:
+            f.truncate(path.stat().st_size - 20)
+        assert read_wav_info(path).frames == 90
+
+    def test_compressed_format_raises(self, tmp_path):
+        path = tmp_path / "a.wav"
+        _write(path, subtype="ULAW")
+        with pytest.raises(ValueError, match="unsupported WAV encoding"):
+            read_wav_info(path)
+
+    def test_not_a_wav_raises(self, tmp_path):
+        path = tmp_path / "a.flac"
+        _write(path, format="FLAC")
+        with pytest.raises(ValueError, match="not a RIFF"):
+            read_wav_info(path)
+
+
+# ---------------------------------------------------------------------------
+# WavMemmapController
+# ---------------------------------------------------------------------------
+
+class TestWavMemmapController:
+
+    @pytest.mark.parametrize("fmt, subtype", [
+        ("WAV", "PCM_U8"), ("WAV", "PCM_16"), ("WAV", "PCM_24"), ("WAV", "PCM_32"),
+        ("WAV", "FLOAT"), ("WAV", "DOUBLE"), ("WAVEX", "PCM_24"), ("RF64", "PCM_24"),
+        ("W64", "PCM_16"), ("W64", "FLOAT"),
+    ])
+    def test_matches_soundfile(self, tmp_path, fmt, subtype):
+        path = tmp_path / "a.wav"
+        expected = _write(path, frames=1000, format=fmt, subtype=subtype)
+        ctrl = WavMemmapController(path, blocksize=BLOCKSIZE)
+        got = _read_all(ctrl)
+        assert got.shape == (4 * BLOCKSIZE, 2)
+        np.testing.assert_array_equal(got[:1000], expected)
+        np.testing.assert_array_equal(got[1000:], 0.0)   # last block zero-padded
+        assert ctrl.done
+
+    def test_block_indices(self, tmp_path):
+        path = tmp_path / "a.wav"
+        _write(path, frames=3 * BLOCKSIZE)
+        ctrl = WavMemmapController(path, blocksize=BLOCKSIZE)
+        assert [ctrl.read_block()[1] for _ in range(3)] == [0, 1, 2]
+        with pytest.raises(StopIteration):
+            ctrl.read_block()
+
+    def test_float32_processing_dtype(self, tmp_path):
+        path = tmp_path / "a.wav"
+        expected = _write(path, subtype="PCM_16")
+        ctrl = WavMemmapController(path, blocksize=BLOCKSIZE, dtype=np.float32)
+        block, _ = ctrl.read_block()
+        assert block.dtype == np.float32
+        np.testing.assert_array_equal(block, expected[:BLOCKSIZE].astype(np.float32))
+
+    def test_seek_and_read(self, tmp_path):
+        path = tmp_path / "a.wav"
+        expected = _write(path, frames=1000, subtype="PCM_24")
+        ctrl = WavMemmapController(path, blocksize=BLOCKSIZE)
+        np.testing.assert_array_equal(ctrl.read(700, 500), expected[700:])
+        ctrl.seek(900)
+        block, _ = ctrl.read_block()
+        np.testing.assert_array_equal(block[:100], expected[900:])
+        assert ctrl.position == 1000
+        ctrl.seek(0)
+        assert not ctrl.done
+        np.testing.assert_array_equal(ctrl.read_block()[0], expected[:BLOCKSIZE])
+        with pytest.raises(ValueError):
+            ctrl.seek(1001)
+
+    def test_stop_releases_mapping(self, tmp_path):
+        path = tmp_path / "a.wav"
+        _write(path)
+        ctrl = WavMemmapController(path, blocksize=BLOCKSIZE)
+        ctrl.stop()
+        assert ctrl.done
+        with pytest.raises(RuntimeError):
+            ctrl.read(0, 10)
+
+    @pytest.mark.skipif(not DATA_WAVS, reason="XL2 test recordings not available")
+    def test_xl2_recording_matches_file_controller(self):
+        # 24-bit XL2 recording with a bext chunk ahead of the data chunk
+        path = DATA_WAVS[0]
+        ctrl = WavMemmapController(path, blocksize=4096)
+        assert ctrl.samplerate == sf.info(str(path)).samplerate
+        ref = FileController(path, blocksize=4096)
+        for _ in range(20):
+            np.testing.assert_array_equal(ctrl.read_block()[0], ref.read_block()[0])
+        ref.stop()
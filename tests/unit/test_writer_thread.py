@@ -0,0 +1,74 @@
+"""Unit tests for slm/io/writer_thread.py — the shared background writer."""
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from slm.io.writer_thread import WriterThread
+
+
+class TestWriterThread:
+
+    def test_items_handled_in_order(self):
+        seen = []
+        writer = WriterThread("test", seen.append)
+        for i in range(100):
+            writer.put(i)
+        writer.close()
+        assert seen == list(range(100))
+
+    def test_flush_waits_for_queued_items(self):
+        seen, flushes = [], []
+
+        def handle(item):
+            time.sleep(0.001)
+            seen.append(item)
+
+        writer = WriterThread("test", handle, flush=lambda: flushes.append(len(seen)))
+        for i in range(10):
+            writer.put(i)
+        writer.flush()
+        assert flushes == [10]
+        writer.close()
+        assert flushes == [10, 10]
+
+    def test_periodic_flush(self):
+        flushes = []
+        writer = WriterThread("test", lambda item: None, flush=lambda: flushes.append(1),
+                              flush_interval=0.01)
+        time.sleep(0.1)
+        writer.close()
+        assert len(flushes) >= 3
+
+    def test_error_raised_on_close_and_finish_runs(self):
+        seen, finished = [], []
+
+        def handle(item):
+            if item == 1:
+                raise OSError("disk full")
+            seen.append(item)
+
+        writer = WriterThread("test", handle, finish=lambda: finished.append(True))
+        for i in range(3):
+            writer.put(i)
+        with pytest.raises(OSError, match="disk full"):
+            writer.close()
+        assert seen == [0]           # items after the error are discarded
+        assert finished == [True]
+        writer.close()               # the error is reported once
+
+    def test_after_error_keeps_handling(self):
+        seen = []
+
+        def handle(item):
+            seen.append(item)
+            if item == 0:
+                raise OSError("disk full")
+
+        writer = WriterThread("test", handle, after_error=True)
+        for i in range(3):
+            writer.put(i)
+        with pytest.raises(OSError):
+            writer.close()
+        assert seen == [0, 1, 2]